@@ -0,0 +1,94 @@
+#!/usr/bin/env python2.7
+# -*- mode: python; coding: utf-8 -*-
+"""
+Benchmark per-baseline data access on UVData objects.
+
+Builds a drift scan data set on a simulated array (all cross and auto
+correlations), using the telescope and frequency setup of a PAPER test file,
+and reports the time taken to loop over all antenna pairs and polarizations
+with antpairpol_iter and to get the data, flags and times for each antenna
+pair with get_data, get_flags and get_times. The data can optionally be
+reordered along the baseline-time axis first.
+"""
+from __future__ import print_function, division, absolute_import
+
+import argparse
+import itertools
+import os
+import time
+import numpy as np
+from pyuvdata import UVData
+from pyuvdata.data import DATA_PATH
+
+parser = argparse.ArgumentParser(description='Benchmark per-baseline data access.')
+parser.add_argument('--nants', type=int, default=64, help='number of antennas')
+parser.add_argument('--ntimes', type=int, default=60, help='number of times')
+parser.add_argument('--nfreqs', type=int, default=64, help='number of frequency channels')
+parser.add_argument('--reorder', choices=['time', 'baseline'], default=None,
+                    help='reorder the baseline-times before accessing the data')
+
+args = parser.parse_args()
+
+uv = UVData()
+uv.read_miriad(os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA'))
+uv.select(times=uv.time_array[0], freq_chans=[0])
+
+# antennas randomly placed within 300 m of the array center
+np.random.seed(0)
+enu = np.zeros((args.nants, 3))
+enu[:, :2] = np.random.uniform(-300, 300, size=(args.nants, 2))
+uv.Nants_telescope = args.nants
+uv.antenna_numbers = np.arange(args.nants)
+uv.antenna_names = ['ant{}'.format(ant) for ant in uv.antenna_numbers]
+uv.antenna_positions = enu
+uv.antenna_diameters = None
+
+antpairs = np.array(list(itertools.combinations_with_replacement(range(args.nants), 2)))
+uv.Nbls = len(antpairs)
+uv.Ntimes = args.ntimes
+uv.Nblts = uv.Nbls * uv.Ntimes
+uv.Nants_data = args.nants
+uv.ant_1_array = np.tile(antpairs[:, 0], uv.Ntimes)
+uv.ant_2_array = np.tile(antpairs[:, 1], uv.Ntimes)
+uv.baseline_array = uv.antnums_to_baseline(uv.ant_1_array, uv.ant_2_array)
+uv.time_array = np.repeat(uv.time_array[0] + np.arange(uv.Ntimes)
+                          * uv.integration_time / (24. * 3600.), uv.Nbls)
+uv.lst_array = np.repeat(np.linspace(0, np.pi, uv.Ntimes), uv.Nbls)
+uv.uvw_array = enu[uv.ant_2_array] - enu[uv.ant_1_array]
+uv.zenith_ra = uv.lst_array
+uv.zenith_dec = np.zeros(uv.Nblts)
+
+uv.Nfreqs = args.nfreqs
+uv.freq_array = uv.freq_array[0, 0] + np.arange(uv.Nfreqs).reshape(1, -1) * uv.channel_width
+
+shape = (uv.Nblts, uv.Nspws, uv.Nfreqs, uv.Npols)
+uv.data_array = np.ones(shape, dtype=np.complex64)
+uv.flag_array = np.zeros(shape, dtype=np.bool)
+uv.nsample_array = np.ones(shape, dtype=np.float)
+uv.check()
+
+if args.reorder is not None:
+    t0 = time.time()
+    uv.reorder_blts(order=args.reorder)
+    print('reorder_blts by {} (s): {:.3f}'.format(args.reorder, time.time() - t0))
+
+print('Nants: {}, Nbls: {}, Nblts: {}, Nfreqs: {}'.format(
+    args.nants, uv.Nbls, uv.Nblts, uv.Nfreqs))
+
+t0 = time.time()
+for key, data in uv.antpairpol_iter():
+    pass
+print('antpairpol_iter over all baselines (s): {:.3f}'.format(time.time() - t0))
+
+t0 = time.time()
+for key, data in uv.antpairpol_iter():
+    np.sum(data)
+print('antpairpol_iter summing the data (s): {:.3f}'.format(time.time() - t0))
+
+t0 = time.time()
+for antpair in uv.get_antpairs():
+    uv.get_data(antpair)
+    uv.get_flags(antpair)
+    uv.get_times(antpair)
+print('get_data, get_flags and get_times for all baselines (s): {:.3f}'.format(
+    time.time() - t0))
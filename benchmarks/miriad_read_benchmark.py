@@ -0,0 +1,53 @@
+#!/usr/bin/env python2.7
+# -*- mode: python; coding: utf-8 -*-
+"""
+Benchmark reading miriad files.
+
+Reports the wall time and peak memory use (resident set size) of
+UVData.read_miriad. Each read is done in a separate process so that the peak
+memory of each read is measured independently. Run it on different versions
+of pyuvdata to compare them.
+"""
+from __future__ import print_function, division, absolute_import
+
+import argparse
+import multiprocessing
+import resource
+import sys
+import time
+from pyuvdata import UVData
+
+parser = argparse.ArgumentParser(description='Benchmark reading miriad files.')
+parser.add_argument('filename', help='name of a miriad file to read in')
+parser.add_argument('--repeat', type=int, default=3,
+                    help='number of times to repeat the read')
+
+args = parser.parse_args()
+
+
+def read_miriad(filename, queue):
+    uv = UVData()
+    t0 = time.time()
+    uv.read_miriad(filename, run_check_acceptability=False)
+    read_time = time.time() - t0
+    # ru_maxrss is in kilobytes on linux and bytes on mac
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        max_rss /= 1024
+    queue.put((read_time, max_rss / 1024., uv.Nblts, uv.Nfreqs, uv.Npols))
+
+
+queue = multiprocessing.Queue()
+read_times = []
+max_rss = []
+for i in range(args.repeat):
+    proc = multiprocessing.Process(target=read_miriad, args=(args.filename, queue))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    read_times.append(result[0])
+    max_rss.append(result[1])
+
+print('Nblts: {}, Nfreqs: {}, Npols: {}'.format(*result[2:]))
+print('read time (s): min {:.3f}, max {:.3f}'.format(min(read_times), max(read_times)))
+print('peak RSS (MB): {:.1f}'.format(max(max_rss)))
@@ -0,0 +1,92 @@
+#!/usr/bin/env python2.7
+# -*- mode: python; coding: utf-8 -*-
+"""
+Benchmark writing miriad files.
+
+Builds a drift scan data set on a simulated array (350 antennas by default,
+with all cross and auto correlations), using the telescope and frequency
+setup of a PAPER test file, and reports the number of records (spectra)
+written per second by UVData.write_miriad.
+"""
+from __future__ import print_function, division, absolute_import
+
+import argparse
+import itertools
+import os
+import shutil
+import time
+import numpy as np
+from pyuvdata import UVData
+import pyuvdata.utils as uvutils
+from pyuvdata.data import DATA_PATH
+
+parser = argparse.ArgumentParser(description='Benchmark writing miriad files.')
+parser.add_argument('--nants', type=int, default=350, help='number of antennas')
+parser.add_argument('--ntimes', type=int, default=2, help='number of times')
+parser.add_argument('--nfreqs', type=int, default=64, help='number of frequency channels')
+parser.add_argument('--npols', type=int, default=2, choices=[1, 2, 3, 4],
+                    help='number of polarizations')
+parser.add_argument('--outfile', default='miriad_benchmark.uv',
+                    help='name of the miriad file to write out (removed at the end)')
+parser.add_argument('--repeat', type=int, default=3,
+                    help='number of times to repeat the write (the minimum is reported)')
+
+args = parser.parse_args()
+
+uv = UVData()
+uv.read_miriad(os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA'))
+
+# antennas randomly placed within 300 m of the array center
+np.random.seed(0)
+lat, lon, alt = uv.telescope_location_lat_lon_alt
+enu = np.zeros((args.nants, 3))
+enu[:, :2] = np.random.uniform(-300, 300, size=(args.nants, 2))
+uv.Nants_telescope = args.nants
+uv.antenna_numbers = np.arange(args.nants)
+uv.antenna_names = ['ant{}'.format(ant) for ant in uv.antenna_numbers]
+uv.antenna_positions = (uvutils.ECEF_from_ENU(enu.T, lat, lon, alt).T
+                        - uv.telescope_location)
+uv.antenna_diameters = None
+
+antpairs = np.array(list(itertools.combinations_with_replacement(range(args.nants), 2)))
+uv.Nbls = len(antpairs)
+uv.Ntimes = args.ntimes
+uv.Nblts = uv.Nbls * uv.Ntimes
+uv.Nants_data = args.nants
+uv.ant_1_array = np.tile(antpairs[:, 0], uv.Ntimes)
+uv.ant_2_array = np.tile(antpairs[:, 1], uv.Ntimes)
+uv.baseline_array = uv.antnums_to_baseline(uv.ant_1_array, uv.ant_2_array)
+uv.time_array = np.repeat(uv.time_array[0] + np.arange(uv.Ntimes)
+                          * uv.integration_time / (24. * 3600.), uv.Nbls)
+uv.set_lsts_from_time_array()
+uv.uvw_array = enu[uv.ant_2_array] - enu[uv.ant_1_array]
+uv.zenith_ra = uv.lst_array
+uv.zenith_dec = np.zeros(uv.Nblts) + lat
+
+uv.Nfreqs = args.nfreqs
+uv.freq_array = (uv.freq_array[0, 0] + np.arange(uv.Nfreqs) * uv.channel_width).reshape(1, -1)
+uv.Npols = args.npols
+uv.polarization_array = np.array([-5, -6, -7, -8][:uv.Npols])
+
+shape = (uv.Nblts, uv.Nspws, uv.Nfreqs, uv.Npols)
+uv.data_array = (np.random.normal(size=shape)
+                 + 1j * np.random.normal(size=shape)).astype(np.complex64)
+uv.flag_array = np.zeros(shape, dtype=np.bool)
+uv.nsample_array = np.ones(shape, dtype=np.float)
+uv.check()
+
+n_records = uv.Nblts * uv.Npols
+write_times = []
+for i in range(args.repeat):
+    if os.path.exists(args.outfile):
+        shutil.rmtree(args.outfile)
+    t0 = time.time()
+    uv.write_miriad(args.outfile, run_check=False)
+    write_times.append(time.time() - t0)
+shutil.rmtree(args.outfile)
+
+print('Nants: {}, Nbls: {}, Ntimes: {}, Nfreqs: {}, Npols: {}'.format(
+    args.nants, uv.Nbls, uv.Ntimes, uv.Nfreqs, uv.Npols))
+print('records written: {}'.format(n_records))
+print('write time (s): {:.3f}'.format(min(write_times)))
+print('records per second: {:.0f}'.format(n_records / min(write_times)))
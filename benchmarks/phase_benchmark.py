@@ -0,0 +1,82 @@
+#!/usr/bin/env python2.7
+# -*- mode: python; coding: utf-8 -*-
+"""
+Benchmark phasing and unphasing UVData objects.
+
+Builds a drift scan data set on a simulated array (all cross and auto
+correlations), using the telescope and frequency setup of a PAPER test file,
+and reports the time taken to phase it to zenith at its first time and to
+unphase it back to drift, along with the peak memory use of the process.
+"""
+from __future__ import print_function, division, absolute_import
+
+import argparse
+import itertools
+import os
+import resource
+import time
+import numpy as np
+from pyuvdata import UVData
+from pyuvdata.data import DATA_PATH
+
+parser = argparse.ArgumentParser(description='Benchmark phasing UVData objects.')
+parser.add_argument('--nants', type=int, default=128, help='number of antennas')
+parser.add_argument('--ntimes', type=int, default=120, help='number of times')
+parser.add_argument('--nfreqs', type=int, default=64, help='number of frequency channels')
+parser.add_argument('--blt_chunk_size', type=int, default=8192,
+                    help='number of baseline-times to process at a time while phasing')
+
+args = parser.parse_args()
+
+uv = UVData()
+uv.read_miriad(os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA'))
+uv.select(times=uv.time_array[0], freq_chans=[0])
+
+# antennas randomly placed within 300 m of the array center
+np.random.seed(0)
+enu = np.zeros((args.nants, 3))
+enu[:, :2] = np.random.uniform(-300, 300, size=(args.nants, 2))
+uv.Nants_telescope = args.nants
+uv.antenna_numbers = np.arange(args.nants)
+uv.antenna_names = ['ant{}'.format(ant) for ant in uv.antenna_numbers]
+uv.antenna_positions = enu
+uv.antenna_diameters = None
+
+antpairs = np.array(list(itertools.combinations_with_replacement(range(args.nants), 2)))
+uv.Nbls = len(antpairs)
+uv.Ntimes = args.ntimes
+uv.Nblts = uv.Nbls * uv.Ntimes
+uv.Nants_data = args.nants
+uv.ant_1_array = np.tile(antpairs[:, 0], uv.Ntimes)
+uv.ant_2_array = np.tile(antpairs[:, 1], uv.Ntimes)
+uv.baseline_array = uv.antnums_to_baseline(uv.ant_1_array, uv.ant_2_array)
+uv.time_array = np.repeat(uv.time_array[0] + np.arange(uv.Ntimes)
+                          * uv.integration_time / (24. * 3600.), uv.Nbls)
+uv.set_lsts_from_time_array()
+uv.uvw_array = enu[uv.ant_2_array] - enu[uv.ant_1_array]
+uv.zenith_ra = uv.lst_array
+uv.zenith_dec = np.zeros(uv.Nblts) + uv.telescope_location_lat_lon_alt[0]
+
+uv.Nfreqs = args.nfreqs
+uv.freq_array = uv.freq_array[0, 0] + np.arange(uv.Nfreqs).reshape(1, -1) * uv.channel_width
+
+shape = (uv.Nblts, uv.Nspws, uv.Nfreqs, uv.Npols)
+uv.data_array = np.ones(shape, dtype=np.complex64)
+uv.flag_array = np.zeros(shape, dtype=np.bool)
+uv.nsample_array = np.ones(shape, dtype=np.float32)
+uv.check()
+
+print('Nants: {}, Nbls: {}, Nblts: {}, Nfreqs: {}, data size: {:.0f} MB'.format(
+    args.nants, uv.Nbls, uv.Nblts, uv.Nfreqs, uv.data_array.nbytes / 1024.**2))
+rss_start = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.
+
+t0 = time.time()
+uv.phase_to_time(uv.time_array[0], blt_chunk_size=args.blt_chunk_size)
+print('phase (s): {:.3f}'.format(time.time() - t0))
+
+t0 = time.time()
+uv.unphase_to_drift(blt_chunk_size=args.blt_chunk_size)
+print('unphase (s): {:.3f}'.format(time.time() - t0))
+
+rss_end = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.
+print('peak memory increase while phasing (MB): {:.0f}'.format(rss_end - rss_start))
@@ -0,0 +1,118 @@
+#!/usr/bin/env python2.7
+# -*- mode: python; coding: utf-8 -*-
+"""
+Benchmark reading a list of files with UVData.read using several workers.
+
+Builds a drift scan data set on a simulated array (all cross and auto
+correlations), using the telescope and frequency setup of a PAPER test file,
+splits it into a number of files along the time axis and reports the time
+taken and the peak memory used in this process to read them back with a given
+number of workers. The peak memory is only reported on Linux, where it can be
+reset after the files are written.
+"""
+from __future__ import print_function, division, absolute_import
+
+import argparse
+import itertools
+import os
+import shutil
+import tempfile
+import time
+import numpy as np
+from pyuvdata import UVData
+from pyuvdata.data import DATA_PATH
+
+parser = argparse.ArgumentParser(description='Benchmark reading files with several workers.')
+parser.add_argument('--nants', type=int, default=64, help='number of antennas')
+parser.add_argument('--ntimes', type=int, default=120, help='number of times')
+parser.add_argument('--nfreqs', type=int, default=64, help='number of frequency channels')
+parser.add_argument('--nfiles', type=int, default=8,
+                    help='number of files to split the times into')
+parser.add_argument('--n_workers', type=int, default=4, help='number of workers')
+parser.add_argument('--file_type', choices=['uvh5', 'uvfits'], default='uvh5',
+                    help='type of file to write and read')
+
+args = parser.parse_args()
+
+
+def memory_mb(key):
+    # memory (in MB) from /proc/self/status, None if it is not available
+    if not os.path.exists('/proc/self/status'):
+        return None
+    for line in open('/proc/self/status'):
+        if line.startswith(key):
+            return int(line.split()[1]) / 1024.
+
+
+uv = UVData()
+uv.read_miriad(os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA'))
+uv.select(times=uv.time_array[0], freq_chans=[0])
+
+# antennas randomly placed within 300 m of the array center
+np.random.seed(0)
+enu = np.zeros((args.nants, 3))
+enu[:, :2] = np.random.uniform(-300, 300, size=(args.nants, 2))
+uv.Nants_telescope = args.nants
+uv.antenna_numbers = np.arange(args.nants)
+uv.antenna_names = ['ant{}'.format(ant) for ant in uv.antenna_numbers]
+uv.antenna_positions = enu
+uv.antenna_diameters = None
+
+antpairs = np.array(list(itertools.combinations_with_replacement(range(args.nants), 2)))
+uv.Nbls = len(antpairs)
+uv.Ntimes = args.ntimes
+uv.Nblts = uv.Nbls * uv.Ntimes
+uv.Nants_data = args.nants
+uv.ant_1_array = np.tile(antpairs[:, 0], uv.Ntimes)
+uv.ant_2_array = np.tile(antpairs[:, 1], uv.Ntimes)
+uv.baseline_array = uv.antnums_to_baseline(uv.ant_1_array, uv.ant_2_array)
+uv.time_array = np.repeat(uv.time_array[0] + np.arange(uv.Ntimes)
+                          * uv.integration_time / (24. * 3600.), uv.Nbls)
+uv.lst_array = np.repeat(np.linspace(0, np.pi, uv.Ntimes), uv.Nbls)
+uv.uvw_array = enu[uv.ant_2_array] - enu[uv.ant_1_array]
+uv.zenith_ra = uv.lst_array
+uv.zenith_dec = np.zeros(uv.Nblts)
+
+uv.Nfreqs = args.nfreqs
+uv.freq_array = uv.freq_array[0, 0] + np.arange(uv.Nfreqs).reshape(1, -1) * uv.channel_width
+
+shape = (uv.Nblts, uv.Nspws, uv.Nfreqs, uv.Npols)
+uv.data_array = (np.random.normal(size=shape)
+                 + 1j * np.random.normal(size=shape)).astype(np.complex64)
+uv.flag_array = np.zeros(shape, dtype=np.bool)
+uv.nsample_array = np.ones(shape, dtype=np.float32)
+uv.check()
+
+print('Nants: {}, Nbls: {}, Nblts: {}, Nfreqs: {}, data size: {:.1f} MB'.format(
+    args.nants, uv.Nbls, uv.Nblts, uv.Nfreqs,
+    (uv.data_array.nbytes + uv.flag_array.nbytes + uv.nsample_array.nbytes) / 1024.**2))
+
+tmp_dir = tempfile.mkdtemp(prefix='read_parallel_benchmark_')
+try:
+    filenames = []
+    for i, times in enumerate(np.array_split(np.unique(uv.time_array), args.nfiles)):
+        uv_part = uv.select(times=times, inplace=False)
+        filenames.append(os.path.join(tmp_dir, 'part{}.{}'.format(i, args.file_type)))
+        if args.file_type == 'uvh5':
+            uv_part.write_uvh5(filenames[-1])
+        else:
+            uv_part.write_uvfits(filenames[-1], spoof_nonessential=True)
+    del(uv)
+    del(uv_part)
+
+    start_rss = memory_mb('VmRSS')
+    if start_rss is not None:
+        # reset the peak memory of this process to the current memory
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+
+    uv = UVData()
+    t0 = time.time()
+    uv.read(filenames, n_workers=args.n_workers)
+    print('read {} {} files with {} workers (s): {:.3f}'.format(
+        args.nfiles, args.file_type, args.n_workers, time.time() - t0))
+    if start_rss is not None:
+        print('peak memory increase in this process (MB): {:.1f}'.format(
+            memory_mb('VmHWM') - start_rss))
+finally:
+    shutil.rmtree(tmp_dir)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python2.7
+# -*- mode: python; coding: utf-8 -*-
+"""
+Benchmark UVData.select.
+
+Builds drift scan data sets of several sizes on simulated arrays (all cross
+and auto correlations), using the telescope and frequency setup of a PAPER
+test file, and reports the time taken to select on antennas, antenna pairs,
+times and frequencies.
+"""
+from __future__ import print_function, division, absolute_import
+
+import argparse
+import itertools
+import os
+import time
+import numpy as np
+from pyuvdata import UVData
+from pyuvdata.data import DATA_PATH
+
+parser = argparse.ArgumentParser(description='Benchmark UVData.select.')
+parser.add_argument('--nants', type=int, nargs='+', default=[16, 64, 128],
+                    help='numbers of antennas of the data sets')
+parser.add_argument('--ntimes', type=int, default=50, help='number of times')
+parser.add_argument('--nfreqs', type=int, default=64, help='number of frequency channels')
+parser.add_argument('--repeat', type=int, default=3,
+                    help='number of times to repeat each select (the minimum is reported)')
+
+args = parser.parse_args()
+
+template = UVData()
+template.read_miriad(os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA'))
+
+
+def make_uvdata(nants):
+    uv = template.select(times=template.time_array[0], freq_chans=[0], inplace=False)
+
+    # antennas randomly placed within 300 m of the array center
+    np.random.seed(0)
+    enu = np.zeros((nants, 3))
+    enu[:, :2] = np.random.uniform(-300, 300, size=(nants, 2))
+    uv.Nants_telescope = nants
+    uv.antenna_numbers = np.arange(nants)
+    uv.antenna_names = ['ant{}'.format(ant) for ant in uv.antenna_numbers]
+    uv.antenna_positions = enu
+    uv.antenna_diameters = None
+
+    antpairs = np.array(list(itertools.combinations_with_replacement(range(nants), 2)))
+    uv.Nbls = len(antpairs)
+    uv.Ntimes = args.ntimes
+    uv.Nblts = uv.Nbls * uv.Ntimes
+    uv.Nants_data = nants
+    uv.ant_1_array = np.tile(antpairs[:, 0], uv.Ntimes)
+    uv.ant_2_array = np.tile(antpairs[:, 1], uv.Ntimes)
+    uv.baseline_array = uv.antnums_to_baseline(uv.ant_1_array, uv.ant_2_array)
+    uv.time_array = np.repeat(uv.time_array[0] + np.arange(uv.Ntimes)
+                              * uv.integration_time / (24. * 3600.), uv.Nbls)
+    uv.lst_array = np.repeat(np.linspace(0, np.pi, uv.Ntimes), uv.Nbls)
+    uv.uvw_array = enu[uv.ant_2_array] - enu[uv.ant_1_array]
+    uv.zenith_ra = uv.lst_array
+    uv.zenith_dec = np.zeros(uv.Nblts)
+
+    uv.Nfreqs = args.nfreqs
+    uv.freq_array = uv.freq_array[0, 0] + np.arange(uv.Nfreqs).reshape(1, -1) * uv.channel_width
+
+    shape = (uv.Nblts, uv.Nspws, uv.Nfreqs, uv.Npols)
+    uv.data_array = np.ones(shape, dtype=np.complex64)
+    uv.flag_array = np.zeros(shape, dtype=np.bool)
+    uv.nsample_array = np.ones(shape, dtype=np.float)
+    uv.check()
+    return uv
+
+
+def min_time(uv, **select_kwargs):
+    times = []
+    for i in range(args.repeat):
+        t0 = time.time()
+        uv.select(inplace=False, run_check=False, **select_kwargs)
+        times.append(time.time() - t0)
+    return min(times)
+
+
+print('{:>8s}{:>10s}{:>14s}{:>14s}{:>14s}{:>14s}'.format(
+    'Nants', 'Nblts', 'antennas s', 'antpairs s', 'times s', 'freqs s'))
+for nants in args.nants:
+    uv = make_uvdata(nants)
+    antpairs = uv.get_antpairs()
+    antpairs = [antpairs[i] for i in np.linspace(0, len(antpairs) - 1,
+                                                 min(500, len(antpairs))).astype(int)]
+    times = np.unique(uv.time_array)
+    print('{:>8d}{:>10d}{:>14.3f}{:>14.3f}{:>14.3f}{:>14.3f}'.format(
+        nants, uv.Nblts,
+        min_time(uv, antenna_nums=uv.antenna_numbers[:nants // 2]),
+        min_time(uv, ant_pairs_nums=antpairs),
+        min_time(uv, times=times[:len(times) // 2]),
+        min_time(uv, frequencies=uv.freq_array[0, :uv.Nfreqs // 2])))
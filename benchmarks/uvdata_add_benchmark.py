@@ -0,0 +1,107 @@
+#!/usr/bin/env python2.7
+# -*- mode: python; coding: utf-8 -*-
+"""
+Benchmark combining UVData objects along the baseline-time axis.
+
+Builds two halves of a night of drift scan data on a simulated array (all
+cross and auto correlations), using the telescope and frequency setup of a
+PAPER test file, and reports the time taken to add them together. It also
+splits the night into a number of parts (like files) and reports the time
+taken to combine them by adding them one at a time and with fast_concat.
+"""
+from __future__ import print_function, division, absolute_import
+
+import argparse
+import copy
+import itertools
+import os
+import time
+import warnings
+import numpy as np
+from pyuvdata import UVData
+from pyuvdata.data import DATA_PATH
+
+parser = argparse.ArgumentParser(description='Benchmark adding two half-night '
+                                 'UVData objects.')
+parser.add_argument('--nants', type=int, default=128, help='number of antennas')
+parser.add_argument('--ntimes', type=int, default=120,
+                    help='number of times in each half of the night')
+parser.add_argument('--nfreqs', type=int, default=4, help='number of frequency channels')
+parser.add_argument('--nparts', type=int, default=24,
+                    help='number of parts to split the night into for combining')
+parser.add_argument('--repeat', type=int, default=3,
+                    help='number of times to repeat the add (the minimum is reported)')
+
+args = parser.parse_args()
+
+uv = UVData()
+uv.read_miriad(os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA'))
+
+# antennas randomly placed within 300 m of the array center
+np.random.seed(0)
+enu = np.zeros((args.nants, 3))
+enu[:, :2] = np.random.uniform(-300, 300, size=(args.nants, 2))
+uv.Nants_telescope = args.nants
+uv.antenna_numbers = np.arange(args.nants)
+uv.antenna_names = ['ant{}'.format(ant) for ant in uv.antenna_numbers]
+uv.antenna_positions = enu
+uv.antenna_diameters = None
+
+antpairs = np.array(list(itertools.combinations_with_replacement(range(args.nants), 2)))
+uv.Nbls = len(antpairs)
+uv.Ntimes = 2 * args.ntimes
+uv.Nblts = uv.Nbls * uv.Ntimes
+uv.Nants_data = args.nants
+uv.ant_1_array = np.tile(antpairs[:, 0], uv.Ntimes)
+uv.ant_2_array = np.tile(antpairs[:, 1], uv.Ntimes)
+uv.baseline_array = uv.antnums_to_baseline(uv.ant_1_array, uv.ant_2_array)
+uv.time_array = np.repeat(uv.time_array[0] + np.arange(uv.Ntimes)
+                          * uv.integration_time / (24. * 3600.), uv.Nbls)
+uv.lst_array = np.repeat(np.linspace(0, np.pi, uv.Ntimes), uv.Nbls)
+uv.uvw_array = enu[uv.ant_2_array] - enu[uv.ant_1_array]
+uv.zenith_ra = uv.lst_array
+uv.zenith_dec = np.zeros(uv.Nblts)
+
+uv.Nfreqs = args.nfreqs
+uv.freq_array = (uv.freq_array[0, 0] + np.arange(uv.Nfreqs) * uv.channel_width).reshape(1, -1)
+
+shape = (uv.Nblts, uv.Nspws, uv.Nfreqs, uv.Npols)
+uv.data_array = np.ones(shape, dtype=np.complex64)
+uv.flag_array = np.zeros(shape, dtype=np.bool)
+uv.nsample_array = np.ones(shape, dtype=np.float)
+uv.check()
+
+times = np.unique(uv.time_array)
+uv1 = uv.select(times=times[:args.ntimes], inplace=False)
+uv2 = uv.select(times=times[args.ntimes:], inplace=False)
+parts = [uv.select(times=part_times, inplace=False)
+         for part_times in np.array_split(times, args.nparts)]
+del(uv)
+
+
+def min_time(func, *func_args, **func_kwargs):
+    times = []
+    for i in range(args.repeat):
+        t0 = time.time()
+        with warnings.catch_warnings():
+            # ignore warnings about frequency spacing from floating point errors
+            warnings.simplefilter('ignore')
+            func(*func_args, **func_kwargs)
+        times.append(time.time() - t0)
+    return min(times)
+
+
+def add_parts(parts):
+    uv_sum = copy.deepcopy(parts[0])
+    for part in parts[1:]:
+        uv_sum += part
+    return uv_sum
+
+
+print('Nants: {}, Nbls: {}, Nblts per half: {}, Nfreqs: {}'.format(
+    args.nants, uv1.Nbls, uv1.Nblts, uv1.Nfreqs))
+print('add two halves (s): {:.3f}'.format(min_time(uv1.__add__, uv2)))
+print('fast_concat two halves (s): {:.3f}'.format(min_time(uv1.fast_concat, uv2, 'blt')))
+print('add {} parts one at a time (s): {:.3f}'.format(args.nparts, min_time(add_parts, parts)))
+print('fast_concat {} parts (s): {:.3f}'.format(
+    args.nparts, min_time(parts[0].fast_concat, parts[1:], 'blt')))
@@ -0,0 +1,117 @@
+#!/usr/bin/env python2.7
+# -*- mode: python; coding: utf-8 -*-
+"""
+Benchmark reading uvfits files.
+
+Writes a uvfits file of a drift scan data set on a simulated array (all
+cross and auto correlations), using the telescope and frequency setup of a
+PAPER test file, and reports the time taken and the peak memory increase of
+the process to read just the metadata, to read all of it and to read
+selected times and frequencies.
+Each read is done in a separate process so the memory use can be compared
+to the size of the arrays that are read in. Note that the pages of the
+memory-mapped file that are read count towards the peak memory of the process.
+"""
+from __future__ import print_function, division, absolute_import
+
+import argparse
+import itertools
+import multiprocessing
+import os
+import resource
+import shutil
+import tempfile
+import time
+import warnings
+import numpy as np
+from pyuvdata import UVData
+from pyuvdata.data import DATA_PATH
+
+parser = argparse.ArgumentParser(description='Benchmark reading uvfits files.')
+parser.add_argument('--nants', type=int, default=64, help='number of antennas')
+parser.add_argument('--ntimes', type=int, default=60, help='number of times')
+parser.add_argument('--nfreqs', type=int, default=256, help='number of frequency channels')
+
+args = parser.parse_args()
+
+uv = UVData()
+uv.read_miriad(os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA'))
+uv.select(times=uv.time_array[0], freq_chans=[0])
+
+# antennas randomly placed within 300 m of the array center
+np.random.seed(0)
+enu = np.zeros((args.nants, 3))
+enu[:, :2] = np.random.uniform(-300, 300, size=(args.nants, 2))
+uv.Nants_telescope = args.nants
+uv.antenna_numbers = np.arange(args.nants)
+uv.antenna_names = ['ant{}'.format(ant) for ant in uv.antenna_numbers]
+uv.antenna_positions = enu
+uv.antenna_diameters = None
+
+antpairs = np.array(list(itertools.combinations_with_replacement(range(args.nants), 2)))
+uv.Nbls = len(antpairs)
+uv.Ntimes = args.ntimes
+uv.Nblts = uv.Nbls * uv.Ntimes
+uv.Nants_data = args.nants
+uv.ant_1_array = np.tile(antpairs[:, 0], uv.Ntimes)
+uv.ant_2_array = np.tile(antpairs[:, 1], uv.Ntimes)
+uv.baseline_array = uv.antnums_to_baseline(uv.ant_1_array, uv.ant_2_array)
+uv.time_array = np.repeat(uv.time_array[0] + np.arange(uv.Ntimes)
+                          * uv.integration_time / (24. * 3600.), uv.Nbls)
+uv.set_lsts_from_time_array()
+uv.uvw_array = enu[uv.ant_2_array] - enu[uv.ant_1_array]
+uv.zenith_ra = uv.lst_array
+uv.zenith_dec = np.zeros(uv.Nblts) + uv.telescope_location_lat_lon_alt[0]
+
+uv.Nfreqs = args.nfreqs
+uv.freq_array = uv.freq_array[0, 0] + np.arange(uv.Nfreqs).reshape(1, -1) * uv.channel_width
+
+shape = (uv.Nblts, uv.Nspws, uv.Nfreqs, uv.Npols)
+uv.data_array = np.ones(shape, dtype=np.complex64)
+uv.flag_array = np.zeros(shape, dtype=np.bool)
+uv.nsample_array = np.ones(shape, dtype=np.float32)
+uv.check()
+
+tmp_dir = tempfile.mkdtemp()
+filename = os.path.join(tmp_dir, 'benchmark.uvfits')
+with warnings.catch_warnings():
+    # ignore the warning about phasing the drift scan data
+    warnings.simplefilter('ignore')
+    uv.write_uvfits(filename, force_phase=True, spoof_nonessential=True)
+print('Nants: {}, Nbls: {}, Nblts: {}, Nfreqs: {}, file size: {:.0f} MB'.format(
+    args.nants, uv.Nbls, uv.Nblts, uv.Nfreqs, os.path.getsize(filename) / 1024.**2))
+del(uv)
+
+# get the times as they are written in the file
+uv = UVData()
+uv.read_uvfits(filename, read_data=False)
+times = np.unique(uv.time_array)
+del(uv)
+
+
+def read(**read_kwargs):
+    rss_start = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.
+    t0 = time.time()
+    uv = UVData()
+    uv.read_uvfits(filename, **read_kwargs)
+    read_time = time.time() - t0
+    rss_end = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.
+    if uv.data_array is not None:
+        array_size = (uv.data_array.nbytes + uv.flag_array.nbytes
+                      + uv.nsample_array.nbytes) / 1024.**2
+    else:
+        array_size = 0
+    print('{:>24s}{:>10.3f}{:>16.0f}{:>18.0f}'.format(
+        ', '.join(read_kwargs.keys()) or 'all', read_time, array_size, rss_end - rss_start))
+
+
+print('{:>24s}{:>10s}{:>16s}{:>18s}'.format('select', 'time s', 'arrays MB', 'peak increase MB'))
+for read_kwargs in [{'read_data': False}, {},
+                    {'freq_chans': np.arange(args.nfreqs // 2)},
+                    {'times': times[::4]},
+                    {'times': times[::4], 'freq_chans': np.arange(args.nfreqs // 2)}]:
+    proc = multiprocessing.Process(target=read, kwargs=read_kwargs)
+    proc.start()
+    proc.join()
+
+shutil.rmtree(tmp_dir)
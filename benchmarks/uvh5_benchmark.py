@@ -0,0 +1,84 @@
+#!/usr/bin/env python2.7
+# -*- mode: python; coding: utf-8 -*-
+"""
+Benchmark uvh5 chunk layouts and compression filters.
+
+Reads in a miriad, uvfits or uvh5 file, writes it out as uvh5 with each
+chunk layout and compression filter and reports the write throughput, the read
+throughput for a full read, a single baseline read and a single channel read
+and the size of the file on disk.
+"""
+from __future__ import print_function, division, absolute_import
+
+import argparse
+import os
+import time
+import numpy as np
+from pyuvdata import UVData
+
+parser = argparse.ArgumentParser(description='Benchmark uvh5 chunk layouts and '
+                                 'compression filters.')
+parser.add_argument('filename', help='name of a file to read in')
+parser.add_argument('--filetype', default='miriad', choices=['miriad', 'uvfits', 'uvh5'],
+                    help='type of the file to read in')
+parser.add_argument('--outfile', default='uvh5_benchmark.uvh5',
+                    help='name of the uvh5 file to write out (removed at the end)')
+parser.add_argument('--freq_block', type=int, default=16,
+                    help='number of channels per chunk for the frequency block layout')
+parser.add_argument('--repeat', type=int, default=3,
+                    help='number of times to repeat each timing (the minimum is reported)')
+
+args = parser.parse_args()
+
+uv = UVData()
+getattr(uv, 'read_' + args.filetype)(args.filename)
+
+# chunk shapes along (Nblts, Nspws, Nfreqs, Npols)
+layouts = [('h5py default', True),
+           ('per baseline-time', (1, 1, None, 1)),
+           ('per time block', (uv.Nbls, 1, args.freq_block, 1)),
+           ('per channel', (None, 1, 1, 1))]
+compressions = [('none', None), ('lzf', 'lzf'), ('gzip 4', ('gzip', 4))]
+
+data_mb = (uv.data_array.astype(np.complex64).nbytes + uv.flag_array.nbytes
+           + uv.nsample_array.astype(np.float32).nbytes) / 1e6
+antpair = uv.get_antpairs()[0]
+chan = uv.Nfreqs // 2
+
+
+def min_time(func, *func_args, **func_kwargs):
+    times = []
+    for i in range(args.repeat):
+        t0 = time.time()
+        func(*func_args, **func_kwargs)
+        times.append(time.time() - t0)
+    return min(times)
+
+
+def write(**kwargs):
+    if os.path.exists(args.outfile):
+        os.remove(args.outfile)
+    uv.write_uvh5(args.outfile, **kwargs)
+
+
+print('Data size in memory: {:.1f} MB'.format(data_mb))
+print('{:<20s}{:<10s}{:>12s}{:>12s}{:>12s}{:>12s}{:>12s}'.format(
+    'layout', 'filter', 'write MB/s', 'read MB/s', 'bl read s', 'chan read s', 'size MB'))
+for layout_name, chunks in layouts:
+    for comp_name, compression in compressions:
+        write_time = min_time(write, chunks=chunks, data_compression=compression,
+                              flags_compression=compression,
+                              nsample_compression=compression)
+        size_mb = os.path.getsize(args.outfile) / 1e6
+
+        uv_in = UVData()
+        read_time = min_time(uv_in.read_uvh5, args.outfile)
+        bl_time = min_time(uv_in.read_uvh5, args.outfile, ant_pairs_nums=[antpair])
+        chan_time = min_time(uv_in.read_uvh5, args.outfile, freq_chans=[chan])
+        del(uv_in)
+
+        print('{:<20s}{:<10s}{:>12.1f}{:>12.1f}{:>12.3f}{:>12.3f}{:>12.1f}'.format(
+            layout_name, comp_name, data_mb / write_time, data_mb / read_time,
+            bl_time, chan_time, size_mb))
+
+os.remove(args.outfile)
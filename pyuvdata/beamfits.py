@@ -317,7 +317,8 @@ class BeamFITS(UVBeam):
 
         if run_check:
             self.check(check_extra=check_extra,
-                       run_check_acceptability=run_check_acceptability)
+                       run_check_acceptability=run_check_acceptability,
+                       only_modified=True)
 
     def write_beamfits(self, filename, run_check=True, check_extra=True,
                        run_check_acceptability=True, clobber=False):
@@ -599,4 +599,5 @@ class CALFITS(UVCal):
 
         if run_check:
             self.check(check_extra=check_extra,
-                       run_check_acceptability=run_check_acceptability)
+                       run_check_acceptability=run_check_acceptability,
+                       only_modified=True)
@@ -252,4 +252,5 @@ class CSTBeam(UVBeam):
 
         if run_check:
             self.check(check_extra=check_extra,
-                       run_check_acceptability=run_check_acceptability)
+                       run_check_acceptability=run_check_acceptability,
+                       only_modified=True)
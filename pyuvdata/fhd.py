@@ -54,7 +54,7 @@ class FHD(UVData):
     """
 
     def read_fhd(self, filelist, use_model=False, run_check=True, check_extra=True,
-                 run_check_acceptability=True):
+                 run_check_acceptability=True, data_array_dtype=None):
         """
         Read in data from a list of FHD files.
 
@@ -69,7 +69,14 @@ class FHD(UVData):
                 ones. Default is True.
             run_check_acceptability: Option to check acceptable range of the values of
                 parameters after reading in the file. Default is True.
+            data_array_dtype: Datatype for the data_array, either np.complex64
+                or np.complex128. The nsample_array gets the matching real
+                precision (np.float32 or np.float64). Default is None, which
+                gives np.complex128 and np.float64 arrays.
         """
+        data_dtype, nsample_dtype = uvutils.get_data_precision_dtypes(data_array_dtype)
+        if data_dtype is None:
+            data_dtype, nsample_dtype = np.complex_, np.float_
         datafiles = {}
         params_file = None
         flags_file = None
@@ -159,9 +166,9 @@ class FHD(UVData):
         self.polarization_array = np.asarray(pol_list)
 
         self.data_array = np.zeros((self.Nblts, self.Nspws, self.Nfreqs,
-                                    self.Npols), dtype=np.complex_)
+                                    self.Npols), dtype=data_dtype)
         self.nsample_array = np.zeros((self.Nblts, self.Nspws, self.Nfreqs,
-                                       self.Npols), dtype=np.float_)
+                                       self.Npols), dtype=nsample_dtype)
         self.flag_array = np.zeros((self.Nblts, self.Nspws, self.Nfreqs,
                                     self.Npols), dtype=np.bool_)
         for pol, vis in vis_data.iteritems():
@@ -291,4 +298,5 @@ class FHD(UVData):
         # check if object has all required uv_properties set
         if run_check:
             self.check(check_extra=check_extra,
-                       run_check_acceptability=run_check_acceptability)
+                       run_check_acceptability=run_check_acceptability,
+                       only_modified=True)
@@ -192,4 +192,5 @@ class FHDCal(UVCal):
 
         if run_check:
             self.check(check_extra=check_extra,
-                       run_check_acceptability=run_check_acceptability)
+                       run_check_acceptability=run_check_acceptability,
+                       only_modified=True)
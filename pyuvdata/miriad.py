@@ -32,9 +32,11 @@ class Miriad(UVData):
     def read_miriad(self, filepath, correct_lat_lon=True, run_check=True,
                     check_extra=True, run_check_acceptability=True, phase_type=None,
                     antenna_nums=None, ant_str=None, ant_pairs_nums=None,
-                    polarizations=None, time_range=None):
+                    polarizations=None, time_range=None, frequencies=None,
+                    freq_chans=None, times=None, blt_inds=None, data_array_dtype=None):
         """
-        Read in data from a miriad file.
+        Read in data from a miriad file. Supports reading only selected portions
+        of the data, only the selected channels are copied out of each record.
 
         Args:
             filepath: The miriad file directory to read from.
@@ -58,9 +60,28 @@ class Miriad(UVData):
                 Ex: ['xx', 'yy', ...]
             time_range: len-2 list containing min and max range of times (Julian Date) to read-in.
                 Ex: [2458115.20, 2458115.40]
+            frequencies: The frequencies to include when reading data into the
+                object.
+            freq_chans: The frequency channel numbers to include when reading
+                data into the object.
+            times: The times to include when reading data into the object.
+                Times within the time tolerance of a record time match it.
+            blt_inds: The baseline-time indices to include when reading data
+                into the object. The indices refer to the baseline-time axis
+                of the data that would be read in with the other selections
+                applied, so this is equivalent to reading with the other
+                selections and then calling select with these blt_inds.
+            data_array_dtype: Datatype for the data_array, either np.complex64
+                or np.complex128. The nsample_array gets the matching real
+                precision (np.float32 or np.float64). Default is None, which
+                gives a np.complex64 data_array (the precision of the file)
+                and a np.float64 nsample_array.
         """
         if not os.path.exists(filepath):
             raise(IOError, filepath + ' not found')
+        data_dtype, nsample_dtype = uvutils.get_data_precision_dtypes(data_array_dtype)
+        if data_dtype is None:
+            data_dtype, nsample_dtype = np.complex64, np.float
         uv = aipy.miriad.UV(filepath)
 
         # list of miriad variables always read
@@ -281,11 +302,70 @@ class Miriad(UVData):
                 history_update_string += 'polarizations'
             n_selects += 1
 
+        # select on times
+        if times is not None:
+            times = np.array(uvutils.get_iterable(times), dtype=np.float)
+            time_tol = self._time_array.tols[1]
+            # narrow down the records to read to the range of the times
+            uv.select('time', np.min(times) - time_tol, np.max(times) + time_tol,
+                      include=True)
+            if n_selects > 0:
+                history_update_string += ', times'
+            else:
+                history_update_string += 'times'
+            n_selects += 1
+
+        # select on frequencies, using the full frequency array from the header
+        # freq_array has shape (Nspws, Nfreqs).
+        # Currently does not actually support Nspws>1!
+        self.Nspws = 1
+        self.freq_array = (np.arange(self.Nfreqs) * self.channel_width
+                           + uv['sfreq'] * 1e9).reshape(1, self.Nfreqs)
+        freq_inds = self._select_preprocess(None, None, None, None, frequencies,
+                                            freq_chans, None, None, None)[1]
+        if freq_inds is not None:
+            self.freq_array = self.freq_array[:, freq_inds]
+            self.Nfreqs = len(freq_inds)
+            if n_selects > 0:
+                history_update_string += ', frequencies'
+            else:
+                history_update_string += 'frequencies'
+            n_selects += 1
+
+        if blt_inds is not None:
+            if n_selects > 0:
+                history_update_string += ', baseline-times'
+            else:
+                history_update_string += 'baseline-times'
+            n_selects += 1
+
         history_update_string += ' using pyuvdata.'
         if n_selects > 0:
             self.history += history_update_string
 
-        data_accumulator = {}
+        # Preallocate arrays to hold the record metadata. The number of records
+        # is Nblts * Npols if the nblts variable is present and there is no
+        # select on read, otherwise the arrays are grown as needed. The data,
+        # flags and nsamples are held in fixed size blocks of records so that
+        # they never have to be copied to grow them.
+        if ('nblts' in uv.vartable.keys() and antenna_nums is None and ant_pairs_nums is None
+                and ant_str is None and time_range is None and polarizations is None
+                and times is None):
+            n_records_max = max(uv['nblts'] * self.Npols, 1)
+        else:
+            n_records_max = 1024
+        rec_pol = np.zeros(n_records_max, dtype=np.int)
+        rec_time = np.zeros(n_records_max, dtype=np.float)
+        rec_ant_i = np.zeros(n_records_max, dtype=np.int)
+        rec_ant_j = np.zeros(n_records_max, dtype=np.int)
+        rec_uvw = np.zeros((n_records_max, 3), dtype=np.float)
+        rec_ra = np.zeros(n_records_max, dtype=np.float)
+        rec_dec = np.zeros(n_records_max, dtype=np.float)
+        block_size = 1024
+        data_blocks = []
+        flag_blocks = []
+        nsample_blocks = []
+        n_records = 0
         pol_list = []
         for (uvw, t, (i, j)), d, f in uv.all(raw=True):
             # control for the case of only a single spw not showing up in
@@ -294,20 +374,18 @@ class Miriad(UVData):
             # aipy (see miriad_wrap.h). The i, j values are also adjusted by aipy
             # to start at 0 rather than 1.
             if len(d.shape) == 1:
-                d.shape = (1,) + d.shape
-                self.Nspws = d.shape[0]
+                self.Nspws = 1
                 self.spw_array = np.arange(self.Nspws)
             else:
                 raise(ValueError, """Sorry.  Files with more than one spectral
                       window (spw) are not yet supported. A great
                       project for the interested student!""")
+            if times is not None and not np.any(np.abs(times - t) <= time_tol):
+                continue
             try:
                 cnt = uv['cnt']
             except(KeyError):
-                cnt = np.ones(d.shape, dtype=np.float)
-            ra = uv['ra']
-            dec = uv['dec']
-            lst = uv['lst']
+                cnt = 1.
             source = uv['source']
             if source != _source:
                 raise(ValueError, 'This appears to be a multi source file, which is not supported.')
@@ -324,16 +402,42 @@ class Miriad(UVData):
                                        check_variables[extra_variable]):
                         check_variables.pop(extra_variable)
 
-            try:
-                data_accumulator[uv['pol']].append([uvw, t, i, j, d, f, cnt,
-                                                    ra, dec])
-            except(KeyError):
-                data_accumulator[uv['pol']] = [[uvw, t, i, j, d, f, cnt,
-                                                ra, dec]]
-                pol_list.append(uv['pol'])
-                # NB: flag types in miriad are usually ints
-
-        if len(data_accumulator.keys()) == 0:
+            if n_records == n_records_max:
+                # out of space, double the size of the record metadata arrays
+                n_records_max *= 2
+                rec_pol, rec_time, rec_ant_i, rec_ant_j, rec_uvw, rec_ra, rec_dec = \
+                    [np.concatenate((arr, np.zeros_like(arr)))
+                     for arr in [rec_pol, rec_time, rec_ant_i, rec_ant_j, rec_uvw,
+                                 rec_ra, rec_dec]]
+            block_ind = n_records % block_size
+            if block_ind == 0:
+                data_blocks.append(np.zeros((block_size, self.Nfreqs), dtype=np.complex64))
+                flag_blocks.append(np.zeros((block_size, self.Nfreqs), dtype=np.bool))
+                nsample_blocks.append(np.zeros((block_size, self.Nfreqs), dtype=np.float))
+
+            pol = uv['pol']
+            if pol not in pol_list:
+                pol_list.append(pol)
+            rec_pol[n_records] = pol
+            rec_time[n_records] = t
+            rec_ant_i[n_records] = i
+            rec_ant_j[n_records] = j
+            rec_uvw[n_records] = uvw
+            rec_ra[n_records] = uv['ra']
+            rec_dec[n_records] = uv['dec']
+            if freq_inds is not None:
+                # only copy out the selected channels
+                d = d[freq_inds]
+                f = f[freq_inds]
+                if np.ndim(cnt) > 0:
+                    cnt = cnt[freq_inds]
+            data_blocks[-1][block_ind] = d
+            # NB: flag types in miriad are usually ints
+            flag_blocks[-1][block_ind] = f
+            nsample_blocks[-1][block_ind] = cnt
+            n_records += 1
+
+        if n_records == 0:
             raise ValueError('No data is present, probably as a result of '
                              'select on read that excludes all the data')
 
@@ -367,9 +471,6 @@ class Miriad(UVData):
                 else:
                     self.extra_keywords[key] = uv[key]
 
-        for pol, data in data_accumulator.iteritems():
-            data_accumulator[pol] = np.array(data)
-
         self.polarization_array = np.array(pol_list)
         if polarizations is None:
             # A select on read would make the header npols not match the pols in the data
@@ -378,48 +479,59 @@ class Miriad(UVData):
                               npols=self.Npols, n=len(self.polarization_array)))
         self.Npols = len(pol_list)
 
-        # makes a data_array (and flag_array) of zeroes to be filled in by
-        #   data values
-        # any missing data will have zeros
-
-        # use set to get the unique list of all times ever listed in the file
-        # iterate over polarizations and all spectra (bls and times) in two
-        # nested loops, then flatten into a single vector, then set
-        # then list again.
-
-        times = list(set(
-            np.concatenate([[k[1] for k in d] for d in data_accumulator.values()])))
-        times = np.sort(times)
-
-        ant_i_unique = list(set(
-            np.concatenate([[k[2] for k in d] for d in data_accumulator.values()])))
-        ant_j_unique = list(set(
-            np.concatenate([[k[3] for k in d] for d in data_accumulator.values()])))
-
-        sorted_unique_ants = sorted(list(set(ant_i_unique + ant_j_unique)))
-        ant_i_unique = np.array(ant_i_unique)
-        ant_j_unique = np.array(ant_j_unique)
-
-        # Determine maximum digits needed to distinguish different values
-        if sorted_unique_ants[-1] > 0:
-            ndig_ant = np.ceil(np.log10(sorted_unique_ants[-1])).astype(int) + 1
-        else:
-            ndig_ant = 1
-        # Be excessive in precision because we use the floating point values as dictionary keys later
+        # trim the record arrays to the number of records read
+        rec_pol = rec_pol[:n_records]
+        rec_time = rec_time[:n_records]
+        rec_ant_i = rec_ant_i[:n_records]
+        rec_ant_j = rec_ant_j[:n_records]
+        rec_uvw = rec_uvw[:n_records]
+        rec_ra = rec_ra[:n_records]
+        rec_dec = rec_dec[:n_records]
+
+        unique_times = np.unique(rec_time)
+        sorted_unique_ants = np.unique(np.concatenate((rec_ant_i, rec_ant_j))).tolist()
+
+        # Identify the baseline-times with integer keys built from the time index
+        # and the antenna numbers. Times are rounded to well below the time
+        # tolerance first so that times that are only different by floating
+        # point errors are treated as the same time. Only the unique times
+        # are rounded (using string formatting for exact decimal rounding).
         prec_t = - 2 * np.floor(np.log10(self._time_array.tols[-1])).astype(int)
-        ndig_t = (np.ceil(np.log10(times[-1])).astype(int) + prec_t + 2)
-        blts = []
-        for d in data_accumulator.values():
-            for k in d:
-                blt = ["{1:.{0}f}".format(prec_t, k[1]).zfill(ndig_t),
-                       str(k[2]).zfill(ndig_ant), str(k[3]).zfill(ndig_ant)]
-                blt = "_".join(blt)
-                blts.append(blt)
-        unique_blts = np.unique(np.array(blts))
-
-        reverse_inds = dict(zip(unique_blts, range(len(unique_blts))))
+        rounded_times = np.array([float("{1:.{0}f}".format(prec_t, t)) for t in unique_times])
+        unique_rounded_times, time_inds = np.unique(rounded_times, return_inverse=True)
+        rec_time_inds = time_inds[np.searchsorted(unique_times, rec_time)]
+        n_ant_keys = np.int64(sorted_unique_ants[-1]) + 1
+        rec_blt_keys = ((rec_time_inds * n_ant_keys + rec_ant_i) * n_ant_keys
+                        + rec_ant_j)
+        unique_blt_keys, rec_blt_inds = np.unique(rec_blt_keys, return_inverse=True)
         self.Nants_data = len(sorted_unique_ants)
 
+        # select on blt_inds, keeping track of which records are kept (rec_inds)
+        # so that only those are copied out of the data blocks
+        if blt_inds is not None:
+            blt_inds = uvutils.get_iterable(blt_inds)
+            if len(blt_inds) == 0:
+                raise ValueError('No baseline-times were found that match criteria')
+            if max(blt_inds) >= len(unique_blt_keys):
+                raise ValueError('blt_inds contains indices that are too large')
+            if min(blt_inds) < 0:
+                raise ValueError('blt_inds contains indices that are negative')
+            keep_blts = np.zeros(len(unique_blt_keys), dtype=np.bool)
+            keep_blts[blt_inds] = True
+            rec_inds = np.nonzero(keep_blts[rec_blt_inds])[0]
+            unique_blt_keys = unique_blt_keys[keep_blts]
+            rec_blt_inds = (np.cumsum(keep_blts) - 1)[rec_blt_inds[rec_inds]]
+            rec_pol = rec_pol[rec_inds]
+            rec_time = rec_time[rec_inds]
+            rec_uvw = rec_uvw[rec_inds]
+            rec_ra = rec_ra[rec_inds]
+            rec_dec = rec_dec[rec_inds]
+            unique_times = np.unique(rec_time)
+            self.Nants_data = len(np.unique(np.concatenate((rec_ant_i[rec_inds],
+                                                            rec_ant_j[rec_inds]))))
+        else:
+            rec_inds = np.arange(n_records)
+
         # Miriad has no way to keep track of antenna numbers, so the antenna
         # numbers are simply the index for each antenna in any array that
         # describes antenna attributes (e.g. antpos for the antenna_postions).
@@ -635,10 +747,12 @@ class Miriad(UVData):
         # form up a grid which indexes time and baselines along the 'long'
         # axis of the visdata array
 
-        tij_grid = np.array(map(lambda x: map(float, x.split("_")), unique_blts))
-        t_grid, ant_i_grid, ant_j_grid = tij_grid.T
+        t_grid = unique_rounded_times[unique_blt_keys // n_ant_keys**2]
+        ant_i_grid = (unique_blt_keys // n_ant_keys) % n_ant_keys
+        ant_j_grid = unique_blt_keys % n_ant_keys
         # set the data sizes
-        if antenna_nums is None and ant_pairs_nums is None and ant_str is None and time_range is None:
+        if (antenna_nums is None and ant_pairs_nums is None and ant_str is None
+                and time_range is None and times is None and blt_inds is None):
             try:
                 self.Nblts = uv['nblts']
                 if self.Nblts != len(t_grid):
@@ -649,17 +763,17 @@ class Miriad(UVData):
         else:
             # The select on read will make the header nblts not match the number of unique blts
             self.Nblts = len(t_grid)
-        if time_range is None:
+        if time_range is None and times is None and blt_inds is None:
             try:
                 self.Ntimes = uv['ntimes']
-                if self.Ntimes != len(times):
+                if self.Ntimes != len(unique_times):
                     warnings.warn('Ntimes does not match the number of unique times in the data')
-                    self.Ntimes = len(times)
+                    self.Ntimes = len(unique_times)
             except(KeyError):
-                self.Ntimes = len(times)
+                self.Ntimes = len(unique_times)
         else:
             # The select on read will make the header ntimes not match the number of unique times
-            self.Ntimes = len(times)
+            self.Ntimes = len(unique_times)
 
         self.time_array = t_grid
         self.ant_1_array = ant_i_grid.astype(int)
@@ -667,7 +781,7 @@ class Miriad(UVData):
 
         self.baseline_array = self.antnums_to_baseline(ant_i_grid.astype(int),
                                                        ant_j_grid.astype(int))
-        if antenna_nums is None and ant_pairs_nums is None and ant_str is None:
+        if antenna_nums is None and ant_pairs_nums is None and ant_str is None and blt_inds is None:
             try:
                 self.Nbls = uv['nbls']
                 if self.Nbls != len(np.unique(self.baseline_array)):
@@ -681,78 +795,68 @@ class Miriad(UVData):
 
         # slot the data into a grid
         self.data_array = np.zeros((self.Nblts, self.Nspws, self.Nfreqs,
-                                    self.Npols), dtype=np.complex64)
+                                    self.Npols), dtype=data_dtype)
         self.flag_array = np.ones(self.data_array.shape, dtype=np.bool)
-        self.uvw_array = np.zeros((self.Nblts, 3))
         # NOTE: Using our lst calculator, which uses astropy,
         # instead of aipy values which come from pyephem.
         # The differences are of order 5 seconds.
         if self.telescope_location is not None:
             self.set_lsts_from_time_array()
-        self.nsample_array = np.ones(self.data_array.shape, dtype=np.float)
-        self.freq_array = (np.arange(self.Nfreqs) * self.channel_width
-                           + uv['sfreq'] * 1e9)
-        # Tile freq_array to shape (Nspws, Nfreqs).
-        # Currently does not actually support Nspws>1!
-        self.freq_array = np.tile(self.freq_array, (self.Nspws, 1))
+        self.nsample_array = np.ones(self.data_array.shape, dtype=nsample_dtype)
+
+        # slot the records into the grid
+        # (polarization_array is in the same order as pol_list)
+        rec_pol_inds = np.zeros(len(rec_pol), dtype=np.int)
+        for pol_ind, pol in enumerate(pol_list):
+            rec_pol_inds[rec_pol == pol] = pol_ind
+        for block_num in range(len(data_blocks)):
+            start = block_num * block_size
+            stop = min(start + block_size, n_records)
+            block_recs = slice(*np.searchsorted(rec_inds, [start, stop]))
+            block_blt_inds = rec_blt_inds[block_recs]
+            block_pol_inds = rec_pol_inds[block_recs]
+            block_inds = rec_inds[block_recs] - start
+            self.data_array[block_blt_inds, 0, :, block_pol_inds] = \
+                data_blocks[block_num][block_inds]
+            self.flag_array[block_blt_inds, 0, :, block_pol_inds] = \
+                flag_blocks[block_num][block_inds]
+            self.nsample_array[block_blt_inds, 0, :, block_pol_inds] = \
+                nsample_blocks[block_num][block_inds]
+            # free each block once it has been copied in
+            data_blocks[block_num] = None
+            flag_blocks[block_num] = None
+            nsample_blocks[block_num] = None
 
         # Temporary arrays to hold polarization axis, which will be collapsed
         ra_pol_list = np.zeros((self.Nblts, self.Npols))
         dec_pol_list = np.zeros((self.Nblts, self.Npols))
         uvw_pol_list = np.zeros((self.Nblts, 3, self.Npols))
         c_ns = const.c.to('m/ns').value
-        for pol, data in data_accumulator.iteritems():
-            pol_ind = self._pol_to_ind(pol)
-            for ind, d in enumerate(data):
-                blt = ["{1:.{0}f}".format(prec_t, d[1]).zfill(ndig_t),
-                       str(d[2]).zfill(ndig_ant), str(d[3]).zfill(ndig_ant)]
-                blt = "_".join(blt)
-                blt_index = reverse_inds[blt]
-
-                self.data_array[blt_index, :, :, pol_ind] = d[4]
-                self.flag_array[blt_index, :, :, pol_ind] = d[5]
-                self.nsample_array[blt_index, :, :, pol_ind] = d[6]
-
-                # because there are uvws/ra/dec for each pol, and one pol may not
-                # have that visibility, we collapse along the polarization
-                # axis but avoid any missing visbilities
-                uvw = d[0] * c_ns
-                uvw.shape = (1, 3)
-                uvw_pol_list[blt_index, :, pol_ind] = uvw
-                ra_pol_list[blt_index, pol_ind] = d[7]
-                dec_pol_list[blt_index, pol_ind] = d[8]
-
-        # Collapse pol axis for ra_list, dec_list, and uvw_list
-        ra_list = np.zeros(self.Nblts)
-        dec_list = np.zeros(self.Nblts)
-        for blt_index in xrange(self.Nblts):
-            test = ~np.all(self.flag_array[blt_index, :, :, :], axis=(0, 1))
-            good_pol = np.where(test)[0]
-            if len(good_pol) == 1:
-                # Only one good pol, use it
-                self.uvw_array[blt_index, :] = uvw_pol_list[blt_index, :, good_pol]
-                ra_list[blt_index] = ra_pol_list[blt_index, good_pol]
-                dec_list[blt_index] = dec_pol_list[blt_index, good_pol]
-            elif len(good_pol) > 1:
-                # Multiple good pols, check for consistency. pyuvdata does not
-                # support pol-dependent uvw, ra, or dec.
-                if np.any(np.diff(uvw_pol_list[blt_index, :, good_pol], axis=0)):
-                    raise ValueError('uvw values are different by polarization.')
-                else:
-                    self.uvw_array[blt_index, :] = uvw_pol_list[blt_index, :, good_pol[0]]
-                if np.any(np.diff(ra_pol_list[blt_index, good_pol])):
-                    raise ValueError('ra values are different by polarization.')
-                else:
-                    ra_list[blt_index] = ra_pol_list[blt_index, good_pol[0]]
-                if np.any(np.diff(dec_pol_list[blt_index, good_pol])):
-                    raise ValueError('dec values are different by polarization.')
-                else:
-                    dec_list[blt_index] = dec_pol_list[blt_index, good_pol[0]]
-            else:
-                # No good pols for this blt. Fill with first one.
-                self.uvw_array[blt_index, :] = uvw_pol_list[blt_index, :, 0]
-                ra_list[blt_index] = ra_pol_list[blt_index, 0]
-                dec_list[blt_index] = dec_pol_list[blt_index, 0]
+        uvw_pol_list[rec_blt_inds, :, rec_pol_inds] = rec_uvw * c_ns
+        ra_pol_list[rec_blt_inds, rec_pol_inds] = rec_ra
+        dec_pol_list[rec_blt_inds, rec_pol_inds] = rec_dec
+
+        # Collapse pol axis for ra_list, dec_list, and uvw_list.
+        # because there are uvws/ra/dec for each pol, and one pol may not
+        # have that visibility, we collapse along the polarization
+        # axis but avoid any missing visbilities. Use the first good pol for
+        # each blt (or the first pol if there are no good pols).
+        good_pols = ~np.all(self.flag_array, axis=(1, 2))
+        first_good_pol = np.argmax(good_pols, axis=1)
+        blt_inds = np.arange(self.Nblts)
+        self.uvw_array = uvw_pol_list[blt_inds, :, first_good_pol]
+        ra_list = ra_pol_list[blt_inds, first_good_pol]
+        dec_list = dec_pol_list[blt_inds, first_good_pol]
+
+        # pyuvdata does not support pol-dependent uvw, ra, or dec, so check
+        # that they are consistent across the good pols.
+        if np.any((uvw_pol_list != self.uvw_array[:, :, np.newaxis])
+                  & good_pols[:, np.newaxis, :]):
+            raise ValueError('uvw values are different by polarization.')
+        if np.any((ra_pol_list != ra_list[:, np.newaxis]) & good_pols):
+            raise ValueError('ra values are different by polarization.')
+        if np.any((dec_pol_list != dec_list[:, np.newaxis]) & good_pols):
+            raise ValueError('dec values are different by polarization.')
 
         # get unflagged blts
         blt_good = np.where(~np.all(self.flag_array, axis=(1, 2, 3)))
@@ -809,7 +913,8 @@ class Miriad(UVData):
         # check if object has all required uv_properties set
         if run_check:
             self.check(check_extra=check_extra,
-                       run_check_acceptability=run_check_acceptability)
+                       run_check_acceptability=run_check_acceptability,
+                       only_modified=True)
 
     def write_miriad(self, filepath, run_check=True, check_extra=True,
                      run_check_acceptability=True,
@@ -1049,35 +1154,70 @@ class Miriad(UVData):
         uv.add_var('ra', 'd')
         uv.add_var('dec', 'd')
 
-        # write data
-        c_ns = const.c.to('m/ns').value
-        for viscnt, blt in enumerate(self.data_array):
-            uvw = (self.uvw_array[viscnt] / c_ns).astype(np.double)  # NOTE issue 50 on conjugation
-            t = self.time_array[viscnt]
-            i = self.ant_1_array[viscnt]
-            j = self.ant_2_array[viscnt]
-
-            uv['lst'] = self.lst_array[viscnt]
-            if self.phase_type == 'phased':
-                uv['ra'] = self.phase_center_ra
-                uv['dec'] = self.phase_center_dec
-            elif self.phase_type == 'drift':
-                uv['ra'] = self.zenith_ra[viscnt]
-                uv['dec'] = self.zenith_dec[viscnt]
-            else:
-                raise ValueError('The phasing type of the data is unknown. '
-                                 'Set the phase_type to "drift" or "phased" to '
-                                 'reflect the phasing status of the data')
-
-            # NOTE only writing spw 0, not supporting multiple spws for write
-            for polcnt, pol in enumerate(self.polarization_array):
-                uv['pol'] = pol.astype(np.int)
-                uv['cnt'] = self.nsample_array[viscnt, 0, :, polcnt].astype(np.double)
-
-                data = self.data_array[viscnt, 0, :, polcnt]
-                flags = self.flag_array[viscnt, 0, :, polcnt]
-                if i > j:
-                    i, j, data = j, i, np.conjugate(data)
-                preamble = (uvw, t, (i, j))
+        # size the loops using the data arrays, like the records that are written
+        n_blts, _, n_freqs, n_pols = self.data_array.shape
+        if self.phase_type == 'phased':
+            ra_array = np.zeros(n_blts) + self.phase_center_ra
+            dec_array = np.zeros(n_blts) + self.phase_center_dec
+        elif self.phase_type == 'drift':
+            ra_array = self.zenith_ra
+            dec_array = self.zenith_dec
+        else:
+            raise ValueError('The phasing type of the data is unknown. '
+                             'Set the phase_type to "drift" or "phased" to '
+                             'reflect the phasing status of the data')
 
-                uv.write(preamble, data, flags)
+        # precompute the per-blt quantities. Miriad variables keep their values
+        # until they are updated, so the per-record variables are only written
+        # when they change (always for the first record).
+        c_ns = const.c.to('m/ns').value
+        uvw_array = (self.uvw_array / c_ns).astype(np.double)  # NOTE issue 50 on conjugation
+        conj_blts = self.ant_1_array > self.ant_2_array
+        ant_i_array = np.where(conj_blts, self.ant_2_array, self.ant_1_array).tolist()
+        ant_j_array = np.where(conj_blts, self.ant_1_array, self.ant_2_array).tolist()
+        time_list = self.time_array.tolist()
+        lst_list = self.lst_array.tolist()
+        blt_var_changed = np.ones(n_blts, dtype=np.bool)
+        blt_var_changed[1:] = ((np.diff(self.lst_array) != 0) | (np.diff(ra_array) != 0)
+                               | (np.diff(dec_array) != 0))
+        ra_list = ra_array.tolist()
+        dec_list = dec_array.tolist()
+        pol_list = self.polarization_array.astype(np.int).tolist()
+
+        # write data, converting a chunk of blts at a time into contiguous
+        # records ordered by (blt, pol) in the types needed for writing
+        # NOTE only writing spw 0, not supporting multiple spws for write
+        chunk_size = 1024
+        last_cnt = None
+        for start in range(0, n_blts, chunk_size):
+            stop = min(start + chunk_size, n_blts)
+            data = self.data_array[start:stop, 0].astype(np.complex64)
+            data[conj_blts[start:stop]] = np.conj(data[conj_blts[start:stop]])
+            data = np.ascontiguousarray(np.transpose(data, (0, 2, 1)))
+            # miriad stores good (unflagged) samples as 1
+            good = np.ascontiguousarray(np.transpose(
+                np.logical_not(self.flag_array[start:stop, 0]), (0, 2, 1))).astype(np.int32)
+            cnt = np.ascontiguousarray(np.transpose(
+                self.nsample_array[start:stop, 0], (0, 2, 1))).astype(np.double)
+            cnt_records = cnt.reshape(-1, n_freqs)
+            cnt_changed = np.ones(cnt_records.shape[0], dtype=np.bool)
+            cnt_changed[1:] = np.any(cnt_records[1:] != cnt_records[:-1], axis=1)
+            if last_cnt is not None:
+                cnt_changed[0] = np.any(cnt_records[0] != last_cnt)
+            last_cnt = cnt_records[-1]
+            cnt_changed = cnt_changed.reshape(stop - start, n_pols)
+
+            for blt_ind in range(stop - start):
+                viscnt = start + blt_ind
+                if blt_var_changed[viscnt]:
+                    uv['lst'] = lst_list[viscnt]
+                    uv['ra'] = ra_list[viscnt]
+                    uv['dec'] = dec_list[viscnt]
+                preamble = (uvw_array[viscnt], time_list[viscnt],
+                            (ant_i_array[viscnt], ant_j_array[viscnt]))
+                for polcnt, pol in enumerate(pol_list):
+                    if n_pols > 1 or viscnt == 0:
+                        uv['pol'] = pol
+                    if cnt_changed[blt_ind, polcnt]:
+                        uv['cnt'] = cnt[blt_ind, polcnt]
+                    uv.raw_write(preamble, data[blt_ind, polcnt], good[blt_ind, polcnt])
@@ -89,7 +89,7 @@ class MS(UVData):
 
     def read_ms(self, filepath, run_check=True, check_extra=True,
                 run_check_acceptability=True,
-                data_column='DATA', pol_order='AIPS'):
+                data_column='DATA', pol_order='AIPS', data_array_dtype=None):
         '''
         read in a casa measurement set
 
@@ -103,7 +103,12 @@ class MS(UVData):
                 after reading in the file. Default is True.
             data_column: specify which CASA measurement set data column to read from (can be 'DATA','CORRECTED', or 'MODEL')
             pol_order: use 'AIPS' or 'CASA' ordering of polarizations?
+            data_array_dtype: Datatype for the data_array, either np.complex64
+                or np.complex128. The nsample_array gets the matching real
+                precision (np.float32 or np.float64). Default is None, which
+                gives the precision of the measurement set columns.
         '''
+        data_dtype, nsample_dtype = uvutils.get_data_precision_dtypes(data_array_dtype)
         # make sure user requests a valid data_column
         if data_column != 'DATA' and data_column != 'CORRECTED_DATA' and data_column != 'MODEL':
             raise ValueError(
@@ -274,10 +279,15 @@ class MS(UVData):
         self.nsample_array = tb.getcol('WEIGHT_SPECTRUM')
         if(len(self.nsample_array.shape) == 3):
             self.nsample_array = np.expand_dims(self.nsample_array, axis=1)
+        if data_dtype is not None:
+            self.data_array = self.data_array.astype(data_dtype, copy=False)
+            self.nsample_array = self.nsample_array.astype(nsample_dtype, copy=False)
         self.object_name = tbField.getcol('NAME')[0]
         tbField.close()
         tb.close()
         # order polarizations
         self.order_pols(pol_order)
         if run_check:
-            self.check(check_extra=check_extra, run_check_acceptability=run_check_acceptability)
+            self.check(check_extra=check_extra,
+                       run_check_acceptability=run_check_acceptability,
+                       only_modified=True)
@@ -10,6 +10,37 @@ import numpy as np
 import utils
 
 
+def _arrays_close(array1, array2, tols, block_size=2**20):
+    """
+    Check if two arrays of the same shape are close (like np.allclose).
+
+    The arrays are compared in blocks along the first axis so that large arrays
+    do not need full size temporary arrays, stopping at the first block that
+    is not close. Blocks that are exactly equal are not compared with
+    np.allclose.
+
+    Args:
+        array1: First array.
+        array2: Second array, with the same shape as array1.
+        tols: Tuple of relative and absolute tolerances (as used by np.allclose).
+        block_size: Approximate number of elements in each block.
+
+    Returns:
+        True if all the values are close, False otherwise.
+    """
+    if array1.ndim == 0 or array1.size <= block_size:
+        return (np.array_equal(array1, array2)
+                or np.allclose(array1, array2, rtol=tols[0], atol=tols[1]))
+    step = max(1, block_size // (array1.size // array1.shape[0]))
+    for start in range(0, array1.shape[0], step):
+        block1 = array1[start:start + step]
+        block2 = array2[start:start + step]
+        if not (np.array_equal(block1, block2)
+                or np.allclose(block1, block2, rtol=tols[0], atol=tols[1])):
+            return False
+    return True
+
+
 class UVParameter(object):
     """
     Data and metadata objects for interferometric data sets.
@@ -72,99 +103,162 @@ class UVParameter(object):
         else:
             self.tols = tols  # relative and absolute tolerances to be used in np.isclose
 
+    @property
+    def value(self):
+        """The value of the data or metadata."""
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+        # a new value has not been checked (see UVBase.check)
+        self._checked = None
+        # count the times the value has been set, so that things computed
+        # from the value can tell if it has been set since (see UVData._get_antpair_index)
+        self._version = getattr(self, '_version', 0) + 1
+
+    def acceptability_signature(self):
+        """
+        Get the acceptability criteria in a form that can be compared later
+        (used to tell if the criteria have changed since the value was checked).
+        """
+        if self.acceptable_vals is None:
+            acceptable_vals = None
+        else:
+            acceptable_vals = list(self.acceptable_vals)
+        if self.acceptable_range is None:
+            acceptable_range = None
+        else:
+            acceptable_range = tuple(self.acceptable_range)
+        return (acceptable_vals, acceptable_range)
+
     def __eq__(self, other):
         """Equal if classes match and values are identical."""
-        if isinstance(other, self.__class__):
-            # only check that value is identical
-            if not isinstance(self.value, other.value.__class__):
-                print('{name} parameter value classes are different. Left is '
-                      '{lclass}, right is {rclass}'.format(name=self.name,
-                                                           lclass=self.value.__class__,
-                                                           rclass=other.value.__class__))
-                return False
-            if isinstance(self.value, np.ndarray) and not isinstance(self.value[0], (str, unicode)):
-                if self.value.shape != other.value.shape:
-                    print('{name} parameter value is array, shapes are '
-                          'different'.format(name=self.name))
-                    return False
-                elif not np.allclose(self.value, other.value,
-                                     rtol=self.tols[0], atol=self.tols[1]):
-                    print('{name} parameter value is array, values are not '
-                          'close'.format(name=self.name))
-                    return False
-            else:
-                str_type = False
-                if isinstance(self.value, (str, unicode)):
-                    str_type = True
-                if isinstance(self.value, (list, np.ndarray)):
-                    if isinstance(self.value[0], str):
-                        str_type = True
-
-                if not str_type:
-                    try:
-                        if not np.allclose(np.array(self.value),
-                                           np.array(other.value),
-                                           rtol=self.tols[0], atol=self.tols[1]):
-                            print('{name} parameter value is not a string. '
-                                  'The values are not close'.format(name=self.name))
-                            return False
-                    except(TypeError):
-                        if self.value != other.value:
-                            if isinstance(self.value, dict):
-                                # check to see if they are equal other than upper/lower case keys
-                                self_lower = {k.lower(): v for k, v in self.value.items()}
-                                other_lower = {k.lower(): v for k, v in other.value.items()}
-                                if self_lower != other_lower:
-                                    message_str = '{name} parameter is a dict'.format(name=self.name)
-                                    if set(self_lower.keys()) != set(other_lower.keys()):
-                                        message_str += ', keys are not the same.'
-                                    else:
-                                        # need to check if values are close, not just equal
-                                        values_close = True
-                                        for key in self_lower.keys():
-                                            try:
-                                                if not np.isclose(self_lower[key], other_lower[key]):
-                                                    message_str += (', key {key} is not '
-                                                                    'equal'.format(key=key))
-                                                    values_close = False
-                                            except(TypeError):
-                                                # this isn't a type that can be handled by np.isclose, test for equality
-                                                if self_lower[key] != other_lower[key]:
-                                                    message_str += (', key {key} is not '
-                                                                    'equal'.format(key=key))
-                                                    values_close = False
-                                        if values_close is False:
-                                            print(message_str)
-                                            return False
-                                        else:
-                                            return True
-                                else:
-                                    return True
-                            else:
-                                print('{name} parameter value is not a string '
-                                      'or a dict and cannot be cast as a numpy '
-                                      'array. The values are not equal.'.format(name=self.name))
-
-                            return False
+        message = self.compare(other)
+        if message is not None:
+            print(message)
+            return False
+        return True
 
-                else:
-                    if isinstance(self.value, (list, np.ndarray)):
-                        if [s.strip() for s in self.value] != [s.strip() for s in other.value]:
-                            print('{name} parameter value is a list of strings, '
-                                  'values are different'.format(name=self.name))
-                            return False
+    def compare(self, other):
+        """
+        Compare to another UVParameter, describing any difference.
+
+        Values that are the same object or (for arrays) views on the same
+        memory are equal without comparing them element by element. Packed
+        flags (see utils._PackedFlags) are equal to the same unpacked flags.
+
+        Args:
+            other: UVParameter to compare to.
+
+        Returns:
+            None if the parameters are equal, otherwise a string describing
+            the difference.
+        """
+        if not isinstance(other, self.__class__):
+            return '{name} parameter classes are different'.format(name=self.name)
+
+        self_value = self.value
+        other_value = other.value
+        if isinstance(self_value, utils._PackedFlags) and isinstance(other_value, utils._PackedFlags):
+            if self_value.shape != other_value.shape:
+                return ('{name} parameter value is array, shapes are '
+                        'different'.format(name=self.name))
+            # the flags are equal if the packed bytes are
+            self_value = self_value.packed
+            other_value = other_value.packed
+        # packed flags are equal to the unpacked flags
+        if isinstance(self_value, utils._PackedFlags):
+            self_value = np.asarray(self_value)
+        if isinstance(other_value, utils._PackedFlags):
+            other_value = np.asarray(other_value)
+
+        # only check that value is identical
+        if not isinstance(self_value, other_value.__class__):
+            return ('{name} parameter value classes are different. Left is '
+                    '{lclass}, right is {rclass}'.format(name=self.name,
+                                                         lclass=self_value.__class__,
+                                                         rclass=other_value.__class__))
+        if self_value is other_value:
+            return None
+        if isinstance(self_value, np.ndarray) and not isinstance(self_value[0], (str, unicode)):
+            if self_value.shape != other_value.shape:
+                return ('{name} parameter value is array, shapes are '
+                        'different'.format(name=self.name))
+            if (self_value.dtype != other_value.dtype
+                    and not (self_value.dtype.kind in 'biufc'
+                             and other_value.dtype.kind in 'biufc')):
+                return ('{name} parameter value is array, dtypes are '
+                        'different'.format(name=self.name))
+            if (self_value.dtype == other_value.dtype
+                    and self_value.strides == other_value.strides
+                    and (self_value.__array_interface__['data'][0]
+                         == other_value.__array_interface__['data'][0])):
+                # views on the same memory
+                return None
+            if not _arrays_close(self_value, other_value, self.tols):
+                return ('{name} parameter value is array, values are not '
+                        'close'.format(name=self.name))
+            return None
+
+        str_type = False
+        if isinstance(self_value, (str, unicode)):
+            str_type = True
+        if isinstance(self_value, (list, np.ndarray)):
+            if isinstance(self_value[0], str):
+                str_type = True
+
+        if not str_type:
+            try:
+                if not np.allclose(np.array(self_value),
+                                   np.array(other_value),
+                                   rtol=self.tols[0], atol=self.tols[1]):
+                    return ('{name} parameter value is not a string. '
+                            'The values are not close'.format(name=self.name))
+            except(TypeError):
+                if self_value != other_value:
+                    if isinstance(self_value, dict):
+                        # check to see if they are equal other than upper/lower case keys
+                        self_lower = {k.lower(): v for k, v in self_value.items()}
+                        other_lower = {k.lower(): v for k, v in other_value.items()}
+                        if self_lower != other_lower:
+                            message_str = '{name} parameter is a dict'.format(name=self.name)
+                            if set(self_lower.keys()) != set(other_lower.keys()):
+                                message_str += ', keys are not the same.'
+                                return message_str
+                            # need to check if values are close, not just equal
+                            values_close = True
+                            for key in self_lower.keys():
+                                try:
+                                    if not np.isclose(self_lower[key], other_lower[key]):
+                                        message_str += (', key {key} is not '
+                                                        'equal'.format(key=key))
+                                        values_close = False
+                                except(TypeError):
+                                    # this isn't a type that can be handled by np.isclose, test for equality
+                                    if self_lower[key] != other_lower[key]:
+                                        message_str += (', key {key} is not '
+                                                        'equal'.format(key=key))
+                                        values_close = False
+                            if values_close is False:
+                                return message_str
                     else:
-                        if self.value.strip() != other.value.strip():
-                            if (self.value.replace('\n', '').replace(' ', '')
-                                    != other.value.replace('\n', '').replace(' ', '')):
-                                print('{name} parameter value is a string, '
-                                      'values are different'.format(name=self.name))
-                                return False
-
-            return True
+                        return ('{name} parameter value is not a string '
+                                'or a dict and cannot be cast as a numpy '
+                                'array. The values are not equal.'.format(name=self.name))
         else:
-            print('{name} parameter classes are different'.format(name=self.name))
-            return False
+            if isinstance(self_value, (list, np.ndarray)):
+                if [s.strip() for s in self_value] != [s.strip() for s in other_value]:
+                    return ('{name} parameter value is a list of strings, '
+                            'values are different'.format(name=self.name))
+            else:
+                if self_value.strip() != other_value.strip():
+                    if (self_value.replace('\n', '').replace(' ', '')
+                            != other_value.replace('\n', '').replace(' ', '')):
+                        return ('{name} parameter value is a string, '
+                                'values are different'.format(name=self.name))
+
+        return None
 
     def __ne__(self, other):
         """Not equal."""
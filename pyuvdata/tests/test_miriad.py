@@ -655,6 +655,96 @@ def test_readWriteReadMiriad():
     del(full)
 
 
+def test_readMiriadSelectFreqTimesBlts():
+    """
+    Test frequency, times and blt_inds select on read for Miriad files.
+    """
+    full = UVData()
+    testfile = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA')
+    uvtest.checkWarnings(full.read_miriad, [testfile], known_warning='miriad')
+    uv_in = UVData()
+
+    # test frequency channel loading
+    chans_to_keep = np.arange(2, 7)
+    uvtest.checkWarnings(uv_in.read_miriad, [testfile], {'freq_chans': chans_to_keep},
+                         known_warning='miriad')
+    nt.assert_equal(uv_in.Nfreqs, len(chans_to_keep))
+    exp_uv = full.select(freq_chans=chans_to_keep, inplace=False)
+    nt.assert_equal(uv_in, exp_uv)
+
+    # test frequency loading
+    freqs_to_keep = full.freq_array[0, [1, 5]]
+    uvtest.checkWarnings(uv_in.read_miriad, [testfile], {'frequencies': freqs_to_keep},
+                         nwarnings=2, category=[UserWarning, UserWarning],
+                         message=['Altitude is not present', 'Selected frequencies are not contiguous'])
+    exp_uv = uvtest.checkWarnings(full.select, [], {'frequencies': freqs_to_keep, 'inplace': False},
+                                  message='Selected frequencies are not contiguous')
+    nt.assert_equal(uv_in, exp_uv)
+
+    # test times loading
+    times_to_keep = np.unique(full.time_array)[[2, 5, 6]]
+    uvtest.checkWarnings(uv_in.read_miriad, [testfile], {'times': times_to_keep},
+                         known_warning='miriad')
+    nt.assert_equal(uv_in.Ntimes, len(times_to_keep))
+    exp_uv = full.select(times=times_to_keep, inplace=False)
+    nt.assert_equal(uv_in, exp_uv)
+
+    # test blt_inds loading
+    blt_inds_to_keep = np.arange(10, 60, 3)
+    uvtest.checkWarnings(uv_in.read_miriad, [testfile], {'blt_inds': blt_inds_to_keep},
+                         known_warning='miriad')
+    exp_uv = full.select(blt_inds=blt_inds_to_keep, inplace=False)
+    nt.assert_equal(uv_in, exp_uv)
+
+    # blt_inds apply to the data read in with the other selections
+    uvtest.checkWarnings(uv_in.read_miriad, [testfile],
+                         {'times': times_to_keep, 'blt_inds': np.arange(5, 25)},
+                         known_warning='miriad')
+    exp_uv = full.select(times=times_to_keep, inplace=False)
+    exp_uv.select(blt_inds=np.arange(5, 25))
+    nt.assert_equal(uv_in.data_array.shape, exp_uv.data_array.shape)
+    nt.assert_true(np.all(uv_in.data_array == exp_uv.data_array))
+    nt.assert_true(np.all(uv_in.time_array == exp_uv.time_array))
+    nt.assert_true(np.all(uv_in.baseline_array == exp_uv.baseline_array))
+
+    # assert exceptions
+    nt.assert_raises(ValueError, uv_in.read_miriad, testfile, frequencies=[1.0])
+    nt.assert_raises(ValueError, uv_in.read_miriad, testfile, blt_inds=[full.Nblts])
+    nt.assert_raises(ValueError, uv_in.read_miriad, testfile, blt_inds=[-1])
+    nt.assert_raises(ValueError, uv_in.read_miriad, testfile, times=[full.time_array[0] + 1])
+
+
+def test_writeMiriadFlippedBaselinesNsamples():
+    """
+    Test writing baselines with ant_1 > ant_2 for several polarizations and
+    nsamples that vary between records.
+    """
+    uv_in = UVData()
+    testfile = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA')
+    write_file = os.path.join(DATA_PATH, 'test/outtest_miriad.uv')
+    uvtest.checkWarnings(uv_in.read_miriad, [testfile], known_warning='miriad')
+    uv2 = copy.deepcopy(uv_in)
+    uv2.polarization_array = np.array([-8])
+    uv2.data_array *= 2
+    uv_in += uv2
+    uv_in.nsample_array[::3] = 0.5
+    uv_in.nsample_array[5, 0, 3, 1] = 2.
+    expected = copy.deepcopy(uv_in)
+
+    # flip some baselines, these are flipped back (and conjugated) on write
+    flip_inds = np.where((uv_in.ant_1_array == 0) & (uv_in.ant_2_array % 2 == 1))[0]
+    ant_1_flip = uv_in.ant_1_array[flip_inds]
+    uv_in.ant_1_array[flip_inds] = uv_in.ant_2_array[flip_inds]
+    uv_in.ant_2_array[flip_inds] = ant_1_flip
+    uv_in.baseline_array = uv_in.antnums_to_baseline(uv_in.ant_1_array, uv_in.ant_2_array)
+    uv_in.data_array[flip_inds] = np.conj(uv_in.data_array[flip_inds])
+
+    uv_in.write_miriad(write_file, clobber=True)
+    uv_out = UVData()
+    uv_out.read_miriad(write_file)
+    nt.assert_equal(uv_out, expected)
+
+
 def test_readMSWriteMiriad_CASAHistory():
     """
     read in .ms file.
@@ -30,6 +30,32 @@ def test_array_inequality():
     nt.assert_not_equal(param1, param3)
 
 
+def test_array_compare():
+    """Test comparing arrays, including the shortcuts for shared memory."""
+    value = np.arange(10.)
+    param1 = uvp.UVParameter(name='p1', value=value)
+    param2 = uvp.UVParameter(name='p2', value=value[:])
+    nt.assert_equal(param1.compare(param2), None)
+    nt.assert_equal(param1.compare(uvp.UVParameter(name='p3', value=value[::2])),
+                    'p1 parameter value is array, shapes are different')
+    nt.assert_equal(param1.compare(uvp.UVParameter(name='p3', value=value.astype(str))),
+                    'p1 parameter value is array, dtypes are different')
+    nt.assert_equal(param1.compare(uvp.UVParameter(name='p3', value=value.astype(np.float32))),
+                    None)
+    nt.assert_equal(uvp.AngleParameter(name='p3', value=value).compare(param1),
+                    'p3 parameter classes are different')
+
+    # large arrays are compared in blocks
+    value = np.random.rand(1000, 1100)
+    param1 = uvp.UVParameter(name='p1', value=value)
+    param2 = uvp.UVParameter(name='p2', value=value.copy())
+    nt.assert_equal(param1.compare(param2), None)
+    param2.value[-1, -1] += 1e-9
+    nt.assert_equal(param1.compare(param2), None)
+    param2.value[-1, -1] += 1
+    nt.assert_equal(param1.compare(param2), 'p1 parameter value is array, values are not close')
+
+
 def test_string_inequality():
     """Test equality error for different string values."""
     param1 = uvp.UVParameter(name='p1', value='Alice')
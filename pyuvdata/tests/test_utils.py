@@ -182,3 +182,120 @@ def test_jones_num_funcs():
     nt.assert_raises(KeyError, uvutils.jstr2num, 'foo')
     nt.assert_raises(ValueError, uvutils.jstr2num, 1)
     nt.assert_raises(ValueError, uvutils.jnum2str, 7.3)
+
+
+def test_get_matching_inds():
+    array = np.array([5, 3, 7, 3, 1])
+    inds, missing = uvutils.get_matching_inds(array, [3, 1, 4, 5])
+    nt.assert_equal([1, 3, 4, 0], inds.tolist())
+    nt.assert_equal([False, False, True, False], missing.tolist())
+
+    # values can be in any order and repeated
+    inds, missing = uvutils.get_matching_inds(array, [7, 5, 7])
+    nt.assert_equal([2, 0, 2], inds.tolist())
+    nt.assert_false(np.any(missing))
+
+
+def test_get_lst_for_time():
+    from astropy.time import Time
+    latitude, longitude, altitude = -30.72, 21.43, 1051.7
+    jds = 2457458.1739 + np.array([0., 0.01, 0., 0.02, 0.01])
+    uvutils._lst_cache.clear()
+    lsts = uvutils.get_lst_for_time(jds, latitude, longitude, altitude)
+    nt.assert_equal(jds.shape, lsts.shape)
+    nt.assert_equal(3, len(uvutils._lst_cache))
+    for jd, lst in zip(jds, lsts):
+        t = Time(jd, format='jd', location=(longitude, latitude))
+        nt.assert_true(np.isclose(t.sidereal_time('apparent').radian, lst,
+                                  rtol=0, atol=1e-12))
+
+    # cached values are used unless caching is turned off
+    key = (jds[0], latitude, longitude, altitude)
+    uvutils._lst_cache[key] = 0.
+    nt.assert_equal(0., uvutils.get_lst_for_time(jds[:1], latitude, longitude, altitude)[0])
+    nt.assert_equal(lsts[0], uvutils.get_lst_for_time(jds[:1], latitude, longitude,
+                                                      altitude, use_cache=False)[0])
+    nt.assert_equal(0., uvutils._lst_cache[key])
+
+    # the cache is limited to lst_cache_size entries, least recently used are dropped
+    cache_size = uvutils.lst_cache_size
+    uvutils.lst_cache_size = 3
+    try:
+        uvutils.get_lst_for_time(jds[3] + 0.01, latitude, longitude, altitude)
+        nt.assert_equal(3, len(uvutils._lst_cache))
+        nt.assert_false((jds[1], latitude, longitude, altitude) in uvutils._lst_cache)
+        nt.assert_true(key in uvutils._lst_cache)
+    finally:
+        uvutils.lst_cache_size = cache_size
+        uvutils._lst_cache.clear()
+
+
+def test_lazy_lsts():
+    latitude, longitude, altitude = -30.72, 21.43, 1051.7
+    jds = 2457458.1739 + np.array([0., 0.01, 0., 0.02, 0.01])
+    lsts = uvutils.get_lst_for_time(jds, latitude, longitude, altitude)
+    lazy_lsts = uvutils._LazyLSTs(jds, latitude, longitude, altitude)
+    nt.assert_true(lazy_lsts.is_lazy)
+    nt.assert_equal(jds.shape, lazy_lsts.shape)
+    nt.assert_equal(1, lazy_lsts.ndim)
+    nt.assert_equal(5, lazy_lsts.size)
+    nt.assert_equal(5, len(lazy_lsts))
+    nt.assert_equal(np.float64, lazy_lsts.dtype)
+    nt.assert_equal(lsts[3], lazy_lsts.item(3))
+    nt.assert_true(np.array_equal(lsts[1:3], lazy_lsts[1:3]))
+    nt.assert_true(np.array_equal(lsts, lazy_lsts.load()))
+    nt.assert_true(np.array_equal(lsts, np.asarray(lazy_lsts)))
+
+    # the times are copied, so changing them does not change the LSTs
+    jds[0] += 0.1
+    nt.assert_true(np.array_equal(lsts, lazy_lsts.load()))
+
+
+def test_get_data_precision_dtypes():
+    nt.assert_equal((None, None), uvutils.get_data_precision_dtypes(None))
+    nt.assert_equal((np.complex64, np.float32),
+                    uvutils.get_data_precision_dtypes(np.complex64))
+    nt.assert_equal((np.complex128, np.float64),
+                    uvutils.get_data_precision_dtypes('complex128'))
+    nt.assert_raises(ValueError, uvutils.get_data_precision_dtypes, np.float32)
+    nt.assert_raises(ValueError, uvutils.get_data_precision_dtypes, 'foo')
+
+
+def test_packed_flags():
+    flags = np.random.RandomState(0).rand(13, 1, 7, 3) > 0.5
+    packed = uvutils._PackedFlags(flags)
+    nt.assert_equal(flags.shape, packed.shape)
+    nt.assert_equal(13, len(packed))
+    nt.assert_true(packed.nbytes < flags.nbytes)
+    nt.assert_true(np.array_equal(flags, np.asarray(packed)))
+    for ind in range(flags.size):
+        nt.assert_equal(flags.flat[ind], packed.item(ind))
+    for key in [3, slice(2, 9), [5, 1, 1], (3, 0, 2, 1), (slice(1, None, 3), 0, slice(2, 5), 1),
+                (slice(None), slice(None), slice(None), [2, 0]),
+                ([1, 2], slice(None), slice(None), [0, 2]), Ellipsis, flags[:, 0, 0, 0]]:
+        nt.assert_true(np.array_equal(flags[key], packed[key]))
+
+    # take and concatenate give packed flags along every axis
+    for axis in range(4):
+        inds = [flags.shape[axis] - 1, 0, 0]
+        nt.assert_true(isinstance(np.take(packed, inds, axis=axis), uvutils._PackedFlags))
+        nt.assert_true(np.array_equal(np.take(flags, inds, axis=axis),
+                                      np.asarray(np.take(packed, inds, axis=axis))))
+        other = np.take(flags, inds, axis=axis)
+        concat = uvutils._concatenate_flags([packed, other], axis)
+        nt.assert_true(isinstance(concat, uvutils._PackedFlags))
+        nt.assert_true(np.array_equal(np.concatenate([flags, other], axis=axis),
+                                      np.asarray(concat)))
+    nt.assert_raises(ValueError, uvutils._concatenate_flags, [packed, flags[:, :, :2]], 0)
+    nt.assert_raises(ValueError, uvutils._concatenate_flags, [packed, flags[:2]], 2)
+    nt.assert_true(isinstance(uvutils._concatenate_flags([flags, packed], 0), np.ndarray))
+
+    # setting values
+    for key, value in [(np.ix_([1, 4], [0], [0, 3, 5], [2, 1]), True),
+                       (slice(2, 4), uvutils._PackedFlags(flags[5:7])),
+                       (np.ix_([0, 3], [0], np.arange(7), np.arange(3)),
+                        uvutils._PackedFlags(flags[8:10])),
+                       (flags.copy(), False), ((5, 0, 3), True)]:
+        flags[key] = np.asarray(value)
+        packed[key] = value
+        nt.assert_true(np.array_equal(flags, np.asarray(packed)))
@@ -53,6 +53,25 @@ def test_inequality():
     nt.assert_not_equal(test_obj, test_obj2)
 
 
+def test_diff():
+    """Test the list of differences."""
+    test_obj = UVTest()
+    test_obj2 = copy.deepcopy(test_obj)
+    nt.assert_equal(test_obj.diff(test_obj2), [])
+    test_obj2.float1 = 13.
+    test_obj2.string = 'foo'
+    nt.assert_equal(test_obj.diff(test_obj2),
+                    [('_float1', 'float1 parameter value is not a string. '
+                      'The values are not close'),
+                     ('_string', 'string parameter value is a string, '
+                      'values are different')])
+    nt.assert_equal(test_obj.diff(test_obj2, stop_early=True),
+                    [('_float1', 'float1 parameter value is not a string. '
+                      'The values are not close')])
+    nt.assert_false(test_obj.__eq__(test_obj2, stop_early=True))
+    nt.assert_equal(test_obj.diff(test_obj._floatarr), [(None, 'Classes do not match')])
+
+
 def test_class_inequality():
     """Test equality error for different classes."""
     test_obj = UVTest()
@@ -108,3 +127,71 @@ def test_list_dims():
     test_obj.intlist = [i for i in np.arange(test_obj.int1)]
     test_obj.intlist[1] = 'test'
     nt.assert_raises(ValueError, test_obj.check)
+
+
+def test_parameter_registry():
+    """Test that the UVParameter names are registered on the class."""
+    test_obj = UVTest()
+    param_names = sorted(a for a, v in test_obj.__dict__.items()
+                         if isinstance(v, uvp.UVParameter))
+    nt.assert_equal(UVTest._uvparameter_names, tuple(param_names))
+    nt.assert_equal(list(test_obj), param_names)
+    nt.assert_equal(sorted(list(test_obj.required()) + list(test_obj.extra())),
+                    param_names)
+
+    # required and extra follow changes to the required flag on the object
+    test_obj._int1.required = False
+    nt.assert_true('_int1' in test_obj.extra())
+    nt.assert_false('_int1' in test_obj.required())
+    nt.assert_true('_int1' in UVTest().required())
+
+
+def test_check_level():
+    """Test the check levels."""
+    test_obj = UVTest()
+    test_obj._float1.acceptable_range = (0, 10)
+    nt.assert_raises(ValueError, test_obj.check)
+    nt.assert_true(test_obj.check(check_level='shapes'))
+    nt.assert_true(test_obj.check(check_level='none'))
+
+    test_obj.floatarr = np.zeros(2)
+    nt.assert_raises(ValueError, test_obj.check, check_level='shapes')
+    nt.assert_true(test_obj.check(check_level='none'))
+    nt.assert_raises(ValueError, test_obj.check, check_level='foo')
+
+
+def test_check_only_modified():
+    """Test that only modified values are checked again."""
+    test_obj = UVTest()
+    test_obj._floatarr.acceptable_range = (0, 1)
+    nt.assert_true(test_obj.check())
+    nt.assert_equal(test_obj._floatarr._checked, (None, (0, 1)))
+
+    # changes in place are seen by the default check but not by only_modified
+    test_obj.floatarr[0, 0] = 20.
+    nt.assert_raises(ValueError, test_obj.check)
+    nt.assert_true(test_obj.check(only_modified=True))
+
+    # setting the value or changing the acceptable range is seen
+    test_obj.floatarr = test_obj.floatarr
+    nt.assert_equal(test_obj._floatarr._checked, None)
+    nt.assert_raises(ValueError, test_obj.check, only_modified=True)
+    test_obj.floatarr = np.random.rand(test_obj.int1, test_obj.int2)
+    nt.assert_true(test_obj.check())
+    test_obj._floatarr.acceptable_range = (2, 3)
+    nt.assert_raises(ValueError, test_obj.check, only_modified=True)
+
+
+def test_copy_sharing_arrays():
+    """Test copying with shared arrays and unsharing them."""
+    test_obj = UVTest()
+    test_obj2 = test_obj._copy_sharing_arrays()
+    nt.assert_equal(test_obj, test_obj2)
+    nt.assert_true(test_obj2.floatarr is test_obj.floatarr)
+    nt.assert_false(test_obj2.strlist is test_obj.strlist)
+    nt.assert_false(test_obj2._floatarr is test_obj._floatarr)
+
+    test_obj2.floatarr = test_obj2.floatarr[:, 1:]
+    test_obj2._unshare_arrays(test_obj)
+    nt.assert_false(np.may_share_memory(test_obj2.floatarr, test_obj.floatarr))
+    nt.assert_true(np.all(test_obj2.floatarr == test_obj.floatarr[:, 1:]))
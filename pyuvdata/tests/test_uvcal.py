@@ -1149,6 +1149,31 @@ class TestUVCalAddGain(object):
         self.gain_object.history = gain_object_full.history
         nt.assert_equal(self.gain_object, gain_object_full)
 
+    def test_add_packed_flags(self):
+        """Test selecting and adding UVCal objects with packed flags"""
+        self.gain_object.flag_array[::2, :, ::3] = True
+        gain_object_full = copy.deepcopy(self.gain_object)
+        self.gain_object.pack_flags()
+        nt.assert_true(isinstance(self.gain_object.flag_array, uvutils._PackedFlags))
+        nt.assert_equal(self.gain_object, gain_object_full)
+
+        ants = self.gain_object.ant_array
+        Nf2 = self.gain_object.Nfreqs / 2
+        freqs = self.gain_object.freq_array[0, :]
+        for select_kwargs in [[{'antenna_nums': ants[:4]}, {'antenna_nums': ants[4:]}],
+                              [{'frequencies': freqs[:Nf2]}, {'frequencies': freqs[Nf2:]}]]:
+            gain_object1 = self.gain_object.select(inplace=False, **select_kwargs[0])
+            gain_object2 = self.gain_object.select(inplace=False, **select_kwargs[1])
+            nt.assert_true(isinstance(gain_object1.flag_array, uvutils._PackedFlags))
+            gain_object3 = gain_object2 + gain_object1
+            nt.assert_true(isinstance(gain_object3.flag_array, uvutils._PackedFlags))
+            gain_object3.history = gain_object_full.history
+            nt.assert_equal(gain_object3, gain_object_full)
+
+        self.gain_object.unpack_flags()
+        nt.assert_true(isinstance(self.gain_object.flag_array, np.ndarray))
+        nt.assert_equal(self.gain_object, gain_object_full)
+
 
 class TestUVCalAddDelay(object):
     def setUp(self):
@@ -47,7 +47,7 @@ class TestUVDataInit(object):
                                  '_timesys', '_uvplane_reference_time',
                                  '_phase_center_ra', '_phase_center_dec',
                                  '_phase_center_epoch',
-                                 '_zenith_ra', '_zenith_dec']
+                                 '_zenith_ra', '_zenith_dec', '_blt_order']
 
         self.extra_properties = ['extra_keywords', 'antenna_positions',
                                  'x_orientation', 'antenna_diameters', 'gst0',
@@ -55,7 +55,7 @@ class TestUVDataInit(object):
                                  'uvplane_reference_time',
                                  'phase_center_ra', 'phase_center_dec',
                                  'phase_center_epoch',
-                                 'zenith_ra', 'zenith_dec']
+                                 'zenith_ra', 'zenith_dec', 'blt_order']
 
         self.other_properties = ['telescope_location_lat_lon_alt',
                                  'telescope_location_lat_lon_alt_degrees',
@@ -335,6 +335,33 @@ def test_phase_unphaseHERA():
     del(UV_raw)
 
 
+def test_phase_blt_chunk_size():
+    """
+    Check that phasing and unphasing give the same results for any blt chunk size.
+    """
+    testfile = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA')
+    uv_object = UVData()
+    uvtest.checkWarnings(uv_object.read_miriad, [testfile],
+                         known_warning='miriad')
+    uv_chunked = copy.deepcopy(uv_object)
+
+    uv_object.phase_to_time(uv_object.time_array[0])
+    uv_chunked.phase_to_time(uv_chunked.time_array[0], blt_chunk_size=7)
+    nt.assert_equal(uv_object, uv_chunked)
+    nt.assert_equal(uv_chunked.data_array.dtype, np.complex64)
+
+    uv_object.unphase_to_drift()
+    uv_chunked.unphase_to_drift(blt_chunk_size=1)
+    nt.assert_equal(uv_object, uv_chunked)
+
+    # check errors for chunk sizes that are not positive
+    nt.assert_raises(ValueError, uv_chunked.phase, 0., 0., ephem.J2000,
+                     blt_chunk_size=0)
+    nt.assert_equal(uv_object, uv_chunked)
+    uv_chunked.phase(0., 0., ephem.J2000)
+    nt.assert_raises(ValueError, uv_chunked.unphase_to_drift, blt_chunk_size=0)
+
+
 def test_set_phase_unknown():
     uv_object = UVData()
     testfile = os.path.join(
@@ -1209,6 +1236,88 @@ def test_add_drift():
     nt.assert_equal(uv1, uv_full)
 
 
+def test_add_blt_keys():
+    # Test matching of baseline-times when adding along the baseline-time axis
+    uv_full = UVData()
+    testfile = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA')
+    uvtest.checkWarnings(uv_full.read_miriad, [testfile], known_warning='miriad')
+    # avoid warnings about non-contiguous frequencies from floating point errors
+    uv_full.channel_width = np.max(np.diff(uv_full.freq_array[0, :]))
+
+    # interleaved blts, added out of order
+    uv1 = uv_full.select(blt_inds=np.arange(0, uv_full.Nblts, 2), inplace=False)
+    uv2 = uv_full.select(blt_inds=np.arange(1, uv_full.Nblts, 2), inplace=False)
+    uv2 += uv1
+    uv2.history = uv_full.history
+    nt.assert_equal(uv2, uv_full)
+
+    # times that only differ by floating point errors are the same time
+    uv1 = uv_full.select(freq_chans=np.arange(0, 5), inplace=False)
+    uv2 = uv_full.select(freq_chans=np.arange(5, uv_full.Nfreqs), inplace=False)
+    uv2.time_array += 1e-12
+    uv1 += uv2
+    nt.assert_equal(uv1.Nblts, uv_full.Nblts)
+    uv1.history = uv_full.history
+    nt.assert_equal(uv1, uv_full)
+
+    # but times that are different are not
+    uv2.time_array += 1e-7
+    uv2.select(times=np.unique(uv2.time_array)[0])
+    uv1 = uv_full.select(freq_chans=np.arange(0, 5), inplace=False)
+    uv1 += uv2
+    nt.assert_equal(uv1.Nblts, uv_full.Nblts + uv2.Nblts)
+
+
+def test_fast_concat():
+    uv_full = UVData()
+    testfile = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA')
+    uvtest.checkWarnings(uv_full.read_miriad, [testfile], known_warning='miriad')
+    # avoid warnings about non-contiguous frequencies from floating point errors
+    uv_full.channel_width = np.max(np.diff(uv_full.freq_array[0, :]))
+
+    # Concatenate times
+    times = np.unique(uv_full.time_array)
+    uv_list = [uv_full.select(times=times[i:i + 3], inplace=False)
+               for i in range(0, len(times), 3)]
+    uv1 = uv_list[0].fast_concat(uv_list[1:], 'blt')
+    nt.assert_equal(uv_list[0].Ntimes, 3)
+    nt.assert_true(uvutils.check_histories(uv_full.history + '  Downselected to '
+                                           'specific times using pyuvdata. '
+                                           'Combined data along baseline-time '
+                                           'axis using pyuvdata.', uv1.history))
+    uv1.history = uv_full.history
+    nt.assert_equal(uv1, uv_full)
+
+    # Concatenate frequencies in place
+    uv1 = uv_full.select(freq_chans=np.arange(0, 4), inplace=False)
+    uv2 = uv_full.select(freq_chans=np.arange(4, 8), inplace=False)
+    uv3 = uv_full.select(freq_chans=np.arange(8, uv_full.Nfreqs), inplace=False)
+    uv1.fast_concat([uv2, uv3], 'freq', inplace=True)
+    uv1.history = uv_full.history
+    nt.assert_equal(uv1, uv_full)
+
+    # Concatenate polarizations, the data type is kept
+    uv2 = copy.deepcopy(uv_full)
+    uv2.polarization_array = np.array([-6])
+    uv1 = uv_full.fast_concat(uv2, 'polarization')
+    nt.assert_equal(uv1.Npols, 2)
+    nt.assert_equal(uv1.data_array.dtype, uv_full.data_array.dtype)
+    nt.assert_true(np.all(uv1.data_array[:, :, :, 1] == uv2.data_array[:, :, :, 0]))
+
+    # Out of order frequencies
+    uv1 = uv_full.select(freq_chans=np.arange(0, 4), inplace=False)
+    uv2 = uv_full.select(freq_chans=np.arange(4, uv_full.Nfreqs), inplace=False)
+    uvtest.checkWarnings(uv2.fast_concat, [uv1, 'freq'],
+                         message='Combined frequencies are not evenly spaced')
+
+    # Test failure modes
+    nt.assert_raises(ValueError, uv_full.fast_concat, uv_full, 'foo')
+    nt.assert_raises(ValueError, uv_full.fast_concat, [], 'blt')
+    nt.assert_raises(ValueError, uv_full.fast_concat, uv_full, 'blt')
+    nt.assert_raises(ValueError, uv_full.fast_concat, uv2, 'blt')
+    nt.assert_raises(ValueError, uv_full.fast_concat, 'foo', 'blt')
+
+
 def test_break_add():
     # Test failure modes of add function
     uv_full = UVData()
@@ -1326,6 +1435,115 @@ def test_key2inds():
     nt.assert_true(np.array_equal(ind2, []))
 
 
+def test_antpair_index():
+    # Test the cached index of blt indices for each antenna pair
+    uv = UVData()
+    testfile = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA')
+    uvtest.checkWarnings(uv.read_miriad, [testfile], known_warning='miriad')
+    for ant1 in range(-1, 7):
+        for ant2 in range(-1, 7):
+            bltind = np.where((uv.ant_1_array == ant1) & (uv.ant_2_array == ant2))[0]
+            nt.assert_true(np.array_equal(bltind, uv.antpair2ind(ant1, ant2)))
+
+    # index is rebuilt when the antenna arrays change
+    uv.select(antenna_nums=[0, 1, 3])
+    for ant1, ant2 in uv.get_antpairs():
+        bltind = np.where((uv.ant_1_array == ant1) & (uv.ant_2_array == ant2))[0]
+        nt.assert_true(np.array_equal(bltind, uv.antpair2ind(ant1, ant2)))
+    nt.assert_raises(KeyError, uv._key2inds, (0, 5))
+
+    # and when they are set, but not when they are modified in place
+    ant1, ant2 = uv.ant_1_array[0], uv.ant_2_array[0]
+    ant_2_array = uv.ant_2_array.copy()
+    ant_2_array[0] = 5
+    uv.ant_2_array = ant_2_array
+    nt.assert_false(0 in uv.antpair2ind(ant1, ant2))
+    ind1, ind2, indp = uv._key2inds((ant1, 5))
+    nt.assert_true(np.array_equal([0], ind1))
+
+    blt_ind = np.nonzero((uv.ant_1_array == ant1) & (uv.ant_2_array != 5))[0][0]
+    uv.ant_2_array[blt_ind] = 5
+    nt.assert_true(np.array_equal([0], uv.antpair2ind(ant1, 5)))
+    # setting the array (even to the same object) rebuilds the index
+    uv.ant_2_array = uv.ant_2_array
+    nt.assert_true(np.array_equal([0, blt_ind], uv.antpair2ind(ant1, 5)))
+
+    # in place changes are seen after clearing the caches
+    uv.ant_2_array[0] = ant2
+    nt.assert_true(np.array_equal([0, blt_ind], uv.antpair2ind(ant1, 5)))
+    uv._clear_key_caches()
+    nt.assert_true(np.array_equal([blt_ind], uv.antpair2ind(ant1, 5)))
+    for ant1, ant2 in uv.get_antpairs():
+        bltind = np.where((uv.ant_1_array == ant1) & (uv.ant_2_array == ant2))[0]
+        nt.assert_true(np.array_equal(bltind, uv.antpair2ind(ant1, ant2)))
+
+    # the caches are not copied to new objects from select
+    uv2 = uv.select(blt_inds=np.arange(uv.Nblts), inplace=False)
+    nt.assert_true(uv2._antpair_index_cache is None)
+    nt.assert_true(uv._antpair_index_cache is not None)
+
+    # polarization index is rebuilt when the polarization_array is set
+    uv.polarization_array = np.array([-5])
+    ind1, ind2, indp = uv._key2inds('xx')
+    nt.assert_true(np.array_equal([0], indp))
+    nt.assert_raises(KeyError, uv._key2inds, 'xy')
+    uv.polarization_array[0] = -7
+    nt.assert_raises(KeyError, uv._key2inds, 'xy')
+    uv._clear_key_caches()
+    ind1, ind2, indp = uv._key2inds('xy')
+    nt.assert_true(np.array_equal([0], indp))
+
+    # times for autos
+    nt.assert_true(np.array_equal(uv.time_array[uv.antpair2ind(1, 1)], uv.get_times(1, 1)))
+
+
+def test_reorder_blts():
+    uv1 = UVData()
+    testfile = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA')
+    uvtest.checkWarnings(uv1.read_miriad, [testfile], known_warning='miriad')
+    # avoid warnings about non-contiguous frequencies from floating point errors
+    uv1.channel_width = np.max(np.diff(uv1.freq_array[0, :]))
+
+    # sorting by baseline makes the data for each antenna pair a contiguous view
+    uv2 = copy.deepcopy(uv1)
+    uv2.reorder_blts(order='baseline')
+    nt.assert_equal(uv2.blt_order, ['baseline', 'time'])
+    nt.assert_true(np.all(np.diff(uv2.baseline_array) >= 0))
+    for antpair in uv1.get_antpairs():
+        data = uv2.get_data(antpair)
+        nt.assert_true(data.flags.c_contiguous)
+        nt.assert_false(data.flags.writeable)
+        nt.assert_true(np.array_equal(uv1.get_data(antpair), data))
+        nt.assert_true(np.array_equal(uv1.get_times(antpair), uv2.get_times(antpair)))
+
+    # and back again (the file is already sorted by time and baseline)
+    uv2.reorder_blts(order='time')
+    nt.assert_equal(uv2.blt_order, ['time', 'baseline'])
+    uv2.blt_order = None
+    nt.assert_equal(uv1, uv2)
+
+    # custom orders are not recorded
+    uv2.reorder_blts(order=np.arange(uv2.Nblts)[::-1])
+    nt.assert_true(uv2.blt_order is None)
+    nt.assert_true(np.array_equal(uv1.time_array[::-1], uv2.time_array))
+    nt.assert_true(np.array_equal(uv1.data_array[::-1], uv2.data_array))
+    uv2.reorder_blts(order='time')
+    uv2.blt_order = None
+    nt.assert_equal(uv1, uv2)
+
+    nt.assert_raises(ValueError, uv2.reorder_blts, order='foo')
+    nt.assert_raises(ValueError, uv2.reorder_blts, order=np.arange(uv2.Nblts - 1))
+    nt.assert_raises(ValueError, uv2.reorder_blts, order=np.zeros(uv2.Nblts, dtype=int))
+
+    # combined objects are sorted by time and baseline
+    times = np.unique(uv1.time_array)
+    uv2 = uv1.select(times=times[:10], inplace=False)
+    uv3 = uv1.select(times=times[10:], inplace=False)
+    uv2.reorder_blts(order='baseline')
+    nt.assert_equal((uv2 + uv3).blt_order, ['time', 'baseline'])
+    nt.assert_true(uv2.fast_concat(uv3, 'blt').blt_order is None)
+
+
 def test_smart_slicing():
     # Test function to slice data
     uv = UVData()
@@ -2159,3 +2377,222 @@ def test_juldate2ephem():
 
     nt.assert_almost_equals(date, jul1)
     nt.assert_almost_equals(date, jul2)
+
+
+def test_read_parallel():
+    """Test reading a list of files with several workers."""
+    uv_full = UVData()
+    testfile = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA')
+    uvtest.checkWarnings(uv_full.read_miriad, [testfile],
+                         known_warning='miriad')
+    times = np.unique(uv_full.time_array)
+    uv_full.phase_to_time(times[0])
+    # the zenith parameters are not supported by select
+    uv_full.zenith_ra = None
+    uv_full.zenith_dec = None
+
+    # split along the baseline-time and frequency axes
+    for axis, parts in [('blt', [{'times': t} for t in np.array_split(times, 3)]),
+                        ('freq', [{'freq_chans': c} for c in
+                                  np.array_split(np.arange(uv_full.Nfreqs), 2)])]:
+        uvfits_files = []
+        uvh5_files = []
+        for i, part in enumerate(parts):
+            uv = uv_full.select(inplace=False, **part)
+            # give each file a different history
+            uv.history += ' File number ' + str(i) + '.'
+            uvfits_files.append(os.path.join(DATA_PATH, 'test/outtest_read_parallel_'
+                                             + axis + str(i) + '.uvfits'))
+            uv.write_uvfits(uvfits_files[-1], spoof_nonessential=True)
+            uvh5_files.append(os.path.join(DATA_PATH, 'test/outtest_read_parallel_'
+                                           + axis + str(i) + '.uvh5'))
+            uv.write_uvh5(uvh5_files[-1], clobber=True)
+
+        for file_type, files in [('uvfits', uvfits_files), ('uvh5', uvh5_files)]:
+            uv_seq = UVData()
+            getattr(uv_seq, 'read_' + file_type)(files, polarizations=[-7])
+            uv_par = UVData()
+            uv_par.read(files, n_workers=2, polarizations=[-7])
+            nt.assert_equal(uv_seq, uv_par)
+            nt.assert_equal(type(uv_par.data_array), np.ndarray)
+
+            # file type can also be given explicitly, and the files are
+            # sorted along the axis as adding them would
+            getattr(uv_seq, 'read_' + file_type)(files[::-1], polarizations=[-7])
+            uv_par.read(files[::-1], file_type=file_type, n_workers=2, polarizations=[-7])
+            nt.assert_equal(uv_seq, uv_par)
+
+    # files that differ along more than one axis are added one at a time
+    files = uvh5_files[:2]
+    part_times = np.array_split(times, 2)
+    uv = uv_full.select(times=part_times[0], inplace=False)
+    uv.write_uvh5(files[0], clobber=True)
+    uv = uv_full.select(times=part_times[1], freq_chans=np.arange(uv_full.Nfreqs // 2),
+                        inplace=False)
+    uv.write_uvh5(files[1], clobber=True)
+    uv_seq = UVData()
+    uvtest.checkWarnings(uv_seq.read_uvh5, [files],
+                         message=['Combined frequencies are not contiguous'])
+    uv_par = UVData()
+    uvtest.checkWarnings(uv_par.read, [files], {'n_workers': 2},
+                         message=['Combined frequencies are not contiguous'])
+    nt.assert_equal(uv_seq, uv_par)
+    nt.assert_equal(type(uv_par.data_array), np.ndarray)
+
+    # concatenated baseline-times are sorted as adding the objects would
+    for i in range(2):
+        uv = uv_full.select(times=part_times[i], inplace=False)
+        uv.reorder_blts(order='baseline')
+        uv.write_uvh5(files[i], clobber=True)
+    uv_seq.read_uvh5(files)
+    uv_par.read(files, n_workers=2)
+    nt.assert_equal(uv_seq, uv_par)
+
+    # a single file is read directly
+    uv_par = UVData()
+    uv_par.read(uvh5_files[0], n_workers=2)
+    uv_seq = UVData()
+    uv_seq.read_uvh5(uvh5_files[0])
+    nt.assert_equal(uv_seq, uv_par)
+
+    # miriad files are found from the directory
+    uv = UVData()
+    uvtest.checkWarnings(uv.read, [testfile], known_warning='miriad')
+    nt.assert_equal(uv.Nblts, uv_full.Nblts)
+
+    # warnings raised in the workers are raised here
+    uv_full.telescope_name = 'foo'
+    for i, part_times in enumerate(np.array_split(times, 2)):
+        uv = uv_full.select(times=part_times, inplace=False)
+        uv.write_uvfits(uvfits_files[i], spoof_nonessential=True)
+    uvtest.checkWarnings(uv.read, [uvfits_files[:2]], {'n_workers': 2}, nwarnings=2,
+                         message=['Telescope foo is not'])
+
+    nt.assert_raises(ValueError, uv.read, [])
+    nt.assert_raises(ValueError, uv.read, uvh5_files, n_workers=0)
+    nt.assert_raises(ValueError, uv.read, uvh5_files, file_type='fhd')
+    nt.assert_raises(ValueError, uv.read, uvh5_files + uvfits_files)
+    nt.assert_raises(ValueError, uv.read, os.path.join(DATA_PATH, 'test/outtest.txt'))
+    nt.assert_raises(ValueError, uv.read, uvh5_files, n_workers=2, read_data=False)
+    nt.assert_raises(ValueError, uv.read, uvh5_files, n_workers=2, lazy_data=True)
+
+
+def test_check_only_modified():
+    """Test that consistency checks are redone for modified parameters."""
+    uv = UVData()
+    testfile = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA')
+    uvtest.checkWarnings(uv.read_miriad, [testfile], known_warning='miriad')
+    nt.assert_true(uv.check())
+
+    uv.Nbls += 1
+    nt.assert_raises(ValueError, uv.check, only_modified=True)
+    nt.assert_true(uv.check(check_level='shapes'))
+    # a failed consistency check is redone even if nothing else changed
+    nt.assert_raises(ValueError, uv.check, only_modified=True)
+    uv.Nbls -= 1
+    nt.assert_true(uv.check(only_modified=True))
+
+    # changes in place are seen by the default check
+    uv.time_array[0] = uv.time_array[-1] + 1
+    nt.assert_raises(ValueError, uv.check)
+
+
+def test_select_add_not_inplace_copies():
+    """Test that new objects from select and add do not share arrays with the inputs."""
+    uv = UVData()
+    testfile = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA')
+    uvtest.checkWarnings(uv.read_miriad, [testfile], known_warning='miriad')
+    uv_orig = copy.deepcopy(uv)
+    times = np.unique(uv.time_array)
+
+    uv1 = uv.select(times=times[:5], inplace=False)
+    uv2 = uv.select(times=times[5:], inplace=False)
+    uv3 = uv1 + uv2
+    for uv_new in [uv1, uv2, uv3]:
+        for p in uv_new:
+            value = getattr(uv_new, p).value
+            if isinstance(value, np.ndarray):
+                nt.assert_false(np.may_share_memory(value, getattr(uv, p).value))
+        uv_new.data_array[...] = 0
+        uv_new.antenna_positions[...] = 0
+    nt.assert_equal(uv, uv_orig)
+
+
+def test_data_array_dtype():
+    """Test reading and converting the precision of the data and nsample arrays."""
+    uv = UVData()
+    testfile = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA')
+    for data_dtype, nsample_dtype in [(np.complex64, np.float32),
+                                      (np.complex128, np.float64)]:
+        uvtest.checkWarnings(uv.read_miriad, [testfile], {'data_array_dtype': data_dtype},
+                             known_warning='miriad')
+        nt.assert_equal(uv.data_array.dtype, data_dtype)
+        nt.assert_equal(uv.nsample_array.dtype, nsample_dtype)
+
+    uvfits_file = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAAM.uvfits')
+    uv_in = UVData()
+    uvtest.checkWarnings(uv_in.read_uvfits, [uvfits_file],
+                         {'data_array_dtype': np.complex128}, nwarnings=2,
+                         message=['Required Antenna frame keyword',
+                                  'telescope_location is not set'])
+    nt.assert_equal(uv_in.data_array.dtype, np.complex128)
+    nt.assert_equal(uv_in.nsample_array.dtype, np.float64)
+
+    # select, add and phasing keep the precision
+    uv.set_data_array_dtype(np.complex64)
+    nt.assert_equal(uv.data_array.dtype, np.complex64)
+    nt.assert_equal(uv.nsample_array.dtype, np.float32)
+    times = np.unique(uv.time_array)
+    uv1 = uv.select(times=times[:5], freq_chans=np.arange(5), inplace=False)
+    uv2 = uv.select(times=times[5:], freq_chans=np.arange(5, uv.Nfreqs), inplace=False)
+    uv3 = uvtest.checkWarnings(uv1.__add__, [uv2],
+                               message='Combined frequencies are not contiguous')
+    for uv_new in [uv1, uv3]:
+        nt.assert_equal(uv_new.data_array.dtype, np.complex64)
+        nt.assert_equal(uv_new.nsample_array.dtype, np.float32)
+    uv.phase_to_time(uv.time_array[0])
+    nt.assert_equal(uv.data_array.dtype, np.complex64)
+
+    nt.assert_raises(ValueError, uv.set_data_array_dtype, np.float32)
+    nt.assert_raises(ValueError, uv.set_data_array_dtype, None)
+    nt.assert_raises(ValueError, uv.read_miriad, testfile, data_array_dtype='foo')
+
+
+def test_pack_flags():
+    """Test selecting, adding and getting flags with packed flags."""
+    uv = UVData()
+    testfile = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA')
+    uvtest.checkWarnings(uv.read_miriad, [testfile], known_warning='miriad')
+    uv.flag_array[::3, :, ::2, :] = True
+    uv_full = copy.deepcopy(uv)
+    uv.pack_flags()
+    nt.assert_true(isinstance(uv.flag_array, uvutils._PackedFlags))
+    nt.assert_true(uv.flag_array.nbytes < uv_full.flag_array.nbytes)
+    nt.assert_true(uv.check())
+    nt.assert_equal(uv, uv_full)
+    nt.assert_equal(uv_full, uv)
+    for key in [(0, 1), (1, 0), (0, 1, 'xy'), (2, 2)]:
+        nt.assert_true(np.array_equal(uv.get_flags(key), uv_full.get_flags(key)))
+
+    # select, add and concatenate keep the flags packed
+    times = np.unique(uv.time_array)
+    uv1 = uv.select(times=times[:5], inplace=False)
+    uv2 = uv.select(times=times[5:], inplace=False)
+    nt.assert_true(isinstance(uv1.flag_array, uvutils._PackedFlags))
+    uv3 = uv2 + uv1
+    nt.assert_true(isinstance(uv3.flag_array, uvutils._PackedFlags))
+    uv3.history = uv_full.history
+    nt.assert_equal(uv3, uv_full)
+    uv1 = uv.select(freq_chans=np.arange(5), inplace=False)
+    uv2 = uv.select(freq_chans=np.arange(5, uv.Nfreqs), inplace=False)
+    for uv3 in [uv1 + uv2, uv1.fast_concat(uv2, 'freq')]:
+        nt.assert_true(isinstance(uv3.flag_array, uvutils._PackedFlags))
+        uv3.history = uv_full.history
+        nt.assert_equal(uv3, uv_full)
+
+    uv.reorder_blts('baseline')
+    uv_full.reorder_blts('baseline')
+    nt.assert_equal(uv, uv_full)
+    uv.unpack_flags()
+    nt.assert_true(isinstance(uv.flag_array, np.ndarray))
+    nt.assert_equal(uv, uv_full)
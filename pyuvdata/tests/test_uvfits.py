@@ -1,11 +1,13 @@
 """Tests for UVFITS object."""
 import numpy as np
 import copy
+import io
 import os
 import nose.tools as nt
 import astropy
 from astropy.io import fits
 from pyuvdata import UVData
+from pyuvdata.uvfits import UVFITS
 import pyuvdata.utils as uvutils
 import pyuvdata.tests as uvtest
 from pyuvdata.data import DATA_PATH
@@ -366,6 +368,134 @@ def test_select_read():
     nt.assert_equal(uvfits_uv, uvfits_uv2)
 
 
+def test_get_group_parameters():
+    """
+    Test that reading the group parameters directly matches astropy.
+    """
+    uvfitsfile_no_spw = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAAM.uvfits')
+    hdu_list = fits.open(uvfitsfile_no_spw, memmap=True)
+    vis_hdu = hdu_list[0]
+    uvfits_obj = UVFITS()
+    group_parameters = uvfits_obj._get_group_parameters(vis_hdu)
+    nt.assert_equal(set([name.upper() for name in vis_hdu.data.parnames]),
+                    set(group_parameters.keys()))
+    for name in vis_hdu.data.parnames:
+        nt.assert_true(np.array_equal(vis_hdu.data.par(name), group_parameters[name.upper()]))
+        nt.assert_true(group_parameters[name.upper()].dtype.isnative)
+        nt.assert_equal(np.ndarray, type(group_parameters[name.upper()]))
+
+    # write a file with the date split into two parameters (as in the uvfits
+    # standard), with a scaled fractional day
+    date = vis_hdu.data.par('DATE')
+    parnames = ['UU', 'VV', 'WW', 'DATE', 'DATE', 'BASELINE']
+    pardata = [vis_hdu.data.par(name) for name in parnames[:3]]
+    pardata += [np.floor(date), (date - np.floor(date) - 0.5) * 2., vis_hdu.data.par('BASELINE')]
+    groups_hdu = fits.GroupsHDU(fits.GroupData(vis_hdu.data.data, parnames=parnames,
+                                               pardata=pardata, bitpix=-32))
+    groups_hdu.header['PSCAL5'] = 0.5
+    groups_hdu.header['PZERO5'] = 0.5
+    write_file = os.path.join(DATA_PATH, 'test/outtest_group_parameters.uvfits')
+    if float(astropy.__version__[0:3]) < 1.3:
+        groups_hdu.writeto(write_file, clobber=True)
+    else:
+        groups_hdu.writeto(write_file, overwrite=True)
+    del(hdu_list)
+
+    hdu_list = fits.open(write_file, memmap=True)
+    vis_hdu = hdu_list[0]
+    group_parameters = uvfits_obj._get_group_parameters(vis_hdu)
+    nt.assert_equal(set(['UU', 'VV', 'WW', 'DATE', 'BASELINE']), set(group_parameters.keys()))
+    nt.assert_true(np.array_equal(vis_hdu.data.par('DATE'), group_parameters['DATE']))
+    nt.assert_true(np.array_equal(vis_hdu.data.par('UU'), group_parameters['UU']))
+    nt.assert_true(np.allclose(date, group_parameters['DATE'], rtol=0, atol=1e-6))
+    del(hdu_list)
+
+
+def test_read_metadata_lazy_lsts():
+    """
+    Test that the LSTs are only calculated when the lst_array is accessed.
+    """
+    uvfitsfile_no_spw = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAAM.uvfits')
+    uv_in = UVData()
+    uvtest.checkWarnings(uv_in.read_uvfits, [uvfitsfile_no_spw], {'read_data': False},
+                         known_warning='paper_uvfits')
+    nt.assert_true(getattr(uv_in._lst_array.value, 'is_lazy', False))
+    lst_array = uv_in.lst_array
+    nt.assert_false(getattr(uv_in._lst_array.value, 'is_lazy', False))
+    uv_in.set_lsts_from_time_array()
+    nt.assert_true(np.array_equal(uv_in.lst_array, lst_array))
+
+
+def test_decode_raw_data_chunks():
+    """
+    Test that decoding the raw data in chunks with selections matches select.
+    """
+    uvfitsfile_no_spw = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAAM.uvfits')
+    uv_in = UVData()
+    uvtest.checkWarnings(uv_in.read_uvfits, [uvfitsfile_no_spw],
+                         known_warning='paper_uvfits')
+    hdu_list = fits.open(uvfitsfile_no_spw, memmap=True)
+    raw_data_array = hdu_list[0].data.data[:, 0, 0, np.newaxis, :, :, :]
+
+    uvfits_obj = UVFITS()
+    for blt_inds, freq_inds in [(None, None), (np.arange(0, uv_in.Nblts, 3), None),
+                                (None, np.array([5, 1, 4])),
+                                (np.array([10, 2, 2, 40]), np.array([0, 10]))]:
+        uvfits_obj._decode_raw_data(raw_data_array, blt_inds, freq_inds, None,
+                                    blt_chunk_size=7)
+        data_array, flag_array, nsample_array = (uv_in.data_array, uv_in.flag_array,
+                                                 uv_in.nsample_array)
+        if blt_inds is not None:
+            data_array, flag_array, nsample_array = (data_array[blt_inds], flag_array[blt_inds],
+                                                     nsample_array[blt_inds])
+        if freq_inds is not None:
+            data_array, flag_array, nsample_array = (data_array[:, :, freq_inds],
+                                                     flag_array[:, :, freq_inds],
+                                                     nsample_array[:, :, freq_inds])
+        # the dtypes are native, as when the whole array was decoded at once
+        nt.assert_equal(uvfits_obj.data_array.dtype, np.dtype(np.complex64))
+        nt.assert_equal(uvfits_obj.nsample_array.dtype, np.dtype(np.float32))
+        nt.assert_true(uvfits_obj.data_array.dtype.isnative)
+        nt.assert_true(uvfits_obj.nsample_array.dtype.isnative)
+        nt.assert_true(np.array_equal(data_array, uvfits_obj.data_array))
+        nt.assert_true(np.array_equal(flag_array, uvfits_obj.flag_array))
+        nt.assert_true(np.array_equal(nsample_array, uvfits_obj.nsample_array))
+    del(hdu_list)
+
+
+def test_write_groups_chunks():
+    """
+    Test that writing the uvfits groups in chunks gives the expected groups.
+    """
+    uvfitsfile_no_spw = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAAM.uvfits')
+    uv_in = UVData()
+    uvtest.checkWarnings(uv_in.read_uvfits, [uvfitsfile_no_spw],
+                         known_warning='paper_uvfits')
+    uv_in.flag_array[::3] = True
+    uvfits_obj = uv_in._convert_to_filetype('uvfits')
+    group_parameter_list = [uv_in.ant_1_array, uv_in.ant_2_array + 0.5]
+
+    fileobj = io.BytesIO()
+    uvfits_obj._write_groups(fileobj, group_parameter_list)
+    groups_bytes = fileobj.getvalue()
+    nt.assert_equal(0, len(groups_bytes) % 2880)
+
+    fileobj = io.BytesIO()
+    uvfits_obj._write_groups(fileobj, group_parameter_list, blt_chunk_size=7)
+    nt.assert_equal(groups_bytes, fileobj.getvalue())
+
+    group_size = 2 + uv_in.Nfreqs * uv_in.Npols * 3
+    groups = np.frombuffer(groups_bytes, dtype='>f4')[:uv_in.Nblts * group_size]
+    groups = groups.reshape(uv_in.Nblts, group_size)
+    nt.assert_true(np.array_equal(uv_in.ant_1_array, groups[:, 0]))
+    nt.assert_true(np.array_equal(uv_in.ant_2_array + 0.5, groups[:, 1]))
+    group_data = groups[:, 2:].reshape(uv_in.Nblts, 1, uv_in.Nfreqs, uv_in.Npols, 3)
+    nt.assert_true(np.array_equal(np.conj(uv_in.data_array),
+                                  group_data[..., 0] + 1j * group_data[..., 1]))
+    nt.assert_true(np.array_equal(uv_in.flag_array, group_data[..., 2] <= 0))
+    nt.assert_true(np.array_equal(uv_in.nsample_array, np.abs(group_data[..., 2])))
+
+
 def test_ReadUVFitsWriteMiriad():
     """
     read uvfits, write miriad test.
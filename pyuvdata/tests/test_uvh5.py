@@ -99,6 +99,7 @@ def test_UVH5OptionalParameters():
     uv_in.x_orientation = 'east'
     uv_in.antenna_diameters = np.ones_like(uv_in.antenna_numbers) * 1.
     uv_in.uvplane_reference_time = 0
+    uv_in.reorder_blts(order='baseline')
 
     # write out and read back in
     uv_in.write_uvh5(testfile, clobber=True)
@@ -109,3 +110,423 @@ def test_UVH5OptionalParameters():
     os.remove(testfile)
 
     return
+
+
+def test_UVH5ReadSelect():
+    """
+    Test select on read for uvh5 files
+    """
+    uv_in = UVData()
+    uv_out = UVData()
+    miriad_file = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA')
+    testfile = os.path.join(DATA_PATH, 'test', 'outtest_miriad.h5')
+    uvtest.checkWarnings(uv_in.read_miriad, [miriad_file],
+                         nwarnings=1, category=[UserWarning],
+                         message=['Altitude is not present'])
+    uv_in.write_uvh5(testfile, clobber=True)
+
+    # select on baseline-times (regularly spaced and irregularly spaced)
+    for blt_inds in [np.arange(0, uv_in.Nblts, 3), [0, 1, 5, 20, 33, 100]]:
+        uv_out.read_uvh5(testfile, blt_inds=blt_inds)
+        uv_sel = uv_in.select(blt_inds=blt_inds, inplace=False)
+        nt.assert_equal(uv_sel, uv_out)
+
+    # select on antennas
+    ants_to_keep = np.array([0, 2, 5])
+    uv_out.read_uvh5(testfile, antenna_nums=ants_to_keep)
+    uv_sel = uv_in.select(antenna_nums=ants_to_keep, inplace=False)
+    nt.assert_equal(uv_sel, uv_out)
+
+    # select on antenna pairs
+    ant_pairs = [(0, 1), (3, 5), (1, 4)]
+    uv_out.read_uvh5(testfile, ant_pairs_nums=ant_pairs)
+    uv_sel = uv_in.select(ant_pairs_nums=ant_pairs, inplace=False)
+    nt.assert_equal(uv_sel, uv_out)
+
+    # select on times
+    unique_times = np.unique(uv_in.time_array)
+    times_to_keep = unique_times[[0, 4, 5, 11]]
+    uv_out.read_uvh5(testfile, times=times_to_keep)
+    uv_sel = uv_in.select(times=times_to_keep, inplace=False)
+    nt.assert_equal(uv_sel, uv_out)
+
+    # select on frequencies (contiguous and irregularly spaced)
+    freq_chans = np.arange(2, 7)
+    uv_out.read_uvh5(testfile, freq_chans=freq_chans)
+    uv_sel = uv_in.select(freq_chans=freq_chans, inplace=False)
+    nt.assert_equal(uv_sel, uv_out)
+
+    freqs_to_keep = uv_in.freq_array[0, [0, 1, 5, 6]]
+    uvtest.checkWarnings(uv_out.read_uvh5, [testfile], {'frequencies': freqs_to_keep},
+                         message='Selected frequencies are not evenly spaced')
+    uv_sel = uvtest.checkWarnings(uv_in.select, [], {'frequencies': freqs_to_keep,
+                                                     'inplace': False},
+                                  message='Selected frequencies are not evenly spaced')
+    nt.assert_equal(uv_sel, uv_out)
+
+    # select on polarizations
+    uv_out.read_uvh5(testfile, polarizations=uv_in.polarization_array)
+    uv_sel = uv_in.select(polarizations=uv_in.polarization_array, inplace=False)
+    nt.assert_equal(uv_sel, uv_out)
+
+    # irregular selections on more than one axis
+    blt_inds = [0, 2, 3, 17, 50, 51, 300]
+    freq_chans = [0, 3, 4, 10]
+    uvtest.checkWarnings(uv_out.read_uvh5, [testfile], {'blt_inds': blt_inds,
+                                                        'freq_chans': freq_chans},
+                         message='Selected frequencies are not evenly spaced')
+    uv_sel = uvtest.checkWarnings(uv_in.select, [], {'blt_inds': blt_inds,
+                                                     'freq_chans': freq_chans,
+                                                     'inplace': False},
+                                  message='Selected frequencies are not evenly spaced')
+    nt.assert_equal(uv_sel, uv_out)
+
+    # check that selections that match no data raise errors
+    nt.assert_raises(ValueError, uv_out.read_uvh5, testfile, antenna_nums=[100])
+
+    # clean up
+    os.remove(testfile)
+
+    return
+
+
+def test_UVH5ReadMetadataOnly():
+    """
+    Test reading just the header of a uvh5 file
+    """
+    uv_in = UVData()
+    uv_out = UVData()
+    miriad_file = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA')
+    testfile = os.path.join(DATA_PATH, 'test', 'outtest_miriad.h5')
+    uvtest.checkWarnings(uv_in.read_miriad, [miriad_file],
+                         nwarnings=1, category=[UserWarning],
+                         message=['Altitude is not present'])
+    uv_in.write_uvh5(testfile, clobber=True)
+
+    uv_out.read_uvh5(testfile, read_data=False)
+    nt.assert_true(uv_out.data_array is None)
+    nt.assert_true(uv_out.flag_array is None)
+    nt.assert_true(uv_out.nsample_array is None)
+    nt.assert_raises(ValueError, uv_out.check)
+    nt.assert_true(np.all(uv_in.time_array == uv_out.time_array))
+    nt.assert_true(np.all(uv_in.baseline_array == uv_out.baseline_array))
+    nt.assert_true(np.all(uv_in.freq_array == uv_out.freq_array))
+
+    # metadata only cannot be used with a list of files
+    nt.assert_raises(ValueError, uv_out.read_uvh5, [testfile, testfile],
+                     read_data=False)
+
+    # add the data and check that the objects match
+    uv_out.data_array = uv_in.data_array
+    uv_out.flag_array = uv_in.flag_array
+    uv_out.nsample_array = uv_in.nsample_array
+    nt.assert_equal(uv_in, uv_out)
+
+    # clean up
+    os.remove(testfile)
+
+    return
+
+
+def test_UVH5ReadLazyData():
+    """
+    Test deferring the data read for uvh5 files
+    """
+    uv_in = UVData()
+    uv_out = UVData()
+    miriad_file = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA')
+    testfile = os.path.join(DATA_PATH, 'test', 'outtest_miriad.h5')
+    uvtest.checkWarnings(uv_in.read_miriad, [miriad_file],
+                         nwarnings=1, category=[UserWarning],
+                         message=['Altitude is not present'])
+    uv_in.write_uvh5(testfile, clobber=True)
+
+    # get_data etc. only read the requested data
+    uv_out.read_uvh5(testfile, lazy_data=True)
+    nt.assert_true(uv_out._data_array.value.is_lazy)
+    nt.assert_equal(uv_out._data_array.value.shape, uv_in.data_array.shape)
+    for key in [(0, 1), (1, 0), (0, 1, 'xy'), (2, 2)]:
+        nt.assert_true(np.all(uv_in.get_data(key) == uv_out.get_data(key)))
+        nt.assert_true(np.all(uv_in.get_flags(key) == uv_out.get_flags(key)))
+        nt.assert_true(np.all(uv_in.get_nsamples(key) == uv_out.get_nsamples(key)))
+    nt.assert_true(uv_out._data_array.value.is_lazy)
+
+    # data are read in on access
+    nt.assert_true(np.all(uv_in.data_array == uv_out.data_array))
+    nt.assert_true(isinstance(uv_out._data_array.value, np.ndarray))
+    nt.assert_true(uv_out._flag_array.value.is_lazy)
+    nt.assert_equal(uv_in, uv_out)
+    nt.assert_true(isinstance(uv_out._flag_array.value, np.ndarray))
+
+    # lazy reads with a selection
+    ant_pairs = [(0, 1), (3, 5), (1, 4)]
+    freq_chans = [0, 3, 4, 8]
+    uv_out.read_uvh5(testfile, ant_pairs_nums=ant_pairs, freq_chans=freq_chans,
+                     lazy_data=True)
+    uv_sel = uv_in.select(ant_pairs_nums=ant_pairs, freq_chans=freq_chans,
+                          inplace=False)
+    nt.assert_true(np.all(uv_sel.get_data(3, 5) == uv_out.get_data(3, 5)))
+    nt.assert_true(np.all(uv_sel.get_flags(4, 1) == uv_out.get_flags(4, 1)))
+    nt.assert_equal(uv_sel, uv_out)
+
+    # clean up
+    os.remove(testfile)
+
+    return
+
+
+def test_UVH5CompressionChunks():
+    """
+    Test writing uvh5 files with compression filters and chunk shapes
+    """
+    import h5py
+    uv_in = UVData()
+    uv_out = UVData()
+    miriad_file = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA')
+    testfile = os.path.join(DATA_PATH, 'test', 'outtest_miriad.h5')
+    uvtest.checkWarnings(uv_in.read_miriad, [miriad_file],
+                         nwarnings=1, category=[UserWarning],
+                         message=['Altitude is not present'])
+
+    uv_in.write_uvh5(testfile, clobber=True, chunks=(1, 1, None, 1),
+                     data_compression=('gzip', 9), flags_compression='lzf',
+                     nsample_compression='lzf')
+    with h5py.File(testfile, 'r') as f:
+        nt.assert_equal(f['/Data/visdata'].chunks, (1, 1, uv_in.Nfreqs, 1))
+        nt.assert_equal(f['/Data/visdata'].compression, 'gzip')
+        nt.assert_equal(f['/Data/visdata'].compression_opts, 9)
+        nt.assert_equal(f['/Data/flags'].compression, 'lzf')
+        nt.assert_equal(f['/Data/nsample_array'].compression, 'lzf')
+    uv_out.read_uvh5(testfile)
+    nt.assert_equal(uv_in, uv_out)
+
+    # chunks larger than the data are clipped to the data shape
+    uv_in.write_uvh5(testfile, clobber=True, chunks=(uv_in.Nblts + 10, 1, 4, 1))
+    with h5py.File(testfile, 'r') as f:
+        nt.assert_equal(f['/Data/visdata'].chunks, (uv_in.Nblts, 1, 4, 1))
+        nt.assert_true(f['/Data/visdata'].compression is None)
+    uv_out.read_uvh5(testfile)
+    nt.assert_equal(uv_in, uv_out)
+
+    # contiguous datasets
+    uv_in.write_uvh5(testfile, clobber=True, chunks=None)
+    with h5py.File(testfile, 'r') as f:
+        nt.assert_true(f['/Data/visdata'].chunks is None)
+    uv_out.read_uvh5(testfile)
+    nt.assert_equal(uv_in, uv_out)
+
+    # test errors
+    nt.assert_raises(ValueError, uv_in.write_uvh5, testfile, clobber=True,
+                     chunks=(1, 1, 1))
+    nt.assert_raises(ValueError, uv_in.write_uvh5, testfile, clobber=True,
+                     chunks=None, data_compression='lzf')
+    nt.assert_raises(ValueError, uv_in.write_uvh5, testfile, clobber=True,
+                     data_compression=('gzip', 9, 1))
+    nt.assert_raises(ValueError, uv_in.write_uvh5, testfile, clobber=True,
+                     data_compression=['lzf'])
+
+    # clean up
+    os.remove(testfile)
+
+    return
+
+
+def test_UVH5PartialWrite():
+    """
+    Test writing parts of a preallocated uvh5 file
+    """
+    uv_in = UVData()
+    uv_out = UVData()
+    miriad_file = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA')
+    testfile = os.path.join(DATA_PATH, 'test', 'outtest_partial.h5')
+    uvtest.checkWarnings(uv_in.read_miriad, [miriad_file],
+                         nwarnings=1, category=[UserWarning],
+                         message=['Altitude is not present'])
+
+    # the file can be initialized from the metadata only
+    uv_meta = copy.deepcopy(uv_in)
+    uv_meta.data_array = None
+    uv_meta.flag_array = None
+    uv_meta.nsample_array = None
+    uv_meta.initialize_uvh5_file(testfile, clobber=True, chunks=(1, 1, None, 1))
+    nt.assert_raises(ValueError, uv_meta.initialize_uvh5_file, testfile)
+    uv_out.read_uvh5(testfile)
+    nt.assert_true(np.all(uv_out.data_array == 0))
+    nt.assert_false(np.any(uv_out.flag_array))
+
+    # write one time at a time
+    for time in np.unique(uv_in.time_array):
+        uv_part = uv_in.select(times=[time], inplace=False)
+        uv_meta.write_uvh5_part(testfile, uv_part.data_array, uv_part.flag_array,
+                                uv_part.nsample_array, times=[time])
+    uv_out.read_uvh5(testfile)
+    nt.assert_equal(uv_in, uv_out)
+
+    # write parts with irregular baseline-times and frequencies
+    uv_meta.initialize_uvh5_file(testfile, clobber=True)
+    freq_chans = [0, 1, 4, 7]
+    other_chans = [c for c in range(uv_in.Nfreqs) if c not in freq_chans]
+    for ant_pairs in [[(0, 1), (3, 5)], [p for p in uv_in.get_antpairs()
+                                         if p not in [(0, 1), (3, 5)]]]:
+        for chans in [freq_chans, other_chans]:
+            uv_part = uv_in.select(ant_pairs_nums=ant_pairs, freq_chans=chans,
+                                   inplace=False)
+            uv_meta.write_uvh5_part(testfile, uv_part.data_array, uv_part.flag_array,
+                                    uv_part.nsample_array, ant_pairs_nums=ant_pairs,
+                                    freq_chans=chans)
+    uv_out.read_uvh5(testfile)
+    nt.assert_equal(uv_in, uv_out)
+
+    # test errors
+    uv_part = uv_in.select(times=np.unique(uv_in.time_array)[0], inplace=False)
+    nt.assert_raises(ValueError, uv_meta.write_uvh5_part, testfile,
+                     uv_part.data_array, uv_part.flag_array, uv_part.nsample_array,
+                     times=np.unique(uv_in.time_array)[:2])
+    uv_bad = copy.deepcopy(uv_meta)
+    uv_bad.freq_array = uv_bad.freq_array + 1e6
+    nt.assert_raises(ValueError, uv_bad.write_uvh5_part, testfile,
+                     uv_part.data_array, uv_part.flag_array, uv_part.nsample_array,
+                     times=np.unique(uv_in.time_array)[0])
+    os.remove(testfile)
+    nt.assert_raises(IOError, uv_meta.write_uvh5_part, testfile,
+                     uv_part.data_array, uv_part.flag_array, uv_part.nsample_array,
+                     times=np.unique(uv_in.time_array)[0])
+
+    return
+
+
+def test_UVH5ScaledIntegerData():
+    """
+    Test storing visibilities as scaled integers in uvh5 files
+    """
+    import h5py
+    uv_in = UVData()
+    uv_out = UVData()
+    miriad_file = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA')
+    testfile = os.path.join(DATA_PATH, 'test', 'outtest_miriad.h5')
+    uvtest.checkWarnings(uv_in.read_miriad, [miriad_file],
+                         nwarnings=1, category=[UserWarning],
+                         message=['Altitude is not present'])
+
+    for int_dtype in [np.int16, np.int32]:
+        uv_in.write_uvh5(testfile, clobber=True, data_write_dtype=int_dtype)
+        with h5py.File(testfile, 'r') as f:
+            visdata = f['/Data/visdata']
+            nt.assert_equal(visdata.dtype.names, ('r', 'i'))
+            nt.assert_equal(visdata.dtype['r'], np.dtype(int_dtype))
+            scale = visdata.attrs['scale_factor']
+        # rounding to integers and single precision both limit the accuracy
+        atol = scale + np.finfo(np.float32).eps * np.max(np.abs(uv_in.data_array))
+
+        # the data are promoted to complex64 by default
+        uv_out.read_uvh5(testfile)
+        nt.assert_equal(uv_out.data_array.dtype, np.complex64)
+        nt.assert_true(np.allclose(uv_in.data_array, uv_out.data_array,
+                                   rtol=0, atol=atol))
+        uv_out.data_array = uv_in.data_array
+        nt.assert_equal(uv_in, uv_out)
+
+        uv_out.read_uvh5(testfile, data_array_dtype=np.complex128, freq_chans=[1, 2, 3])
+        nt.assert_equal(uv_out.data_array.dtype, np.complex128)
+        uv_sel = uv_in.select(freq_chans=[1, 2, 3], inplace=False)
+        nt.assert_true(np.allclose(uv_sel.data_array, uv_out.data_array,
+                                   rtol=0, atol=atol))
+
+        # raw integers, also when lazily loaded
+        uv_out.read_uvh5(testfile, data_array_dtype='raw')
+        nt.assert_equal(uv_out.data_array.dtype.names, ('r', 'i'))
+        nt.assert_true(np.allclose(uv_out.data_array['r'] * scale,
+                                   uv_in.data_array.real, rtol=0, atol=atol))
+        uv_out.read_uvh5(testfile, lazy_data=True)
+        nt.assert_equal(uv_out._data_array.value.dtype, np.complex64)
+        nt.assert_true(np.allclose(uv_in.get_data(0, 1), uv_out.get_data(0, 1),
+                                   rtol=0, atol=atol))
+
+    # specified scale factor, values outside the integer range are clipped
+    uv_in.write_uvh5(testfile, clobber=True, data_write_dtype=np.int16,
+                     data_scale=1e-6)
+    uv_out.read_uvh5(testfile, data_array_dtype='raw')
+    nt.assert_equal(np.max(np.abs(uv_out.data_array['r'])), np.iinfo(np.int16).max)
+
+    # partial writes are converted to the on-disk type
+    uv_in.initialize_uvh5_file(testfile, clobber=True, data_write_dtype=np.int32)
+    for time in np.unique(uv_in.time_array):
+        uv_part = uv_in.select(times=[time], inplace=False)
+        uv_in.write_uvh5_part(testfile, uv_part.data_array, uv_part.flag_array,
+                              uv_part.nsample_array, times=[time])
+    with h5py.File(testfile, 'r') as f:
+        scale = f['/Data/visdata'].attrs['scale_factor']
+    uv_out.read_uvh5(testfile, data_array_dtype=np.complex128)
+    nt.assert_true(np.allclose(uv_in.data_array, uv_out.data_array,
+                               rtol=0, atol=scale))
+
+    # test errors
+    nt.assert_raises(ValueError, uv_in.write_uvh5, testfile, clobber=True,
+                     data_write_dtype=np.float32)
+    nt.assert_raises(ValueError, uv_in.write_uvh5, testfile, clobber=True,
+                     data_write_dtype=np.int16, data_scale=-1)
+    nt.assert_raises(ValueError, uv_out.read_uvh5, testfile,
+                     data_array_dtype=np.float64)
+
+    # clean up
+    os.remove(testfile)
+
+    return
+
+
+def test_UVH5PackedFlags():
+    """
+    Test writing and reading packed flags in uvh5 files
+    """
+    uv_in = UVData()
+    uv_out = UVData()
+    miriad_file = os.path.join(DATA_PATH, 'zen.2456865.60537.xy.uvcRREAA')
+    testfile = os.path.join(DATA_PATH, 'test', 'outtest_miriad.h5')
+    uvtest.checkWarnings(uv_in.read_miriad, [miriad_file],
+                         nwarnings=1, category=[UserWarning],
+                         message=['Altitude is not present'])
+    uv_in.flag_array[::3, :, ::2, :] = True
+    uv_in.write_uvh5(testfile, clobber=True, pack_flags=True)
+    import h5py
+    with h5py.File(testfile, 'r') as f:
+        nt.assert_equal(f['/Data/flags'].dtype, np.uint8)
+        nt.assert_equal(tuple(f['/Data/flags'].attrs['packed_shape']),
+                        uv_in.flag_array.shape)
+
+    # packed flags are unpacked unless asked for
+    uv_out.read_uvh5(testfile)
+    nt.assert_true(isinstance(uv_out.flag_array, np.ndarray))
+    nt.assert_equal(uv_in, uv_out)
+    uv_out.read_uvh5(testfile, pack_flags=True)
+    nt.assert_true(isinstance(uv_out.flag_array, uvutils._PackedFlags))
+    nt.assert_equal(uv_in, uv_out)
+
+    # reads with a selection, also lazy ones
+    ant_pairs = [(0, 1), (3, 5), (1, 4)]
+    freq_chans = [0, 3, 4, 8]
+    uv_sel = uv_in.select(ant_pairs_nums=ant_pairs, freq_chans=freq_chans,
+                          inplace=False)
+    for lazy_data in [False, True]:
+        uv_out.read_uvh5(testfile, ant_pairs_nums=ant_pairs, freq_chans=freq_chans,
+                         lazy_data=lazy_data, pack_flags=True)
+        nt.assert_true(isinstance(uv_out._flag_array.value, uvutils._PackedFlags))
+        nt.assert_true(np.all(uv_sel.get_flags(4, 1) == uv_out.get_flags(4, 1)))
+        nt.assert_equal(uv_sel, uv_out)
+
+    # packed flags on the object are written packed or unpacked
+    uv_in.pack_flags()
+    uv_in.write_uvh5(testfile, clobber=True, chunks=(10, 1, 4, 1))
+    uv_out.read_uvh5(testfile, pack_flags=True)
+    nt.assert_equal(uv_in, uv_out)
+    uv_in.write_uvh5(testfile, clobber=True, chunks=(10, 1, 4, 1), pack_flags=True)
+    uv_out.read_uvh5(testfile)
+    nt.assert_equal(uv_in, uv_out)
+
+    # partial writes are not supported for packed flags
+    nt.assert_raises(ValueError, uv_out.write_uvh5_part, testfile, uv_out.data_array,
+                     uv_out.flag_array, uv_out.nsample_array)
+
+    # clean up
+    os.remove(testfile)
+
+    return
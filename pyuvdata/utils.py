@@ -2,6 +2,7 @@
 import numpy as np
 import collections
 import warnings
+from astropy.time import Time
 
 # parameters for transforming between xyz & lat/lon/alt
 gps_b = 6356752.31424518
@@ -9,6 +10,11 @@ gps_a = 6378137
 e_squared = 6.69437999014e-3
 e_prime_squared = 6.73949674228e-3
 
+# maximum number of entries in the process-wide LST cache (0 turns off caching)
+lst_cache_size = 100000
+# LSTs keyed on (JD, latitude, longitude, altitude), least recently used first
+_lst_cache = collections.OrderedDict()
+
 
 def LatLonAlt_from_XYZ(xyz):
     """
@@ -252,6 +258,319 @@ def top2eq_m(ha, dec):
     return mat
 
 
+def get_lst_for_time(jd_array, latitude, longitude, altitude, use_cache=True):
+    """
+    Get the apparent local sidereal times for an array of Julian dates.
+
+    The LSTs are calculated for all the unique Julian dates at once. They are
+    also stored in a process-wide least recently used cache (of up to
+    lst_cache_size entries) keyed on the Julian date and telescope location,
+    so repeated reads of files from the same night don't recompute them.
+
+    Args:
+        jd_array: array of Julian dates
+        latitude: latitude of the telescope in degrees
+        longitude: longitude of the telescope in degrees
+        altitude: altitude of the telescope in meters
+        use_cache: Option to look up and store the LSTs in the cache.
+            Default is True.
+
+    Returns:
+        array of LSTs in radians, same shape as jd_array
+    """
+    jd_array = np.asarray(jd_array)
+    unique_jds, inverse = np.unique(jd_array, return_inverse=True)
+    lsts = np.zeros(unique_jds.shape, dtype=np.float64)
+
+    use_cache = use_cache and lst_cache_size > 0
+    missing = np.ones(unique_jds.shape, dtype=np.bool)
+    if use_cache:
+        location = (float(latitude), float(longitude), float(altitude))
+        keys = [(jd,) + location for jd in unique_jds.tolist()]
+        for ind, key in enumerate(keys):
+            lst = _lst_cache.pop(key, None)
+            if lst is not None:
+                # re-insert to mark as most recently used
+                _lst_cache[key] = lst
+                lsts[ind] = lst
+                missing[ind] = False
+
+    if np.any(missing):
+        t = Time(unique_jds[missing], format='jd', location=(longitude, latitude))
+        lsts[missing] = t.sidereal_time('apparent').radian
+        if use_cache:
+            for ind in np.nonzero(missing)[0]:
+                _lst_cache[keys[ind]] = lsts[ind]
+            while len(_lst_cache) > lst_cache_size:
+                _lst_cache.popitem(last=False)
+
+    return lsts[inverse].reshape(jd_array.shape)
+
+
+class _LazyLSTs(object):
+    """
+    Local sidereal times that are only calculated when they are first needed.
+
+    Used as the value of the lst_array UVParameter. The LSTs are calculated
+    with get_lst_for_time by the load method, which is called on first access
+    of the associated UVData attribute.
+
+    Args:
+        jd_array: array of Julian dates
+        latitude: latitude of the telescope in degrees
+        longitude: longitude of the telescope in degrees
+        altitude: altitude of the telescope in meters
+    """
+
+    is_lazy = True
+
+    def __init__(self, jd_array, latitude, longitude, altitude):
+        self.jd_array = np.array(jd_array)
+        self.location = (latitude, longitude, altitude)
+        self.dtype = np.dtype(np.float64)
+        self.shape = self.jd_array.shape
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return self.jd_array.size
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, key):
+        return get_lst_for_time(self.jd_array[key], *self.location)
+
+    def __array__(self, dtype=None):
+        lsts = self.load()
+        if dtype is not None:
+            lsts = lsts.astype(dtype)
+        return lsts
+
+    def item(self, index):
+        """Calculate a single LST, indexed as in the flattened array."""
+        return get_lst_for_time(self.jd_array.flat[index], *self.location).item()
+
+    def load(self):
+        """Calculate all the LSTs."""
+        return get_lst_for_time(self.jd_array, *self.location)
+
+
+class _PackedFlags(object):
+    """
+    Boolean flags stored as packed bits, 8 flags per byte.
+
+    Used as the value of flag_array UVParameters. The flags are packed
+    separately for each index along the first axis (the baseline-time axis for
+    UVData, the antenna axis for UVCal), so selecting, reordering and
+    concatenating along that axis work on the packed bytes directly. Indexing
+    returns unpacked boolean arrays (only unpacking the indexed rows), so the
+    object can be used much like a boolean array. Use np.asarray to get the
+    full boolean array.
+
+    Args:
+        flags: boolean array to pack.
+    """
+
+    # number of flags to unpack at a time when working on axes other than the first
+    block_flags = 2**24
+
+    def __init__(self, flags):
+        flags = np.asarray(flags, dtype=np.bool)
+        if flags.ndim < 1:
+            raise ValueError('flags must have at least one dimension')
+        self.shape = flags.shape
+        self.dtype = np.dtype(np.bool)
+        self.packed = np.packbits(flags.reshape(self.shape[0], self._row_size), axis=1)
+
+    @classmethod
+    def _from_packed(cls, packed, shape):
+        """Make an object from packed bytes (one row per index on the first axis)."""
+        new = cls.__new__(cls)
+        new.shape = tuple(shape)
+        new.dtype = np.dtype(np.bool)
+        new.packed = packed
+        return new
+
+    @property
+    def _row_size(self):
+        return int(np.prod(self.shape[1:]))
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    @property
+    def nbytes(self):
+        return self.packed.nbytes
+
+    def __len__(self):
+        return self.shape[0]
+
+    def unpack(self, rows=None):
+        """
+        Unpack the flags.
+
+        Args:
+            rows: Optional index (slice, index array or boolean mask) on the
+                first axis, only these rows are unpacked.
+
+        Returns:
+            boolean array of flags.
+        """
+        packed = self.packed if rows is None else self.packed[rows]
+        flags = np.unpackbits(packed, axis=1)[:, :self._row_size].view(np.bool)
+        return flags.reshape((packed.shape[0],) + self.shape[1:])
+
+    def __array__(self, dtype=None):
+        flags = self.unpack()
+        if dtype is not None:
+            flags = flags.astype(dtype)
+        return flags
+
+    def astype(self, dtype):
+        """Unpack the flags to an array of the given type."""
+        return self.unpack().astype(dtype)
+
+    def copy(self):
+        return self._from_packed(self.packed.copy(), self.shape)
+
+    def item(self, index):
+        """Get a single flag, indexed as in the flattened array."""
+        row, bit = divmod(index, self._row_size)
+        return bool(self.packed[row, bit // 8] & (128 >> (bit % 8)))
+
+    def _split_key(self, key):
+        """
+        Split an index into the index on the first axis and the index on the
+        unpacked rows, or return None if the index must be applied to the full array.
+        """
+        if not isinstance(key, tuple):
+            key = (key,)
+        if any(k is Ellipsis or k is None for k in key) or len(key) > self.ndim:
+            return None
+        if (len(key) == self.ndim and len(key) > 1
+                and all(isinstance(k, np.ndarray) and k.shape == tuple(
+                    k.size if axis == i else 1 for axis in range(self.ndim))
+                    for i, k in enumerate(key))):
+            # open mesh from np.ix_
+            rows = key[0].ravel()
+            return rows, np.ix_(np.arange(len(rows)), *[k.ravel() for k in key[1:]])
+        row_key, rest = key[0], key[1:]
+        if isinstance(row_key, slice):
+            return row_key, (slice(None),) + rest
+        if np.ndim(row_key) == 0:
+            return [row_key], (0,) + rest
+        if np.ndim(row_key) > 1 or any(np.ndim(k) > 0 for k in rest):
+            # several index arrays are broadcast against each other
+            return None
+        return row_key, (slice(None),) + rest
+
+    def __getitem__(self, key):
+        split = self._split_key(key)
+        if split is None:
+            return self.unpack()[key]
+        rows, rest = split
+        return self.unpack(rows)[rest]
+
+    def __setitem__(self, key, value):
+        split = self._split_key(key)
+        if split is None:
+            flags = self.unpack()
+            flags[key] = value
+            self.packed = _PackedFlags(flags).packed
+            return
+        rows, rest = split
+        whole_rows = all((isinstance(k, slice) and k == slice(None))
+                         or (isinstance(k, np.ndarray)
+                             and np.array_equal(k.ravel(), np.arange(n)))
+                         for k, n in zip(rest[1:], self.shape[1:]))
+        if (whole_rows and isinstance(value, _PackedFlags)
+                and value.shape[1:] == self.shape[1:]):
+            # copy the packed bytes directly
+            self.packed[rows] = value.packed
+            return
+        flags = self.unpack(rows)
+        flags[rest] = value
+        self.packed[rows] = np.packbits(flags.reshape(flags.shape[0], self._row_size), axis=1)
+
+    def _map_rows(self, func):
+        """
+        Apply a function to blocks of the unpacked rows and pack the results,
+        so the full unpacked array is never held in memory. The function is
+        called with the unpacked rows and the slice of the rows on the first axis.
+        """
+        block_rows = max(1, self.block_flags // max(self._row_size, 1))
+        shape = func(self.unpack(slice(0, 0)), slice(0, 0)).shape
+        packed = []
+        for start in range(0, self.shape[0], block_rows):
+            rows = slice(start, start + block_rows)
+            flags = func(self.unpack(rows), rows)
+            packed.append(np.packbits(flags.reshape(flags.shape[0], -1), axis=1))
+        if len(packed) == 0:
+            return _PackedFlags(np.zeros(shape, dtype=np.bool))
+        return self._from_packed(np.concatenate(packed, axis=0),
+                                 (self.shape[0],) + shape[1:])
+
+    def take(self, indices, axis=None, out=None, mode='raise'):
+        """Take elements along an axis, like np.take (the result is packed)."""
+        if out is not None:
+            raise ValueError('out is not supported for packed flags')
+        if axis is None:
+            return np.take(self.unpack(), indices, mode=mode)
+        if axis < 0:
+            axis += self.ndim
+        if axis == 0:
+            return self._from_packed(np.take(self.packed, indices, axis=0, mode=mode),
+                                     (len(indices),) + self.shape[1:])
+        return self._map_rows(lambda flags, rows: np.take(flags, indices, axis=axis, mode=mode))
+
+
+def _concatenate_flags(flag_arrays, axis):
+    """
+    Concatenate flag arrays that may be packed (see _PackedFlags).
+
+    The result is packed if the first array is packed, otherwise it is a
+    boolean array. Packed arrays are concatenated along the first axis without
+    unpacking them.
+
+    Args:
+        flag_arrays: list of boolean arrays or _PackedFlags objects.
+        axis: axis to concatenate along.
+
+    Returns:
+        concatenated flags
+    """
+    if not isinstance(flag_arrays[0], _PackedFlags):
+        return np.concatenate([np.asarray(f) for f in flag_arrays], axis=axis)
+    flag_arrays = [f if isinstance(f, _PackedFlags) else _PackedFlags(f)
+                   for f in flag_arrays]
+    first = flag_arrays[0]
+    if axis < 0:
+        axis += first.ndim
+    if axis == 0:
+        for f in flag_arrays[1:]:
+            if f.shape[1:] != first.shape[1:]:
+                raise ValueError('all the input array dimensions except for the '
+                                 'concatenation axis must match exactly')
+        return _PackedFlags._from_packed(
+            np.concatenate([f.packed for f in flag_arrays], axis=0),
+            (sum(f.shape[0] for f in flag_arrays),) + first.shape[1:])
+    for f in flag_arrays[1:]:
+        if f.shape[0] != first.shape[0]:
+            raise ValueError('all the input array dimensions except for the '
+                             'concatenation axis must match exactly')
+    return first._map_rows(lambda flags, rows: np.concatenate(
+        [flags] + [f.unpack(rows) for f in flag_arrays[1:]], axis=axis))
+
+
 def get_iterable(x):
     """Helper function to ensure iterability."""
     if isinstance(x, collections.Iterable):
@@ -260,6 +579,54 @@ def get_iterable(x):
         return (x,)
 
 
+def get_matching_inds(array, values):
+    """
+    Find the indices into an array of each of a set of values.
+
+    Args:
+        array: 1D array to search.
+        values: values to find in the array.
+
+    Returns:
+        inds: indices into array of the elements equal to each value, in the
+            order of values (multiple matches of one value are in increasing order).
+        missing: boolean array, True for the values that are not in array.
+    """
+    array = np.asarray(array)
+    values = np.asarray(values)
+    sort_inds = np.argsort(array, kind='mergesort')
+    sorted_array = array[sort_inds]
+    first = np.searchsorted(sorted_array, values, side='left')
+    counts = np.searchsorted(sorted_array, values, side='right') - first
+    offsets = np.arange(np.sum(counts)) - np.repeat(np.cumsum(counts) - counts, counts)
+    inds = sort_inds[np.repeat(first, counts) + offsets]
+    return inds, counts == 0
+
+
+def get_data_precision_dtypes(data_array_dtype):
+    """
+    Get the data_array and nsample_array dtypes for a data_array_dtype option.
+
+    Args:
+        data_array_dtype: None, np.complex64 or np.complex128.
+
+    Returns:
+        data_dtype: numpy dtype for the data_array (None if data_array_dtype is None).
+        nsample_dtype: numpy dtype with the matching real precision for the
+            nsample_array, i.e. np.float32 for np.complex64 and np.float64
+            for np.complex128 (None if data_array_dtype is None).
+    """
+    if data_array_dtype is None:
+        return None, None
+    try:
+        data_dtype = np.dtype(data_array_dtype)
+    except TypeError:
+        data_dtype = None
+    if data_dtype not in [np.dtype(np.complex64), np.dtype(np.complex128)]:
+        raise ValueError('data_array_dtype must be None, np.complex64 or np.complex128')
+    return data_dtype, np.dtype(np.finfo(data_dtype).dtype)
+
+
 def fits_gethduaxis(HDU, axis, strict_fits=True):
     """
     Helper function for making axis arrays for fits files.
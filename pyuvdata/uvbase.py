@@ -5,6 +5,7 @@ Subclassed by UVData and Telescope.
 """
 import numpy as np
 import warnings
+import copy
 import parameter as uvp
 import version as uvversion
 
@@ -36,22 +37,25 @@ class UVBase(object):
 
         warnings.formatwarning = _warning
 
-        # set any UVParameter attributes to be properties
-        for p in self:
-            this_param = getattr(self, p)
-            attr_name = this_param.name
-            setattr(self.__class__, attr_name, property(self.prop_fget(p),
-                                                        self.prop_fset(p)))
-            if isinstance(this_param, uvp.AngleParameter):
-                setattr(self.__class__, attr_name + '_degrees',
-                        property(self.degree_prop_fget(p), self.degree_prop_fset(p)))
-            elif isinstance(this_param, uvp.LocationParameter):
-                setattr(self.__class__, attr_name + '_lat_lon_alt',
-                        property(self.lat_lon_alt_prop_fget(p),
-                                 self.lat_lon_alt_prop_fset(p)))
-                setattr(self.__class__, attr_name + '_lat_lon_alt_degrees',
-                        property(self.lat_lon_alt_degrees_prop_fget(p),
-                                 self.lat_lon_alt_degrees_prop_fset(p)))
+        # set any UVParameter attributes to be properties. This only needs to
+        # be done once per class, when the parameter registry is built.
+        if '_uvparameter_names' not in self.__class__.__dict__:
+            for p in self._parameter_names():
+                this_param = getattr(self, p)
+                attr_name = this_param.name
+                setattr(self.__class__, attr_name, property(self.prop_fget(p),
+                                                            self.prop_fset(p)))
+                if isinstance(this_param, uvp.AngleParameter):
+                    setattr(self.__class__, attr_name + '_degrees',
+                            property(self.degree_prop_fget(p), self.degree_prop_fset(p)))
+                elif isinstance(this_param, uvp.LocationParameter):
+                    setattr(self.__class__, attr_name + '_lat_lon_alt',
+                            property(self.lat_lon_alt_prop_fget(p),
+                                     self.lat_lon_alt_prop_fset(p)))
+                    setattr(self.__class__, attr_name + '_lat_lon_alt_degrees',
+                            property(self.lat_lon_alt_degrees_prop_fget(p),
+                                     self.lat_lon_alt_degrees_prop_fset(p)))
+            self.__class__._uvparameter_names = self._parameter_names()
 
         # String to add to history of any files written with this version of pyuvdata
         self.pyuvdata_version_str = ('  Read/written with pyuvdata version: '
@@ -66,6 +70,9 @@ class UVBase(object):
         """Getter method for UVParameter properties."""
         def fget(self):
             this_param = getattr(self, param_name)
+            if getattr(this_param.value, 'is_lazy', False):
+                # value is backed by a file on disk, read it in on first access
+                this_param.value = this_param.value.load()
             return this_param.value
         return fget
 
@@ -122,100 +129,154 @@ class UVBase(object):
             setattr(self, param_name, this_param)
         return fset
 
+    def _parameter_names(self):
+        """
+        Get the (sorted) names of the UVParameter attributes.
+
+        The names are registered on the class the first time an object of the
+        class is created, since all objects of a class have the same UVParameter
+        attributes. Objects that were not created through the init method
+        (e.g. unpickled in a new process) fall back to scanning their attributes.
+        """
+        names = self.__class__.__dict__.get('_uvparameter_names')
+        if names is None:
+            names = tuple(sorted(a for a, v in self.__dict__.items()
+                                 if isinstance(v, uvp.UVParameter)))
+        return names
+
     def __iter__(self):
         """Iterator for all UVParameter attributes."""
-        attribute_list = [a for a in dir(self) if not a.startswith('__')
-                          and not callable(getattr(self, a))]
-        param_list = []
-        for a in attribute_list:
-            attr = getattr(self, a)
-            if isinstance(attr, uvp.UVParameter):
-                param_list.append(a)
-        for a in param_list:
+        for a in self._parameter_names():
             yield a
 
     def required(self):
         """Iterator for all required UVParameter attributes."""
-        attribute_list = [a for a in dir(self) if not a.startswith('__')
-                          and not callable(getattr(self, a))]
-        required_list = []
-        for a in attribute_list:
-            attr = getattr(self, a)
-            if isinstance(attr, uvp.UVParameter):
-                if attr.required:
-                    required_list.append(a)
-        for a in required_list:
-            yield a
+        for a in self._parameter_names():
+            if getattr(self, a).required:
+                yield a
 
     def extra(self):
         """Iterator for all non-required UVParameter attributes."""
-        attribute_list = [a for a in dir(self) if not a.startswith('__')
-                          and not callable(getattr(self, a))]
-        extra_list = []
-        for a in attribute_list:
-            attr = getattr(self, a)
-            if isinstance(attr, uvp.UVParameter):
-                if not attr.required:
-                    extra_list.append(a)
-        for a in extra_list:
-            yield a
+        for a in self._parameter_names():
+            if not getattr(self, a).required:
+                yield a
 
-    def __eq__(self, other, check_extra=True):
+    def _copy_sharing_arrays(self):
+        """
+        Copy the object, but share the array values of the UVParameters with
+        this object rather than copying them.
+
+        This is for methods like select and __add__ that make a new object and
+        replace most of the arrays on it (e.g. by indexing or concatenating), so
+        the arrays are only copied by the operations that replace them. The
+        shared arrays must not be changed in place on the new object until
+        _unshare_arrays has been called on it.
+
+        Returns:
+            The new object.
+        """
+        # deepcopy returns the objects in the memo as they are
+        memo = {}
+        for p in self:
+            value = getattr(self, p).value
+            if isinstance(value, np.ndarray):
+                memo[id(value)] = value
+        return copy.deepcopy(self, memo)
+
+    def _unshare_arrays(self, other):
+        """
+        Copy any UVParameter array values that share memory with the values
+        of the same UVParameters on another object.
+
+        Args:
+            other: The object this object was copied from with _copy_sharing_arrays.
+        """
+        for p in self:
+            param = getattr(self, p)
+            other_value = getattr(other, p).value
+            if (isinstance(param.value, np.ndarray) and isinstance(other_value, np.ndarray)
+                    and np.may_share_memory(param.value, other_value)):
+                param.value = param.value.copy()
+
+    def _load_lazy_params(self):
+        """Read in any UVParameter values that are lazily backed by a file on disk."""
+        for p in self:
+            param = getattr(self, p)
+            if getattr(param.value, 'is_lazy', False):
+                param.value = param.value.load()
+
+    def __eq__(self, other, check_extra=True, stop_early=False):
         """
         Equal if classes match and parameters are equal.
 
         If check_extra is True, include all parameters, otherwise only include
-        required parameters.
+        required parameters. If stop_early is True, stop comparing after the
+        first parameter that does not match (so only that one is reported).
         """
-        if isinstance(other, self.__class__):
-            # only check that required parameters are identical
-            self_required = []
-            other_required = []
-            for p in self.required():
-                self_required.append(p)
-            for p in other.required():
-                other_required.append(p)
-            if set(self_required) != set(other_required):
-                print('Sets of required parameters do not match. Left is {lset},'
-                      ' right is {rset}'.format(lset=self_required,
-                                                rset=other_required))
-                return False
-
-            if check_extra:
-                self_extra = []
-                other_extra = []
-                for p in self.extra():
-                    self_extra.append(p)
-                for p in other.extra():
-                    other_extra.append(p)
-                if set(self_extra) != set(other_extra):
-                    print('Sets of extra parameters do not match. Left is {lset},'
-                          ' right is {rset}'.format(lset=self_extra,
-                                                    rset=other_extra))
-                    return False
-
-                p_check = self_required + self_extra
-            else:
-                p_check = self_required
-
-            p_equal = True
-            for p in p_check:
-                self_param = getattr(self, p)
-                other_param = getattr(other, p)
-                if self_param != other_param:
-                    print('parameter {} does not match. Left is {},'
-                          ' right is {}'.format(p, self_param.value, other_param.value))
-                    p_equal = False
-            return p_equal
-        else:
-            print('Classes do not match')
-            return False
+        differences = self.diff(other, check_extra=check_extra, stop_early=stop_early)
+        for p, message in differences:
+            print(message)
+            if p is not None:
+                print('parameter {} does not match. Left is {},'
+                      ' right is {}'.format(p, getattr(self, p).value,
+                                            getattr(other, p).value))
+        return len(differences) == 0
 
     def __ne__(self, other):
         """Not equal."""
         return not self.__eq__(other)
 
-    def check(self, check_extra=True, run_check_acceptability=True):
+    def diff(self, other, check_extra=True, stop_early=False):
+        """
+        Find the differences from another object.
+
+        Args:
+            other: Object to compare to.
+            check_extra: Option to compare optional parameters as well as
+                required ones. Default is True.
+            stop_early: Option to stop comparing after the first parameter
+                that does not match. Default is False.
+
+        Returns:
+            A list of (parameter name, message) tuples describing each
+            difference, which is empty if the objects are equal. The parameter
+            name is None for differences that are not about a single parameter
+            (e.g. the classes or the sets of parameters do not match).
+        """
+        if not isinstance(other, self.__class__):
+            return [(None, 'Classes do not match')]
+
+        self._load_lazy_params()
+        other._load_lazy_params()
+
+        # only check that required parameters are identical
+        self_required = list(self.required())
+        other_required = list(other.required())
+        if set(self_required) != set(other_required):
+            return [(None, 'Sets of required parameters do not match. Left is {lset},'
+                     ' right is {rset}'.format(lset=self_required, rset=other_required))]
+
+        if check_extra:
+            self_extra = list(self.extra())
+            other_extra = list(other.extra())
+            if set(self_extra) != set(other_extra):
+                return [(None, 'Sets of extra parameters do not match. Left is {lset},'
+                         ' right is {rset}'.format(lset=self_extra, rset=other_extra))]
+            p_check = self_required + self_extra
+        else:
+            p_check = self_required
+
+        differences = []
+        for p in p_check:
+            message = getattr(self, p).compare(getattr(other, p))
+            if message is not None:
+                differences.append((p, message))
+                if stop_early:
+                    break
+        return differences
+
+    def check(self, check_extra=True, run_check_acceptability=True,
+              check_level='full', only_modified=False):
         """
         Check that required parameters exist. Check that parameters have
         appropriate shapes and optionally that the values are acceptable.
@@ -225,7 +286,25 @@ class UVBase(object):
                 otherwise only check required parameters.
             run_check_acceptability: Option to check if values in required parameters
                 are acceptable. Default is True.
+            check_level: How much checking to do, one of 'none' (no checks),
+                'shapes' (check that parameters exist and have the right shapes
+                and types) or 'full' (also check consistency between parameters
+                and, if run_check_acceptability is True, that the values are
+                acceptable). Default is 'full'.
+            only_modified: Only check the values of parameters that have been
+                set since they last passed the acceptability check (the shapes
+                are always checked). Changes made in place to the contents of
+                an array or list are not seen, so this should only be used when
+                every changed value has been set rather than edited in place
+                (e.g. by the readers, select and add). Default is False.
         """
+        if check_level not in ['none', 'shapes', 'full']:
+            raise ValueError("check_level must be one of 'none', 'shapes' or 'full'.")
+        if check_level == 'none':
+            return True
+        if check_level == 'shapes':
+            run_check_acceptability = False
+
         if check_extra:
             p_check = [p for p in self.required()] + [p for p in self.extra()]
         else:
@@ -280,9 +359,24 @@ class UVBase(object):
                                                  + '. Should be: ' + str(param.expected_type))
 
                 if run_check_acceptability:
-                    accept, message = param.check_acceptability()
-                    if not accept:
-                        raise ValueError('UVParameter ' + p + ' has unacceptable values. '
-                                         + message)
+                    signature = param.acceptability_signature()
+                    if not only_modified or param._checked != signature:
+                        accept, message = param.check_acceptability()
+                        if not accept:
+                            raise ValueError('UVParameter ' + p + ' has unacceptable values. '
+                                             + message)
+                        param._checked = signature
 
         return True
+
+    def _modified_since_check(self, *param_names):
+        """
+        Find out if any of the given UVParameters have been set since they last
+        passed the acceptability check in the check method.
+        """
+        return any(getattr(self, p)._checked is None for p in param_names)
+
+    def _mark_modified(self, *param_names):
+        """Mark the given UVParameters as needing to be checked again."""
+        for p in param_names:
+            getattr(self, p)._checked = None
@@ -321,7 +321,8 @@ class UVBeam(UVBase):
 
         super(UVBeam, self).__init__()
 
-    def check(self, check_extra=True, run_check_acceptability=True):
+    def check(self, check_extra=True, run_check_acceptability=True,
+              check_level='full', only_modified=False):
         """
         Check that all required parameters are set reasonably.
 
@@ -333,18 +334,36 @@ class UVBeam(UVBase):
                 required ones. Default is True.
             run_check_acceptability: Option to check if values in required parameters
                 are acceptable. Default is True.
+            check_level: How much checking to do, one of 'none' (no checks),
+                'shapes' (check that parameters exist and have the right shapes
+                and types) or 'full' (also check that the values are acceptable
+                if run_check_acceptability is True). Default is 'full'.
+            only_modified: Only check the values of parameters that have been
+                set since they last passed the full check (the shapes are
+                always checked). Changes made in place to the contents of an
+                array are not seen, so this should only be used when every
+                changed value has been set rather than edited in place (e.g. by
+                the readers, select and add). Default is False.
         """
+        if check_level == 'none':
+            return True
+
         # first make sure the required parameters and forms are set properly
         # for the pixel_coordinate_system
         self.set_cs_params()
 
+        check_basis_vectors = check_level == 'full' and (
+            not only_modified or self._modified_since_check('_basis_vector_array'))
+
         # first run the basic check from UVBase
         super(UVBeam, self).check(check_extra=check_extra,
-                                  run_check_acceptability=run_check_acceptability)
+                                  run_check_acceptability=run_check_acceptability,
+                                  check_level=check_level, only_modified=only_modified)
 
         # check that basis_vector_array are basis vectors
-        if self.basis_vector_array is not None:
+        if self.basis_vector_array is not None and check_basis_vectors:
             if np.max(np.linalg.norm(self.basis_vector_array, axis=1)) > (1 + 1e-15):
+                self._mark_modified('_basis_vector_array')
                 raise ValueError('basis vectors must have lengths of 1 or less.')
 
         # issue warning if extra_keywords keys are longer than 8 characters
@@ -735,7 +754,7 @@ class UVBeam(UVBase):
         if inplace:
             this = self
         else:
-            this = copy.deepcopy(self)
+            this = self._copy_sharing_arrays()
         # Check that both objects are UVBeam and valid
         this.check(check_extra=check_extra, run_check_acceptability=False)
         if not isinstance(other, this.__class__):
@@ -1002,6 +1021,10 @@ class UVBeam(UVBase):
             this.data_array = np.concatenate([this.data_array, data_zero_pad], axis=paxis)[
                 :, :, order, ...]
 
+        if not inplace:
+            # copy any arrays that were not replaced above before filling them in
+            this._unshare_arrays(self)
+
         # Now populate the data
         if this.beam_type == 'power':
             this.Npols = this.polarization_array.shape[0]
@@ -1069,7 +1092,8 @@ class UVBeam(UVBase):
         # Check final object is self-consistent
         if run_check:
             this.check(check_extra=check_extra,
-                       run_check_acceptability=run_check_acceptability)
+                       run_check_acceptability=run_check_acceptability,
+                       only_modified=True)
 
         if not inplace:
             return this
@@ -1229,7 +1253,7 @@ class UVBeam(UVBase):
         if inplace:
             beam_object = self
         else:
-            beam_object = copy.deepcopy(self)
+            beam_object = self._copy_sharing_arrays()
 
         # build up history string as we go
         history_update_string = '  Downselected to specific '
@@ -1435,10 +1459,15 @@ class UVBeam(UVBase):
         history_update_string += ' using pyuvdata.'
         beam_object.history = beam_object.history + history_update_string
 
+        if not inplace:
+            # copy any arrays that were not replaced by the select
+            beam_object._unshare_arrays(self)
+
         # check if object is self-consistent
         if run_check:
             beam_object.check(check_extra=check_extra,
-                              run_check_acceptability=run_check_acceptability)
+                              run_check_acceptability=run_check_acceptability,
+                              only_modified=True)
 
         if not inplace:
             return beam_object
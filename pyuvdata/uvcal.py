@@ -139,7 +139,8 @@ class UVCal(UVBase):
 
         desc = ('Array of flags to be applied to calibrated data (logical OR '
                 'of input and flag generated by calibration). True is flagged. '
-                'Shape: (Nants_data, Nspws, Nfreqs, Ntimes, Njones), type = bool.')
+                'Shape: (Nants_data, Nspws, Nfreqs, Ntimes, Njones), type = bool. '
+                'Can be stored as packed bits, see pack_flags.')
         self._flag_array = uvp.UVParameter('flag_array', description=desc,
                                            form=('Nants_data', 'Nspws', 'Nfreqs',
                                                  'Ntimes', 'Njones'),
@@ -274,7 +275,8 @@ class UVCal(UVBase):
 
         super(UVCal, self).__init__()
 
-    def check(self, check_extra=True, run_check_acceptability=True):
+    def check(self, check_extra=True, run_check_acceptability=True,
+              check_level='full', only_modified=False):
         """
         Check that all required parameters are set reasonably.
 
@@ -284,7 +286,20 @@ class UVCal(UVBase):
         Args:
             run_check_acceptability: Option to check if values in required parameters
                 are acceptable. Default is True.
+            check_level: How much checking to do, one of 'none' (no checks),
+                'shapes' (check that parameters exist and have the right shapes
+                and types) or 'full' (also check that the values are acceptable
+                if run_check_acceptability is True). Default is 'full'.
+            only_modified: Only check the values of parameters that have been
+                set since they last passed the full check (the shapes are
+                always checked). Changes made in place to the contents of an
+                array are not seen, so this should only be used when every
+                changed value has been set rather than edited in place (e.g. by
+                the readers, select and add). Default is False.
         """
+        if check_level == 'none':
+            return True
+
         # Make sure requirements are set properly for cal_style
         if self.cal_style == 'sky':
             self.set_sky()
@@ -293,7 +308,8 @@ class UVCal(UVBase):
 
         # first run the basic check from UVBase
         super(UVCal, self).check(check_extra=check_extra,
-                                 run_check_acceptability=run_check_acceptability)
+                                 run_check_acceptability=run_check_acceptability,
+                                 check_level=check_level, only_modified=only_modified)
 
         # issue warning if extra_keywords keys are longer than 8 characters
         for key in self.extra_keywords.keys():
@@ -386,7 +402,7 @@ class UVCal(UVBase):
         if inplace:
             cal_object = self
         else:
-            cal_object = copy.deepcopy(self)
+            cal_object = self._copy_sharing_arrays()
 
         # build up history string as we go
         history_update_string = '  Downselected to specific '
@@ -420,7 +436,7 @@ class UVCal(UVBase):
             ant_inds = list(sorted(set(list(ant_inds))))
             cal_object.Nants_data = len(ant_inds)
             cal_object.ant_array = cal_object.ant_array[ant_inds]
-            cal_object.flag_array = cal_object.flag_array[ant_inds, :, :, :, :]
+            cal_object.flag_array = np.take(cal_object.flag_array, ant_inds, axis=0)
             cal_object.quality_array = cal_object.quality_array[ant_inds, :, :, :, :]
             if cal_object.cal_type == 'delay':
                 cal_object.delay_array = cal_object.delay_array[ant_inds, :, :, :, :]
@@ -462,7 +478,7 @@ class UVCal(UVBase):
                     warnings.warn('Selected times are not evenly spaced. This '
                                   'is not supported by the calfits format.')
 
-            cal_object.flag_array = cal_object.flag_array[:, :, :, time_inds, :]
+            cal_object.flag_array = np.take(cal_object.flag_array, time_inds, axis=3)
             cal_object.quality_array = cal_object.quality_array[:, :, :, time_inds, :]
             if cal_object.cal_type == 'delay':
                 cal_object.delay_array = cal_object.delay_array[:, :, :, time_inds, :]
@@ -513,7 +529,7 @@ class UVCal(UVBase):
                     warnings.warn('Selected frequencies are not evenly spaced. This '
                                   'is not supported by the calfits format')
 
-            cal_object.flag_array = cal_object.flag_array[:, :, freq_inds, :, :]
+            cal_object.flag_array = np.take(cal_object.flag_array, freq_inds, axis=2)
             if cal_object.cal_type == 'delay':
                 pass
             else:
@@ -553,7 +569,7 @@ class UVCal(UVBase):
                     warnings.warn('Selected jones polarization terms are not evenly spaced. This '
                                   'is not supported by the calfits format')
 
-            cal_object.flag_array = cal_object.flag_array[:, :, :, :, jones_inds]
+            cal_object.flag_array = np.take(cal_object.flag_array, jones_inds, axis=4)
             cal_object.quality_array = cal_object.quality_array[:, :, :, :, jones_inds]
             if cal_object.cal_type == 'delay':
                 cal_object.delay_array = cal_object.delay_array[:, :, :, :, jones_inds]
@@ -569,10 +585,15 @@ class UVCal(UVBase):
         history_update_string += ' using pyuvdata.'
         cal_object.history = cal_object.history + history_update_string
 
+        if not inplace:
+            # copy any arrays that were not replaced by the select
+            cal_object._unshare_arrays(self)
+
         # check if object is self-consistent
         if run_check:
             cal_object.check(check_extra=check_extra,
-                             run_check_acceptability=run_check_acceptability)
+                             run_check_acceptability=run_check_acceptability,
+                             only_modified=True)
 
         if not inplace:
             return cal_object
@@ -631,6 +652,24 @@ class UVCal(UVBase):
         else:
             raise(ValueError, 'cal_type is unknown, cannot convert to gain')
 
+    def pack_flags(self):
+        """
+        Store the flag_array as packed bits (8 flags per byte).
+
+        The flag_array attribute can still be indexed like a boolean array
+        (only the indexed antennas are unpacked) and select and adding work
+        with packed flags, keeping them packed. Use np.asarray(flag_array) or
+        unpack_flags to get a full boolean array.
+        """
+        if self.flag_array is not None and not isinstance(self.flag_array,
+                                                          uvutils._PackedFlags):
+            self.flag_array = uvutils._PackedFlags(self.flag_array)
+
+    def unpack_flags(self):
+        """Store the flag_array as a boolean array (undoes pack_flags)."""
+        if isinstance(self.flag_array, uvutils._PackedFlags):
+            self.flag_array = self.flag_array.unpack()
+
     def _convert_from_filetype(self, other):
         for p in other:
             param = getattr(other, p)
@@ -806,7 +845,7 @@ class UVCal(UVBase):
         if inplace:
             this = self
         else:
-            this = copy.deepcopy(self)
+            this = self._copy_sharing_arrays()
         # Check that both objects are UVCal and valid
         this.check(check_extra=check_extra, run_check_acceptability=run_check_acceptability)
         if not isinstance(other, this.__class__):
@@ -924,17 +963,17 @@ class UVCal(UVBase):
             zero_pad_data = np.zeros(
                 (len(anew_inds), this.Nspws, this.quality_array.shape[2], this.Ntimes,
                  this.Njones))
-            zero_pad_flags = np.zeros(
-                (len(anew_inds), this.Nspws, this.Nfreqs, this.Ntimes, this.Njones))
+            flag_pad_shape = (len(anew_inds), this.Nspws, this.Nfreqs, this.Ntimes,
+                              this.Njones)
             if this.cal_type == 'delay':
                 this.delay_array = np.concatenate([this.delay_array, zero_pad_data], axis=0)[
                     order, :, :, :, :]
             else:
                 this.gain_array = np.concatenate([this.gain_array, zero_pad_data], axis=0)[
                     order, :, :, :, :]
-            this.flag_array = np.concatenate([this.flag_array,
-                                              1 - zero_pad_flags], axis=0).astype(np.bool)[
-                                                  order, :, :, :, :]
+            this.flag_array = np.take(uvutils._concatenate_flags(
+                [this.flag_array, np.ones(flag_pad_shape, dtype=np.bool)], axis=0),
+                order, axis=0)
             this.quality_array = np.concatenate([this.quality_array, zero_pad_data], axis=0)[
                 order, :, :, :, :]
 
@@ -974,9 +1013,9 @@ class UVCal(UVBase):
             this.freq_array = this.freq_array[:, order]
             this.gain_array = np.concatenate([this.gain_array, zero_pad], axis=2)[
                 :, :, order, :, :]
-            this.flag_array = np.concatenate([this.flag_array,
-                                              1 - zero_pad], axis=2).astype(np.bool)[
-                                                  :, :, order, :, :]
+            this.flag_array = np.take(uvutils._concatenate_flags(
+                [this.flag_array, np.ones(zero_pad.shape, dtype=np.bool)], axis=2),
+                order, axis=2)
             this.quality_array = np.concatenate([this.quality_array, zero_pad], axis=2)[
                 :, :, order, :, :]
 
@@ -995,9 +1034,8 @@ class UVCal(UVBase):
             zero_pad_data = np.zeros(
                 (this.quality_array.shape[0], this.Nspws, this.quality_array.shape[2],
                  len(tnew_inds), this.Njones))
-            zero_pad_flags = np.zeros(
-                (this.flag_array.shape[0], this.Nspws, this.flag_array.shape[2],
-                 len(tnew_inds), this.Njones))
+            flag_pad_shape = (this.flag_array.shape[0], this.Nspws, this.flag_array.shape[2],
+                              len(tnew_inds), this.Njones)
             this.time_array = np.concatenate([this.time_array, other.time_array[tnew_inds]])
             order = np.argsort(this.time_array)
             this.time_array = this.time_array[order]
@@ -1007,9 +1045,9 @@ class UVCal(UVBase):
             else:
                 this.gain_array = np.concatenate([this.gain_array, zero_pad_data], axis=3)[
                     :, :, :, order, :]
-            this.flag_array = np.concatenate([this.flag_array,
-                                              1 - zero_pad_flags], axis=3).astype(np.bool)[
-                                                  :, :, :, order, :]
+            this.flag_array = np.take(uvutils._concatenate_flags(
+                [this.flag_array, np.ones(flag_pad_shape, dtype=np.bool)], axis=3),
+                order, axis=3)
             this.quality_array = np.concatenate([this.quality_array, zero_pad_data], axis=3)[
                 :, :, :, order, :]
             if this.total_quality_array is not None and can_combine_tqa:
@@ -1049,9 +1087,8 @@ class UVCal(UVBase):
             zero_pad_data = np.zeros(
                 (this.quality_array.shape[0], this.Nspws, this.quality_array.shape[2],
                  this.quality_array.shape[3], len(jnew_inds)))
-            zero_pad_flags = np.zeros(
-                (this.flag_array.shape[0], this.Nspws, this.flag_array.shape[2],
-                 this.flag_array.shape[3], len(jnew_inds)))
+            flag_pad_shape = (this.flag_array.shape[0], this.Nspws, this.flag_array.shape[2],
+                              this.flag_array.shape[3], len(jnew_inds))
             this.jones_array = np.concatenate([this.jones_array, other.jones_array[jnew_inds]])
             order = np.argsort(np.abs(this.jones_array))
             this.jones_array = this.jones_array[order]
@@ -1061,9 +1098,9 @@ class UVCal(UVBase):
             else:
                 this.gain_array = np.concatenate([this.gain_array, zero_pad_data], axis=4)[
                     :, :, :, :, order]
-            this.flag_array = np.concatenate([this.flag_array,
-                                              1 - zero_pad_flags], axis=4).astype(np.bool)[
-                                                  :, :, :, :, order]
+            this.flag_array = np.take(uvutils._concatenate_flags(
+                [this.flag_array, np.ones(flag_pad_shape, dtype=np.bool)], axis=4),
+                order, axis=4)
             this.quality_array = np.concatenate([this.quality_array, zero_pad_data], axis=4)[
                 :, :, :, :, order]
 
@@ -1101,6 +1138,10 @@ class UVCal(UVBase):
                                                        axis=4).astype(np.bool)[
                                                            :, :, :, :, order]
 
+        if not inplace:
+            # copy any arrays that were not replaced above before filling them in
+            this._unshare_arrays(self)
+
         # Now populate the data
         jones_t2o = np.nonzero(
             np.in1d(this.jones_array, other.jones_array))[0]
@@ -1169,7 +1210,8 @@ class UVCal(UVBase):
         # Check final object is self-consistent
         if run_check:
             this.check(check_extra=check_extra,
-                       run_check_acceptability=run_check_acceptability)
+                       run_check_acceptability=run_check_acceptability,
+                       only_modified=True)
 
         if not inplace:
             return this
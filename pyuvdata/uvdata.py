@@ -1,6 +1,5 @@
 """Primary container for radio interferometer datasets."""
 from astropy import constants as const
-from astropy.time import Time
 import os
 import numpy as np
 import warnings
@@ -12,6 +11,9 @@ import utils as uvutils
 import copy
 import collections
 import re
+import multiprocessing
+import shutil
+import tempfile
 
 
 class UVData(UVBase):
@@ -67,7 +69,8 @@ class UVData(UVBase):
                                                     'Nfreqs', 'Npols'),
                                               expected_type=(np.float))
 
-        desc = 'Boolean flag, True is flagged, same shape as data_array.'
+        desc = ('Boolean flag, True is flagged, same shape as data_array. '
+                'Can be stored as packed bits, see pack_flags.')
         self._flag_array = uvp.UVParameter('flag_array', description=desc,
                                            form=('Nblts', 'Nspws',
                                                  'Nfreqs', 'Npols'),
@@ -261,6 +264,14 @@ class UVData(UVBase):
         self._x_orientation = uvp.UVParameter('x_orientation', description=desc,
                                               required=False, expected_type=str)
 
+        desc = ('Ordering of the data along the baseline-time axis, a list of '
+                'the major and minor ordering, e.g. ["time", "baseline"] for data '
+                'sorted by time and then baseline number. Set by reorder_blts, '
+                'None if the ordering is not known.')
+        self._blt_order = uvp.UVParameter('blt_order', description=desc,
+                                          required=False, form=(2,), expected_type=str,
+                                          acceptable_vals=['time', 'baseline'])
+
         desc = ('Any user supplied extra keywords, type=dict. Keys should be '
                 '8 character or less strings if writing to uvfits or miriad files. '
                 'Use the special key "comment" for long multi-line string comments.')
@@ -322,7 +333,8 @@ class UVData(UVBase):
 
         super(UVData, self).__init__()
 
-    def check(self, check_extra=True, run_check_acceptability=True):
+    def check(self, check_extra=True, run_check_acceptability=True,
+              check_level='full', only_modified=False):
         """
         Add some extra checks on top of checks on UVBase class.
 
@@ -334,7 +346,28 @@ class UVData(UVBase):
                 required parameters.
             run_check_acceptability: Option to check if values in parameters
                 are acceptable. Default is True.
-        """
+            check_level: How much checking to do, one of 'none' (no checks),
+                'shapes' (check that parameters exist and have the right shapes
+                and types) or 'full' (also check consistency between parameters
+                like Nbls and baseline_array and, if run_check_acceptability is
+                True, that the values are acceptable). Default is 'full'.
+            only_modified: Only check the values of parameters that have been
+                set since they last passed the full check (the shapes are
+                always checked). Changes made in place to the contents of an
+                array are not seen, so this should only be used when every
+                changed value has been set rather than edited in place (e.g. by
+                the readers, select and add). Default is False.
+        """
+        if check_level == 'none':
+            return True
+
+        # the consistency checks below only need to be redone if one of the
+        # parameters they use has been set since the last full check
+        consistency_params = ['_ant_1_array', '_ant_2_array', '_baseline_array',
+                              '_time_array', '_Nants_data', '_Nbls', '_Ntimes']
+        check_consistency = check_level == 'full' and (
+            not only_modified or self._modified_since_check(*consistency_params))
+
         # first run the basic check from UVBase
         if self.ant_1_array is not None and np.all(self.ant_1_array == self.ant_2_array):
             # Special case of only containing auto correlations, adjust uvw acceptable_range
@@ -349,23 +382,29 @@ class UVData(UVBase):
             self.set_unknown_phase_type()
 
         super(UVData, self).check(check_extra=check_extra,
-                                  run_check_acceptability=run_check_acceptability)
+                                  run_check_acceptability=run_check_acceptability,
+                                  check_level=check_level, only_modified=only_modified)
 
         # Check internal consistency of numbers which don't explicitly correspond
         # to the shape of another array.
-        nants_data_calc = int(len(np.unique(self.ant_1_array.tolist()
-                                            + self.ant_2_array.tolist())))
-        if self.Nants_data != nants_data_calc:
-            raise ValueError('Nants_data must be equal to the number of unique '
-                             'values in ant_1_array and ant_2_array')
-
-        if self.Nbls != len(np.unique(self.baseline_array)):
-            raise ValueError('Nbls must be equal to the number of unique '
-                             'baselines in the data_array')
-
-        if self.Ntimes != len(np.unique(self.time_array)):
-            raise ValueError('Ntimes must be equal to the number of unique '
-                             'times in the time_array')
+        if check_consistency:
+            try:
+                nants_data_calc = len(np.union1d(self.ant_1_array, self.ant_2_array))
+                if self.Nants_data != nants_data_calc:
+                    raise ValueError('Nants_data must be equal to the number of unique '
+                                     'values in ant_1_array and ant_2_array')
+
+                if self.Nbls != len(np.unique(self.baseline_array)):
+                    raise ValueError('Nbls must be equal to the number of unique '
+                                     'baselines in the data_array')
+
+                if self.Ntimes != len(np.unique(self.time_array)):
+                    raise ValueError('Ntimes must be equal to the number of unique '
+                                     'times in the time_array')
+            except ValueError:
+                # make sure these are checked again next time
+                self._mark_modified(*consistency_params)
+                raise
 
         # issue warning if extra_keywords keys are longer than 8 characters
         for key in self.extra_keywords.keys():
@@ -547,13 +586,9 @@ class UVData(UVBase):
 
     def set_lsts_from_time_array(self):
         """Set the lst_array based from the time_array."""
-        lsts = []
-        self.lst_array = np.zeros(self.Nblts)
         latitude, longitude, altitude = self.telescope_location_lat_lon_alt_degrees
-        for ind, jd in enumerate(np.unique(self.time_array)):
-            t = Time(jd, format='jd', location=(longitude, latitude))
-            self.lst_array[np.where(np.isclose(
-                jd, self.time_array, atol=1e-6, rtol=1e-12))] = t.sidereal_time('apparent').radian
+        self.lst_array = uvutils.get_lst_for_time(self.time_array, latitude,
+                                                  longitude, altitude)
 
     def juldate2ephem(self, num):
         """
@@ -579,8 +614,56 @@ class UVData(UVBase):
         """
         return ephem.date(ephemdate) + 2415020.
 
-    def unphase_to_drift(self):
-        """Convert from a phased dataset to a drift dataset."""
+    def _rotate_uvws(self, rot_matrices, time_inds, blt_chunk_size=8192):
+        """
+        Internal function to rotate the uvws with a rotation matrix for each time.
+
+        Args:
+            rot_matrices: Rotation matrices, shape (Ntimes, 3, 3).
+            time_inds: Index into rot_matrices for each baseline-time, shape (Nblts).
+            blt_chunk_size: Number of baseline-times to rotate at a time.
+        """
+        uvws = np.zeros(self.uvw_array.shape, dtype=np.float64)
+        # rotate in chunks to limit the memory used for the per-blt matrices
+        for start in range(0, self.Nblts, blt_chunk_size):
+            chunk = slice(start, start + blt_chunk_size)
+            uvws[chunk] = np.einsum('nij,nj->ni', rot_matrices[time_inds[chunk]],
+                                    self.uvw_array[chunk])
+        self.uvw_array = uvws
+
+    def _apply_w_phasor(self, w, blt_chunk_size=8192):
+        """
+        Internal function to multiply the data by the w-term phasor exp(-2 pi i w / lambda).
+
+        The phasor is applied in place, a chunk of baseline-times at a time, so
+        the extra memory used is set by the chunk size rather than the size of
+        the data array. The phase is calculated in double precision but the
+        phasor is built with the precision of the data array.
+
+        Args:
+            w: w component of the baselines in meters, shape (Nblts).
+            blt_chunk_size: Number of baseline-times to apply the phasor to at a time.
+        """
+        data_array = self.data_array
+        phasor_dtype = np.promote_types(data_array.dtype, np.complex64)
+        freqs = -2 * np.pi / const.c.to('m/s').value * self.freq_array.reshape(1, self.Nfreqs)
+        for start in range(0, self.Nblts, blt_chunk_size):
+            chunk = slice(start, start + blt_chunk_size)
+            phase = w[chunk].reshape(-1, 1) * freqs
+            phs = np.empty(phase.shape, dtype=phasor_dtype)
+            np.cos(phase, out=phs.real)
+            np.sin(phase, out=phs.imag)
+            data_array[chunk] *= phs[:, None, :, None]
+
+    def unphase_to_drift(self, blt_chunk_size=8192):
+        """
+        Convert from a phased dataset to a drift dataset.
+
+        Args:
+            blt_chunk_size: Number of baseline-times to process at a time when
+                rotating the uvws and applying the phasor. This sets the extra
+                memory needed for unphasing. Default is 8192.
+        """
         if self.phase_type == 'phased':
             pass
         elif self.phase_type == 'drift':
@@ -590,6 +673,8 @@ class UVData(UVBase):
             raise ValueError('The phasing type of the data is unknown. '
                              'Set the phase_type to drift or phased to '
                              'reflect the phasing status of the data')
+        if blt_chunk_size < 1:
+            raise ValueError('blt_chunk_size must be a positive integer.')
 
         latitude, longitude, altitude = self.telescope_location_lat_lon_alt
 
@@ -605,36 +690,32 @@ class UVData(UVBase):
         phase_center._ra = self.phase_center_ra
         phase_center._dec = self.phase_center_dec
 
-        self.zenith_ra = np.zeros_like(self.time_array)
-        self.zenith_dec = np.zeros_like(self.time_array)
-
         # apply -w phasor
-        w_lambda = (self.uvw_array[:, 2].reshape(self.Nblts, 1).astype(np.float64)
-                    / const.c.to('m/s').value * self.freq_array.reshape(1, self.Nfreqs))
-        phs = np.exp(-1j * 2 * np.pi * (-1) * w_lambda[:, None, :, None])
-        self.data_array *= phs
-
-        unique_times = np.unique(self.time_array)
-        for jd in unique_times:
-            inds = np.where(self.time_array == jd)[0]
+        self._apply_w_phasor(-self.uvw_array[:, 2].astype(np.float64),
+                             blt_chunk_size=blt_chunk_size)
+
+        # get the apparent position of the phase center and the sidereal
+        # time at each unique time
+        unique_times, time_inds = np.unique(self.time_array, return_inverse=True)
+        phase_center_ra = np.zeros_like(unique_times)
+        phase_center_dec = np.zeros_like(unique_times)
+        zenith_ra = np.zeros_like(unique_times)
+        zenith_dec = np.zeros_like(unique_times) + latitude
+        for ind, jd in enumerate(unique_times):
             obs.date, obs.epoch = self.juldate2ephem(
                 jd), self.juldate2ephem(jd)
             phase_center.compute(obs)
-            phase_center_ra, phase_center_dec = phase_center.a_ra, phase_center.a_dec
-            zenith_ra = obs.sidereal_time()
-            zenith_dec = latitude
-            self.zenith_ra[inds] = zenith_ra
-            self.zenith_dec[inds] = zenith_dec
-
-            # generate rotation matrices
-            m0 = uvutils.top2eq_m(0., phase_center_dec)
-            m1 = uvutils.eq2top_m(phase_center_ra - zenith_ra, zenith_dec)
-
-            # rotate and write uvws
-            uvw = self.uvw_array[inds, :]
-            uvw = np.dot(m0, uvw.T).T
-            uvw = np.dot(m1, uvw.T).T
-            self.uvw_array[inds, :] = uvw
+            phase_center_ra[ind], phase_center_dec[ind] = phase_center.a_ra, phase_center.a_dec
+            zenith_ra[ind] = obs.sidereal_time()
+        self.zenith_ra = zenith_ra[time_inds]
+        self.zenith_dec = zenith_dec[time_inds]
+
+        # generate rotation matrices for each unique time
+        m0 = uvutils.top2eq_m(np.zeros_like(unique_times), phase_center_dec)
+        m1 = uvutils.eq2top_m(phase_center_ra - zenith_ra, zenith_dec)
+
+        # rotate and write uvws
+        self._rotate_uvws(np.matmul(m1, m0), time_inds, blt_chunk_size=blt_chunk_size)
 
         # remove phase center
         self.phase_center_ra = None
@@ -642,12 +723,15 @@ class UVData(UVBase):
         self.phase_center_epoch = None
         self.set_drift()
 
-    def phase_to_time(self, time):
+    def phase_to_time(self, time, blt_chunk_size=8192):
         """
         Phase a drift scan dataset to the ra/dec of zenith at a particular time.
 
         Args:
             time: The time to phase to.
+            blt_chunk_size: Number of baseline-times to process at a time when
+                rotating the uvws and applying the phasor. This sets the extra
+                memory needed for phasing. Default is 8192.
         """
         if self.phase_type == 'drift':
             pass
@@ -671,9 +755,9 @@ class UVData(UVBase):
         ra = obs.sidereal_time()
         dec = latitude
         epoch = self.juldate2ephem(time)
-        self.phase(ra, dec, epoch)
+        self.phase(ra, dec, epoch, blt_chunk_size=blt_chunk_size)
 
-    def phase(self, ra, dec, epoch):
+    def phase(self, ra, dec, epoch, blt_chunk_size=8192):
         """
         Phase a drift scan dataset to a single ra/dec at a particular epoch.
 
@@ -684,6 +768,9 @@ class UVData(UVBase):
             dec: The dec to phase to in radians.
             epoch: The epoch to use for phasing. Should be an ephem date,
                 measured from noon Dec. 31, 1899.
+            blt_chunk_size: Number of baseline-times to process at a time when
+                rotating the uvws and applying the phasor. This sets the extra
+                memory needed for phasing. Default is 8192.
         """
         if self.phase_type == 'drift':
             pass
@@ -695,6 +782,8 @@ class UVData(UVBase):
             raise ValueError('The phasing type of the data is unknown. '
                              'Set the phase_type to "drift" or "phased" to '
                              'reflect the phasing status of the data')
+        if blt_chunk_size < 1:
+            raise ValueError('blt_chunk_size must be a positive integer.')
 
         obs = ephem.Observer()
         # obs inits with default values for parameters -- be sure to replace them
@@ -719,38 +808,60 @@ class UVData(UVBase):
         # explicitly set epoch to J2000
         self.phase_center_epoch = 2000.0
 
-        unique_times, unique_inds = np.unique(
-            self.time_array, return_index=True)
-        uvws = np.zeros(self.uvw_array.shape, dtype=np.float64)
+        unique_times, unique_inds, time_inds = np.unique(
+            self.time_array, return_index=True, return_inverse=True)
+        lsts = self.lst_array[unique_inds]
+        # calculate ra/dec of phase center in current epoch and the sidereal
+        # time at each unique time
+        ras = np.zeros_like(unique_times)
+        decs = np.zeros_like(unique_times)
+        sidereal_times = np.zeros_like(unique_times)
         for ind, jd in enumerate(unique_times):
-            inds = np.where(self.time_array == jd)[0]
-            lst = self.lst_array[unique_inds[ind]]
-            # calculate ra/dec of phase center in current epoch
             obs.date, obs.epoch = self.juldate2ephem(
                 jd), self.juldate2ephem(jd)
             precess_pos.compute(obs)
-            ra, dec = precess_pos.a_ra, precess_pos.a_dec
+            ras[ind], decs[ind] = precess_pos.a_ra, precess_pos.a_dec
+            sidereal_times[ind] = obs.sidereal_time()
 
-            # generate rotation matrices
-            m0 = uvutils.top2eq_m(lst - obs.sidereal_time(), latitude)
-            m1 = uvutils.eq2top_m(lst - ra, dec)
+        # generate rotation matrices for each unique time
+        m0 = uvutils.top2eq_m(lsts - sidereal_times, np.zeros_like(unique_times) + latitude)
+        m1 = uvutils.eq2top_m(lsts - ras, decs)
 
-            # rotate and write uvws
-            uvw = self.uvw_array[inds, :]
-            uvw = np.dot(m0, uvw.T).T
-            uvw = np.dot(m1, uvw.T).T
-            self.uvw_array[inds, :] = uvw
-            uvws[inds, :] = uvw
+        # rotate and write uvws
+        self._rotate_uvws(np.matmul(m1, m0), time_inds, blt_chunk_size=blt_chunk_size)
 
         # calculate data and apply phasor
-        w_lambda = (uvws[:, 2].reshape(self.Nblts, 1)
-                    / const.c.to('m/s').value * self.freq_array.reshape(1, self.Nfreqs))
-        phs = np.exp(-1j * 2 * np.pi * w_lambda[:, None, :, None])
-        self.data_array *= phs
+        self._apply_w_phasor(self.uvw_array[:, 2], blt_chunk_size=blt_chunk_size)
 
         del(obs)
         self.set_phased()
 
+    def _get_blt_keys(self, time_array, baseline_array):
+        """
+        Internal function to build integer keys identifying baseline-times.
+
+        The keys are built from a time index and the baseline number, so they
+        sort by time and then baseline. Times are rounded to well below the time
+        tolerance first so that times that are only different by floating point
+        errors get the same key. Only the unique times are rounded (using
+        string formatting for exact decimal rounding).
+
+        Args:
+            time_array: array of times (in JD)
+            baseline_array: array of baseline numbers, same length as time_array
+
+        Returns:
+            int64 array of keys, same length as time_array
+        """
+        prec_t = - 2 * \
+            np.floor(np.log10(self._time_array.tols[-1])).astype(int)
+        unique_times, time_inds = np.unique(time_array, return_inverse=True)
+        rounded_times = np.array(["{1:.{0}f}".format(prec_t, t) for t in unique_times],
+                                 dtype=np.float)
+        time_inds = np.unique(rounded_times, return_inverse=True)[1][time_inds]
+        n_bl_keys = np.int64(np.max(baseline_array)) + 1
+        return time_inds.astype(np.int64) * n_bl_keys + baseline_array
+
     def __add__(self, other, run_check=True, check_extra=True,
                 run_check_acceptability=True, inplace=False):
         """
@@ -771,7 +882,7 @@ class UVData(UVBase):
         if inplace:
             this = self
         else:
-            this = copy.deepcopy(self)
+            this = self._copy_sharing_arrays()
         # Check that both objects are UVData and valid
         this.check(check_extra=check_extra, run_check_acceptability=run_check_acceptability)
         if not isinstance(other, this.__class__):
@@ -798,16 +909,12 @@ class UVData(UVBase):
         history_update_string = ' Combined data along '
         n_axes = 0
 
-        # Create blt arrays for convenience
-        prec_t = - 2 * \
-            np.floor(np.log10(this._time_array.tols[-1])).astype(int)
-        prec_b = 8
-        this_blts = np.array(["_".join(["{1:.{0}f}".format(prec_t, blt[0]),
-                                        str(blt[1]).zfill(prec_b)]) for blt in
-                              zip(this.time_array, this.baseline_array)])
-        other_blts = np.array(["_".join(["{1:.{0}f}".format(prec_t, blt[0]),
-                                         str(blt[1]).zfill(prec_b)]) for blt in
-                               zip(other.time_array, other.baseline_array)])
+        # Create integer blt keys for convenience
+        blt_keys = this._get_blt_keys(np.concatenate((this.time_array, other.time_array)),
+                                      np.concatenate((this.baseline_array,
+                                                      other.baseline_array)))
+        this_blts = blt_keys[:len(this.time_array)]
+        other_blts = blt_keys[len(this.time_array):]
         # Check we don't have overlapping data
         both_pol = np.intersect1d(
             this.polarization_array, other.polarization_array)
@@ -858,12 +965,13 @@ class UVData(UVBase):
         if len(bnew_inds) > 0:
             this_blts = np.concatenate((this_blts, new_blts))
             blt_order = np.argsort(this_blts)
-            zero_pad = np.zeros(
-                (len(bnew_inds), this.Nspws, this.Nfreqs, this.Npols))
-            this.data_array = np.concatenate([this.data_array, zero_pad], axis=0)
-            this.nsample_array = np.concatenate([this.nsample_array, zero_pad], axis=0)
-            this.flag_array = np.concatenate([this.flag_array,
-                                              1 - zero_pad], axis=0).astype(np.bool)
+            pad_shape = (len(bnew_inds), this.Nspws, this.Nfreqs, this.Npols)
+            this.data_array = np.concatenate(
+                [this.data_array, np.zeros(pad_shape, dtype=this.data_array.dtype)], axis=0)
+            this.nsample_array = np.concatenate(
+                [this.nsample_array, np.zeros(pad_shape, dtype=this.nsample_array.dtype)], axis=0)
+            this.flag_array = uvutils._concatenate_flags(
+                [this.flag_array, np.ones(pad_shape, dtype=np.bool)], axis=0)
             this.uvw_array = np.concatenate([this.uvw_array,
                                              other.uvw_array[bnew_inds, :]], axis=0)[blt_order, :]
             this.time_array = np.concatenate([this.time_array,
@@ -881,26 +989,36 @@ class UVData(UVBase):
                                                  other.zenith_ra[bnew_inds]])[blt_order]
                 this.zenith_dec = np.concatenate([this.zenith_dec,
                                                  other.zenith_dec[bnew_inds]])[blt_order]
+            if this.blt_order is not None:
+                # the combined blts are sorted by time and then baseline
+                this.blt_order = ['time', 'baseline']
         if len(fnew_inds) > 0:
-            zero_pad = np.zeros((this.data_array.shape[0], this.Nspws, len(fnew_inds),
-                                 this.Npols))
+            pad_shape = (this.data_array.shape[0], this.Nspws, len(fnew_inds), this.Npols)
             this.freq_array = np.concatenate([this.freq_array,
                                               other.freq_array[:, fnew_inds]], axis=1)
             f_order = np.argsort(this.freq_array[0, :])
-            this.data_array = np.concatenate([this.data_array, zero_pad], axis=2)
-            this.nsample_array = np.concatenate([this.nsample_array, zero_pad], axis=2)
-            this.flag_array = np.concatenate([this.flag_array, 1 - zero_pad],
-                                             axis=2).astype(np.bool)
+            this.data_array = np.concatenate(
+                [this.data_array, np.zeros(pad_shape, dtype=this.data_array.dtype)], axis=2)
+            this.nsample_array = np.concatenate(
+                [this.nsample_array, np.zeros(pad_shape, dtype=this.nsample_array.dtype)], axis=2)
+            this.flag_array = uvutils._concatenate_flags(
+                [this.flag_array, np.ones(pad_shape, dtype=np.bool)], axis=2)
         if len(pnew_inds) > 0:
-            zero_pad = np.zeros((this.data_array.shape[0], this.Nspws,
-                                 this.data_array.shape[2], len(pnew_inds)))
+            pad_shape = (this.data_array.shape[0], this.Nspws,
+                         this.data_array.shape[2], len(pnew_inds))
             this.polarization_array = np.concatenate([this.polarization_array,
                                                       other.polarization_array[pnew_inds]])
             p_order = np.argsort(np.abs(this.polarization_array))
-            this.data_array = np.concatenate([this.data_array, zero_pad], axis=3)
-            this.nsample_array = np.concatenate([this.nsample_array, zero_pad], axis=3)
-            this.flag_array = np.concatenate([this.flag_array, 1 - zero_pad],
-                                             axis=3).astype(np.bool)
+            this.data_array = np.concatenate(
+                [this.data_array, np.zeros(pad_shape, dtype=this.data_array.dtype)], axis=3)
+            this.nsample_array = np.concatenate(
+                [this.nsample_array, np.zeros(pad_shape, dtype=this.nsample_array.dtype)], axis=3)
+            this.flag_array = uvutils._concatenate_flags(
+                [this.flag_array, np.ones(pad_shape, dtype=np.bool)], axis=3)
+
+        if not inplace:
+            # copy any arrays that were not replaced above before filling them in
+            this._unshare_arrays(self)
 
         # Now populate the data
         pol_t2o = np.nonzero(
@@ -917,17 +1035,17 @@ class UVData(UVBase):
         if len(bnew_inds) > 0:
             this.data_array = this.data_array[blt_order, :, :, :]
             this.nsample_array = this.nsample_array[blt_order, :, :, :]
-            this.flag_array = this.flag_array[blt_order, :, :, :]
+            this.flag_array = np.take(this.flag_array, blt_order, axis=0)
         if len(fnew_inds) > 0:
             this.freq_array = this.freq_array[:, f_order]
             this.data_array = this.data_array[:, :, f_order, :]
             this.nsample_array = this.nsample_array[:, :, f_order, :]
-            this.flag_array = this.flag_array[:, :, f_order, :]
+            this.flag_array = np.take(this.flag_array, f_order, axis=2)
         if len(pnew_inds) > 0:
             this.polarization_array = this.polarization_array[p_order]
             this.data_array = this.data_array[:, :, :, p_order]
             this.nsample_array = this.nsample_array[:, :, :, p_order]
-            this.flag_array = this.flag_array[:, :, :, p_order]
+            this.flag_array = np.take(this.flag_array, p_order, axis=3)
 
         # Update N parameters (e.g. Npols)
         this.Ntimes = len(np.unique(this.time_array))
@@ -964,7 +1082,8 @@ class UVData(UVBase):
         # Check final object is self-consistent
         if run_check:
             this.check(check_extra=check_extra,
-                       run_check_acceptability=run_check_acceptability)
+                       run_check_acceptability=run_check_acceptability,
+                       only_modified=True)
 
         if not inplace:
             return this
@@ -979,6 +1098,166 @@ class UVData(UVBase):
         self.__add__(other, inplace=True)
         return self
 
+    def fast_concat(self, other, axis, run_check=True, check_extra=True,
+                    run_check_acceptability=True, inplace=False):
+        """
+        Concatenate UVData objects along the baseline-time, frequency or
+        polarization axis. Much faster than adding objects one at a time for
+        many objects, because compatibility is checked once and each output
+        array is allocated and filled exactly once. The data are concatenated
+        in the order given and are not sorted, and the other axes must match
+        exactly between the objects.
+
+        Args:
+            other: Another UVData object or a list of UVData objects which
+                will be concatenated with self (in order).
+            axis: Axis to concatenate along, one of 'blt', 'freq' or
+                'polarization'.
+            run_check: Option to check for the existence and proper shapes of
+                parameters after concatenating objects. Default is True.
+            check_extra: Option to check optional parameters as well as
+                required ones. Default is True.
+            run_check_acceptability: Option to check acceptable range of the values of
+                parameters after concatenating objects. Default is True.
+            inplace: Overwrite self with the concatenated object, otherwise
+                create a new object (default).
+
+        Returns:
+            The concatenated UVData object (if not inplace).
+        """
+        axis_dims = {'blt': 'Nblts', 'freq': 'Nfreqs', 'polarization': 'Npols'}
+        if axis not in axis_dims:
+            raise ValueError('axis must be one of: ' + ', '.join(sorted(axis_dims.keys())))
+        axis_dim = axis_dims[axis]
+        if isinstance(other, (list, tuple)):
+            others = list(other)
+        else:
+            others = [other]
+        if len(others) == 0:
+            raise ValueError('Need at least one other UVData object to concatenate.')
+
+        # Check that all objects are UVData and valid
+        self.check(check_extra=check_extra, run_check_acceptability=run_check_acceptability)
+        for obj in others:
+            if not isinstance(obj, self.__class__):
+                raise(ValueError('Only UVData objects can be concatenated with a UVData object'))
+            obj.check(check_extra=check_extra, run_check_acceptability=run_check_acceptability)
+
+        # Check objects are compatible, the axes that are not being
+        # concatenated must match exactly.
+        # Note zenith_ra will not necessarily be the same if times are different.
+        # But phase_center should be the same, even if in drift (empty parameters)
+        compatibility_params = ['_vis_units', '_integration_time', '_channel_width',
+                                '_object_name', '_telescope_name', '_instrument',
+                                '_telescope_location', '_phase_type',
+                                '_Nants_telescope', '_antenna_names',
+                                '_antenna_numbers', '_antenna_positions',
+                                '_phase_center_ra', '_phase_center_dec',
+                                '_phase_center_epoch', '_Nspws', '_spw_array']
+        if axis != 'blt':
+            compatibility_params += ['_time_array', '_baseline_array']
+        if axis != 'freq':
+            compatibility_params += ['_freq_array']
+        if axis != 'polarization':
+            compatibility_params += ['_polarization_array']
+        for obj in others:
+            for a in compatibility_params:
+                if getattr(self, a) != getattr(obj, a):
+                    msg = 'UVParameter ' + \
+                        a[1:] + ' does not match. Cannot concatenate objects.'
+                    raise(ValueError(msg))
+
+        # Find the parameters to concatenate (all those with the axis in
+        # their shape), concatenating each of them in one go.
+        objs = [self] + others
+        concat_values = {}
+        for p in self:
+            param = getattr(self, p)
+            if not isinstance(param.form, tuple) or axis_dim not in param.form:
+                continue
+            values = [getattr(obj, param.name) for obj in objs]
+            if all(value is None for value in values):
+                continue
+            if any(value is None for value in values):
+                raise ValueError('UVParameter ' + p[1:] + ' is not set on all '
+                                 'objects. Cannot concatenate objects.')
+            if p == '_flag_array':
+                # keep packed flags packed
+                concat_values[p] = uvutils._concatenate_flags(
+                    values, axis=param.form.index(axis_dim))
+            else:
+                concat_values[p] = np.concatenate(values, axis=param.form.index(axis_dim))
+
+        # Check we don't have overlapping data
+        if axis == 'blt':
+            blt_keys = self._get_blt_keys(concat_values['_time_array'],
+                                          concat_values['_baseline_array'])
+            n_unique = len(np.unique(blt_keys))
+        elif axis == 'freq':
+            n_unique = len(np.unique(concat_values['_freq_array'][0, :]))
+        else:
+            n_unique = len(np.unique(concat_values['_polarization_array']))
+        if n_unique < concat_values['_data_array'].shape[self._data_array.form.index(axis_dim)]:
+            raise(ValueError('These objects have overlapping data and'
+                             ' cannot be combined.'))
+
+        if inplace:
+            this = self
+        else:
+            # only deep copy the parameters that are not being replaced by
+            # concatenated values
+            this = copy.copy(self)
+            for p in self:
+                if p in concat_values:
+                    setattr(this, p, copy.copy(getattr(self, p)))
+                else:
+                    setattr(this, p, copy.deepcopy(getattr(self, p)))
+        for p, value in concat_values.iteritems():
+            setattr(this, getattr(this, p).name, value)
+
+        # Update N parameters (e.g. Npols)
+        if axis == 'blt':
+            this.Ntimes = len(np.unique(this.time_array))
+            this.Nbls = len(np.unique(this.baseline_array))
+            this.Nblts = this.uvw_array.shape[0]
+            this.Nants_data = len(
+                np.unique(this.ant_1_array.tolist() + this.ant_2_array.tolist()))
+            this.blt_order = None
+            axis_name = 'baseline-time'
+        elif axis == 'freq':
+            this.Nfreqs = this.freq_array.shape[1]
+            axis_name = 'frequency'
+            if this.Nfreqs > 1:
+                freq_separation = np.diff(this.freq_array[0, :])
+                if not np.isclose(np.min(freq_separation), np.max(freq_separation),
+                                  rtol=this._freq_array.tols[0], atol=this._freq_array.tols[1]):
+                    warnings.warn('Combined frequencies are not evenly spaced. This will '
+                                  'make it impossible to write this data out to some file types.')
+                elif np.max(freq_separation) > this.channel_width:
+                    warnings.warn('Combined frequencies are not contiguous. This will make '
+                                  'it impossible to write this data out to some file types.')
+        else:
+            this.Npols = this.polarization_array.shape[0]
+            axis_name = 'polarization'
+            if this.Npols > 2:
+                pol_separation = np.diff(this.polarization_array)
+                if np.min(pol_separation) < np.max(pol_separation):
+                    warnings.warn('Combined polarizations are not evenly spaced. This will '
+                                  'make it impossible to write this data out to some file types.')
+
+        this.history += ' Combined data along ' + axis_name + ' axis using pyuvdata.'
+        for obj in others:
+            this.history = uvutils.combine_histories(this.history, obj.history)
+
+        # Check final object is self-consistent
+        if run_check:
+            this.check(check_extra=check_extra,
+                       run_check_acceptability=run_check_acceptability,
+                       only_modified=True)
+
+        if not inplace:
+            return this
+
     def _select_preprocess(self, antenna_nums, antenna_names, ant_str, ant_pairs_nums,
                            frequencies, freq_chans, times, polarizations, blt_inds):
 
@@ -1000,11 +1279,12 @@ class UVData(UVBase):
                 ant_pairs_nums, polarizations = self.parse_ants(ant_str)
 
         # Antennas, times and blt_inds all need to be combined into a set of
-        # blts indices to keep.
+        # blts indices to keep. The antenna and time selections are built up
+        # as boolean masks on the blt axis.
 
         # test for blt_inds presence before adding inds from antennas & times
         if blt_inds is not None:
-            blt_inds = uvutils.get_iterable(blt_inds)
+            blt_inds = np.asarray(uvutils.get_iterable(blt_inds))
             history_update_string += 'baseline-times'
             n_selects += 1
 
@@ -1022,6 +1302,9 @@ class UVData(UVBase):
                 antenna_nums.append(self.antenna_numbers[np.where(
                     np.array(self.antenna_names) == s)[0]])
 
+        if antenna_nums is not None or ant_pairs_nums is not None:
+            data_ants = np.union1d(self.ant_1_array, self.ant_2_array)
+
         if antenna_nums is not None:
             antenna_nums = uvutils.get_iterable(antenna_nums)
             if n_selects > 0:
@@ -1029,24 +1312,17 @@ class UVData(UVBase):
             else:
                 history_update_string += 'antennas'
             n_selects += 1
-            inds1 = np.zeros(0, dtype=np.int)
-            inds2 = np.zeros(0, dtype=np.int)
-            for ant in antenna_nums:
-                if ant in self.ant_1_array or ant in self.ant_2_array:
-                    wh1 = np.where(self.ant_1_array == ant)[0]
-                    wh2 = np.where(self.ant_2_array == ant)[0]
-                    if len(wh1) > 0:
-                        inds1 = np.append(inds1, list(wh1))
-                    if len(wh2) > 0:
-                        inds2 = np.append(inds2, list(wh2))
-                else:
-                    raise ValueError('Antenna number {a} is not present in the '
-                                     'ant_1_array or ant_2_array'.format(a=ant))
-
-            ant_blt_inds = np.array(
-                list(set(inds1).intersection(inds2)), dtype=np.int)
+            ant_nums_use = np.asarray(antenna_nums).ravel()
+            if not np.all(np.in1d(ant_nums_use, data_ants)):
+                for ant in antenna_nums:
+                    if not np.all(np.in1d(ant, data_ants)):
+                        raise ValueError('Antenna number {a} is not present in the '
+                                         'ant_1_array or ant_2_array'.format(a=ant))
+
+            ant_blt_mask = np.logical_and(np.in1d(self.ant_1_array, ant_nums_use),
+                                          np.in1d(self.ant_2_array, ant_nums_use))
         else:
-            ant_blt_inds = None
+            ant_blt_mask = None
 
         if ant_pairs_nums is not None:
             if isinstance(ant_pairs_nums, tuple) and len(ant_pairs_nums) == 2:
@@ -1063,40 +1339,38 @@ class UVData(UVBase):
             else:
                 history_update_string += 'antenna pairs'
             n_selects += 1
-            ant_pair_blt_inds = np.zeros(0, dtype=np.int)
-            for pair in ant_pairs_nums:
-                if not (pair[0] in self.ant_1_array or pair[0] in self.ant_2_array):
-                    raise ValueError('Antenna number {a} is not present in the '
-                                     'ant_1_array or ant_2_array'.format(a=pair[0]))
-                if not (pair[1] in self.ant_1_array or pair[1] in self.ant_2_array):
-                    raise ValueError('Antenna number {a} is not present in the '
-                                     'ant_1_array or ant_2_array'.format(a=pair[1]))
-                wh1 = np.where(np.logical_and(
-                    self.ant_1_array == pair[0], self.ant_2_array == pair[1]))[0]
-                wh2 = np.where(np.logical_and(
-                    self.ant_1_array == pair[1], self.ant_2_array == pair[0]))[0]
-                if len(wh1) > 0:
-                    ant_pair_blt_inds = np.append(ant_pair_blt_inds, list(wh1))
-                if len(wh2) > 0:
-                    ant_pair_blt_inds = np.append(ant_pair_blt_inds, list(wh2))
-                if len(wh1) == 0 and len(wh2) == 0:
-                    raise ValueError('Antenna pair {p} does not have any data '
-                                     'associated with it.'.format(p=pair))
-
-            if ant_blt_inds is not None:
+
+            # match pairs in either order using integer keys for the antenna pairs
+            pairs = np.array(ant_pairs_nums, dtype=np.int64).reshape(-1, 2)
+            n_ant_keys = max(np.max(data_ants), pairs.max() if pairs.size else 0) + 1
+            blt_pair_keys = (self.ant_1_array.astype(np.int64) * n_ant_keys
+                             + self.ant_2_array)
+            pair_keys = pairs[:, 0] * n_ant_keys + pairs[:, 1]
+            pair_keys_rev = pairs[:, 1] * n_ant_keys + pairs[:, 0]
+            pair_bad = np.logical_or(
+                ~np.all(np.in1d(pairs, data_ants).reshape(pairs.shape), axis=1),
+                ~np.logical_or(np.in1d(pair_keys, blt_pair_keys),
+                               np.in1d(pair_keys_rev, blt_pair_keys)))
+            if np.any(pair_bad):
+                pair = ant_pairs_nums[np.nonzero(pair_bad)[0][0]]
+                for ant in pair:
+                    if ant not in data_ants:
+                        raise ValueError('Antenna number {a} is not present in the '
+                                         'ant_1_array or ant_2_array'.format(a=ant))
+                raise ValueError('Antenna pair {p} does not have any data '
+                                 'associated with it.'.format(p=pair))
+
+            ant_pair_blt_mask = np.in1d(blt_pair_keys,
+                                        np.concatenate((pair_keys, pair_keys_rev)))
+
+            if ant_blt_mask is not None:
                 # Use union (or) to join antenna_names/nums & ant_pairs_nums
-                ant_blt_inds = np.array(list(set(ant_blt_inds).union(ant_pair_blt_inds)))
+                ant_blt_mask = np.logical_or(ant_blt_mask, ant_pair_blt_mask)
             else:
-                ant_blt_inds = ant_pair_blt_inds
+                ant_blt_mask = ant_pair_blt_mask
 
-        if ant_blt_inds is not None:
-            if blt_inds is not None:
-                # Use intesection (and) to join antenna_names/nums/ant_pairs_nums with blt_inds
-                # handled differently because of the time aspect (which is anded with antennas below)
-                blt_inds = np.array(
-                    list(set(blt_inds).intersection(ant_blt_inds)), dtype=np.int)
-            else:
-                blt_inds = ant_blt_inds
+        # Use intersection (and) to join antenna_names/nums/ant_pairs_nums with times
+        blt_mask = ant_blt_mask
 
         if times is not None:
             times = uvutils.get_iterable(times)
@@ -1106,21 +1380,26 @@ class UVData(UVBase):
                 history_update_string += 'times'
             n_selects += 1
 
-            time_blt_inds = np.zeros(0, dtype=np.int)
-            for jd in times:
-                if jd in self.time_array:
-                    time_blt_inds = np.append(
-                        time_blt_inds, np.where(self.time_array == jd)[0])
-                else:
-                    raise ValueError(
-                        'Time {t} is not present in the time_array'.format(t=jd))
+            times_use = np.asarray(times)
+            time_missing = ~np.in1d(times_use, self.time_array)
+            if np.any(time_missing):
+                raise ValueError(
+                    'Time {t} is not present in the time_array'.format(
+                        t=times[np.nonzero(time_missing)[0][0]]))
 
+            time_blt_mask = np.in1d(self.time_array, times_use)
+            if blt_mask is not None:
+                blt_mask = np.logical_and(blt_mask, time_blt_mask)
+            else:
+                blt_mask = time_blt_mask
+
+        if blt_mask is not None:
             if blt_inds is not None:
-                # Use intesection (and) to join antenna_names/nums/ant_pairs_nums/blt_inds with times
-                blt_inds = np.array(
-                    list(set(blt_inds).intersection(time_blt_inds)), dtype=np.int)
+                # Use intersection (and) to join the antenna & time selections with blt_inds
+                blt_inds = blt_inds[np.logical_and(blt_inds >= 0, blt_inds < self.Nblts)]
+                blt_inds = blt_inds[blt_mask[blt_inds]]
             else:
-                blt_inds = time_blt_inds
+                blt_inds = np.nonzero(blt_mask)[0]
 
         if blt_inds is not None:
 
@@ -1133,7 +1412,7 @@ class UVData(UVBase):
             if min(blt_inds) < 0:
                 raise ValueError('blt_inds contains indices that are negative')
 
-            blt_inds = list(sorted(set(list(blt_inds))))
+            blt_inds = np.unique(blt_inds)
 
         if freq_chans is not None:
             freq_chans = uvutils.get_iterable(freq_chans)
@@ -1141,8 +1420,7 @@ class UVData(UVBase):
                 frequencies = self.freq_array[0, freq_chans]
             else:
                 frequencies = uvutils.get_iterable(frequencies)
-                frequencies = np.sort(list(set(frequencies)
-                                           | set(self.freq_array[0, freq_chans])))
+                frequencies = np.union1d(frequencies, self.freq_array[0, freq_chans])
 
         if frequencies is not None:
             frequencies = uvutils.get_iterable(frequencies)
@@ -1152,16 +1430,13 @@ class UVData(UVBase):
                 history_update_string += 'frequencies'
             n_selects += 1
 
-            freq_inds = np.zeros(0, dtype=np.int)
             # this works because we only allow one SPW. This will have to be reworked when we support more.
-            freq_arr_use = self.freq_array[0, :]
-            for f in frequencies:
-                if f in freq_arr_use:
-                    freq_inds = np.append(
-                        freq_inds, np.where(freq_arr_use == f)[0])
-                else:
-                    raise ValueError(
-                        'Frequency {f} is not present in the freq_array'.format(f=f))
+            freq_inds, freq_missing = uvutils.get_matching_inds(self.freq_array[0, :],
+                                                                frequencies)
+            if np.any(freq_missing):
+                raise ValueError(
+                    'Frequency {f} is not present in the freq_array'.format(
+                        f=frequencies[np.nonzero(freq_missing)[0][0]]))
 
             if len(frequencies) > 1:
                 freq_ind_separation = freq_inds[1:] - freq_inds[:-1]
@@ -1174,7 +1449,7 @@ class UVData(UVBase):
                                   'will make it impossible to write this data out to '
                                   'some file types.')
 
-            freq_inds = list(sorted(set(list(freq_inds))))
+            freq_inds = np.unique(freq_inds)
         else:
             freq_inds = None
 
@@ -1186,18 +1461,14 @@ class UVData(UVBase):
                 history_update_string += 'polarizations'
             n_selects += 1
 
-            pol_inds = np.zeros(0, dtype=np.int)
-            for p in polarizations:
-                if isinstance(p, str):
-                    p_num = uvutils.polstr2num(p)
-                else:
-                    p_num = p
-                if p_num in self.polarization_array:
-                    pol_inds = np.append(pol_inds, np.where(
-                        self.polarization_array == p_num)[0])
-                else:
-                    raise ValueError(
-                        'Polarization {p} is not present in the polarization_array'.format(p=p))
+            pol_nums = [uvutils.polstr2num(p) if isinstance(p, str) else p
+                        for p in polarizations]
+            pol_inds, pol_missing = uvutils.get_matching_inds(self.polarization_array,
+                                                              pol_nums)
+            if np.any(pol_missing):
+                raise ValueError(
+                    'Polarization {p} is not present in the polarization_array'.format(
+                        p=polarizations[np.nonzero(pol_missing)[0][0]]))
 
             if len(pol_inds) > 2:
                 pol_ind_separation = pol_inds[1:] - pol_inds[:-1]
@@ -1206,7 +1477,7 @@ class UVData(UVBase):
                                   'will make it impossible to write this data out to '
                                   'some file types')
 
-            pol_inds = list(sorted(set(list(pol_inds))))
+            pol_inds = np.unique(pol_inds)
         else:
             pol_inds = None
 
@@ -1298,7 +1569,7 @@ class UVData(UVBase):
         if inplace:
             uv_object = self
         else:
-            uv_object = copy.deepcopy(self)
+            uv_object = self._copy_sharing_arrays()
 
         blt_inds, freq_inds, pol_inds, history_update_string = \
             uv_object._select_preprocess(antenna_nums, antenna_names, ant_str, ant_pairs_nums,
@@ -1309,27 +1580,137 @@ class UVData(UVBase):
 
         if blt_inds is not None:
             uv_object.data_array = uv_object.data_array[blt_inds, :, :, :]
-            uv_object.flag_array = uv_object.flag_array[blt_inds, :, :, :]
+            uv_object.flag_array = np.take(uv_object.flag_array, blt_inds, axis=0)
             uv_object.nsample_array = uv_object.nsample_array[blt_inds, :, :, :]
 
         if freq_inds is not None:
             uv_object.data_array = uv_object.data_array[:, :, freq_inds, :]
-            uv_object.flag_array = uv_object.flag_array[:, :, freq_inds, :]
+            uv_object.flag_array = np.take(uv_object.flag_array, freq_inds, axis=2)
             uv_object.nsample_array = uv_object.nsample_array[:, :, freq_inds, :]
 
         if pol_inds is not None:
             uv_object.data_array = uv_object.data_array[:, :, :, pol_inds]
-            uv_object.flag_array = uv_object.flag_array[:, :, :, pol_inds]
+            uv_object.flag_array = np.take(uv_object.flag_array, pol_inds, axis=3)
             uv_object.nsample_array = uv_object.nsample_array[:, :, :, pol_inds]
 
+        if not inplace:
+            # copy any arrays that were not replaced by the select
+            uv_object._unshare_arrays(self)
+
         # check if object is uv_object-consistent
         if run_check:
             uv_object.check(check_extra=check_extra,
-                            run_check_acceptability=run_check_acceptability)
+                            run_check_acceptability=run_check_acceptability,
+                            only_modified=True)
 
         if not inplace:
             return uv_object
 
+    def reorder_blts(self, order='time', run_check=True, check_extra=True,
+                     run_check_acceptability=True):
+        """
+        Arrange the data along the baseline-time axis in a given order.
+
+        Sorting by baseline makes the data for each baseline contiguous, so
+        get_data, get_flags and get_nsamples return contiguous views for
+        antenna pairs (if the data do not need to be conjugated).
+
+        Args:
+            order: Either a string specifying the ordering or an index array of
+                length Nblts giving the new order of the baseline-times.
+                'time': sort by time and then baseline number (default).
+                'baseline': sort by baseline number and then time.
+                The ordering is recorded in the blt_order attribute (which is
+                set to None if an index array is passed).
+            run_check: Option to check for the existence and proper shapes of
+                parameters after reordering. Default is True.
+            check_extra: Option to check optional parameters as well as required
+                ones. Default is True.
+            run_check_acceptability: Option to check acceptable range of the values of
+                parameters after reordering. Default is True.
+        """
+        if isinstance(order, str):
+            # times that only differ by floating point errors sort as the same time
+            blt_keys = self._get_blt_keys(self.time_array, self.baseline_array)
+            if order == 'time':
+                index_array = np.argsort(blt_keys, kind='mergesort')
+                blt_order = ['time', 'baseline']
+            elif order == 'baseline':
+                index_array = np.lexsort((blt_keys, self.baseline_array))
+                blt_order = ['baseline', 'time']
+            else:
+                raise ValueError("order must be one of 'time' or 'baseline' "
+                                 "or an index array of length Nblts")
+        else:
+            index_array = np.asarray(order)
+            if (index_array.shape != (self.Nblts,)
+                    or not np.array_equal(np.sort(index_array), np.arange(self.Nblts))):
+                raise ValueError('If order is an index array, it must contain all '
+                                 'indices for the baseline-time axis exactly once.')
+            blt_order = None
+
+        if not np.all(np.diff(index_array) == 1):
+            # reorder all the parameters with a baseline-time axis
+            for p in self:
+                param = getattr(self, p)
+                if not isinstance(param.form, tuple) or 'Nblts' not in param.form:
+                    continue
+                value = getattr(self, param.name)
+                if value is not None:
+                    setattr(self, param.name,
+                            np.take(value, index_array, axis=param.form.index('Nblts')))
+
+        self.blt_order = blt_order
+
+        # check if object is self-consistent
+        if run_check:
+            self.check(check_extra=check_extra,
+                       run_check_acceptability=run_check_acceptability)
+
+    def pack_flags(self):
+        """
+        Store the flag_array as packed bits (8 flags per byte).
+
+        The flag_array attribute can still be indexed like a boolean array
+        (only the indexed baseline-times are unpacked) and get_flags, select,
+        reorder_blts, adding and concatenating all work with packed flags,
+        keeping them packed. Selecting, reordering and adding along the
+        baseline-time axis work on the packed bytes directly. Use
+        np.asarray(flag_array) or unpack_flags to get a full boolean array.
+        """
+        if self.flag_array is not None and not isinstance(self.flag_array,
+                                                          uvutils._PackedFlags):
+            self.flag_array = uvutils._PackedFlags(self.flag_array)
+
+    def unpack_flags(self):
+        """Store the flag_array as a boolean array (undoes pack_flags)."""
+        if isinstance(self.flag_array, uvutils._PackedFlags):
+            self.flag_array = self.flag_array.unpack()
+
+    def set_data_array_dtype(self, data_array_dtype):
+        """
+        Convert the data_array and nsample_array to a given precision.
+
+        The data are converted in place (no copy is made if they already have
+        the requested precision). Phasing, selecting, adding and writing
+        preserve the precision of the data_array and nsample_array.
+
+        Args:
+            data_array_dtype: Datatype for the data_array, either np.complex64
+                or np.complex128. The nsample_array gets the matching real
+                precision (np.float32 or np.float64).
+        """
+        try:
+            data_dtype, nsample_dtype = uvutils.get_data_precision_dtypes(data_array_dtype)
+        except ValueError:
+            data_dtype = None
+        if data_dtype is None:
+            raise ValueError('data_array_dtype must be np.complex64 or np.complex128')
+        if self.data_array is not None:
+            self.data_array = self.data_array.astype(data_dtype, copy=False)
+        if self.nsample_array is not None:
+            self.nsample_array = self.nsample_array.astype(nsample_dtype, copy=False)
+
     def _convert_from_filetype(self, other):
         for p in other:
             param = getattr(other, p)
@@ -1355,11 +1736,109 @@ class UVData(UVBase):
             setattr(other_obj, p, param)
         return other_obj
 
+    def read(self, filename, file_type=None, n_workers=1, **kwargs):
+        """
+        Read one or more files of any supported type, optionally reading them
+        in parallel.
+
+        A list of files is combined (in the order given) as the read_<file_type>
+        methods combine lists of files, i.e. by adding the objects read from
+        each file. With more than one worker, the files are read concurrently
+        in a process pool. The data, flag and nsample arrays are passed back
+        from the workers through memory mapped files (in shared memory if
+        available) rather than being pickled, and any warnings raised in the
+        workers are re-raised here. If the files only differ along one of the
+        baseline-time, frequency or polarization axes, the objects are combined
+        with fast_concat (giving the same object as adding them would), which
+        copies each array out of the memory mapped files only once.
+
+        Args:
+            filename: The file or list of files to read from.
+            file_type: One of 'uvfits', 'miriad' or 'uvh5'. If not provided,
+                it is determined from the file name: directories are read as
+                miriad files and files ending in '.uvfits' or '.uvh5' are read
+                as uvfits or uvh5 files respectively.
+            n_workers: The number of processes to use to read a list of files.
+                Default is 1 (read the files one at a time in this process).
+            kwargs: Any other keywords (e.g. select on read keywords like
+                antenna_nums, times or freq_chans, or run_check) are passed
+                to the read_<file_type> method used to read each file.
+        """
+        if isinstance(filename, (list, tuple)):
+            filenames = list(filename)
+        else:
+            filenames = [filename]
+        if len(filenames) == 0:
+            raise ValueError('filename must be a file or a non-empty list of files.')
+        if file_type is None:
+            file_types = set(_get_file_type(f) for f in filenames)
+            if len(file_types) > 1:
+                raise ValueError('All files must be the same type. Use the '
+                                 'file_type keyword to specify the type.')
+            file_type = file_types.pop()
+        if file_type not in ['uvfits', 'miriad', 'uvh5']:
+            raise ValueError("The file_type must be one of 'uvfits', 'miriad' or 'uvh5'.")
+        if not isinstance(n_workers, (int, long)) or n_workers < 1:
+            raise ValueError('n_workers must be a positive integer.')
+
+        read_func = getattr(self, 'read_' + file_type)
+        if n_workers == 1 or len(filenames) == 1:
+            read_func(filename, **kwargs)
+            return
+
+        if not kwargs.get('read_data', True):
+            raise ValueError('read_data cannot be False for a list of ' + file_type + ' files')
+        if kwargs.get('lazy_data', False):
+            raise ValueError('lazy_data cannot be True when reading with more than one worker')
+
+        if os.path.isdir('/dev/shm'):
+            shared_dir = tempfile.mkdtemp(prefix='pyuvdata_', dir='/dev/shm')
+        else:
+            shared_dir = tempfile.mkdtemp(prefix='pyuvdata_')
+        try:
+            pool = multiprocessing.Pool(min(n_workers, len(filenames)))
+            try:
+                results = pool.map(_read_file_to_shared_memory,
+                                   [(f, file_type, kwargs, os.path.join(shared_dir, str(i)))
+                                    for i, f in enumerate(filenames)])
+            finally:
+                pool.close()
+                pool.join()
+
+            uv_objs = []
+            for uv, shared_files, file_warnings in results:
+                for message, category in file_warnings:
+                    warnings.warn(message, category)
+                for p, shared_file in shared_files.items():
+                    # copy on write, so the arrays are only copied out of the
+                    # memory mapped files when they are combined (or changed)
+                    setattr(uv, p, np.load(shared_file, mmap_mode='c'))
+                uv_objs.append(uv)
+        finally:
+            # the memory maps stay valid after their files are removed
+            shutil.rmtree(shared_dir, ignore_errors=True)
+
+        check_kwargs = dict((key, kwargs[key]) for key in
+                            ['run_check', 'check_extra', 'run_check_acceptability']
+                            if key in kwargs)
+        uv = _combine_along_axis(uv_objs, **check_kwargs)
+        if uv is None:
+            uv = uv_objs[0]
+            for uv2 in uv_objs[1:]:
+                uv.__add__(uv2, inplace=True, **check_kwargs)
+        del(uv_objs)
+        for p in ['data_array', 'flag_array', 'nsample_array']:
+            if isinstance(getattr(uv, p), np.memmap):
+                # an array that was not combined, copy it out of the memory map
+                setattr(uv, p, np.array(getattr(uv, p)))
+        self._convert_from_filetype(uv)
+
     def read_uvfits(self, filename, antenna_nums=None, antenna_names=None,
                     ant_str=None, ant_pairs_nums=None, frequencies=None,
                     freq_chans=None, times=None, polarizations=None, blt_inds=None,
                     read_data=True, read_metadata=True, run_check=True,
-                    check_extra=True, run_check_acceptability=True):
+                    check_extra=True, run_check_acceptability=True,
+                    data_array_dtype=None):
         """
         Read in header, metadata and data from uvfits file(s).
 
@@ -1415,6 +1894,10 @@ class UVData(UVBase):
             run_check_acceptability: Option to check acceptable range of the values of
                 parameters after reading in the file. Default is True.
                 Ignored if read_data is False.
+            data_array_dtype: Datatype for the data_array, either np.complex64
+                or np.complex128. The nsample_array gets the matching real
+                precision (np.float32 or np.float64). Default is None, which
+                keeps the precision the file reader produces.
         """
         import uvfits
         if isinstance(filename, (list, tuple)):
@@ -1427,7 +1910,8 @@ class UVData(UVBase):
                              freq_chans=freq_chans, times=times,
                              polarizations=polarizations, blt_inds=blt_inds,
                              run_check=run_check, check_extra=check_extra,
-                             run_check_acceptability=run_check_acceptability)
+                             run_check_acceptability=run_check_acceptability,
+                             data_array_dtype=data_array_dtype)
             if len(filename) > 1:
                 for f in filename[1:]:
                     uv2 = UVData()
@@ -1437,7 +1921,8 @@ class UVData(UVBase):
                                     freq_chans=freq_chans, times=times,
                                     polarizations=polarizations, blt_inds=blt_inds,
                                     run_check=run_check, check_extra=check_extra,
-                                    run_check_acceptability=run_check_acceptability)
+                                    run_check_acceptability=run_check_acceptability,
+                                    data_array_dtype=data_array_dtype)
                     self += uv2
                 del(uv2)
         else:
@@ -1449,7 +1934,8 @@ class UVData(UVBase):
                                    polarizations=polarizations, blt_inds=blt_inds,
                                    read_data=read_data, read_metadata=read_metadata,
                                    run_check=run_check, check_extra=check_extra,
-                                   run_check_acceptability=run_check_acceptability)
+                                   run_check_acceptability=run_check_acceptability,
+                                   data_array_dtype=data_array_dtype)
             self._convert_from_filetype(uvfits_obj)
             del(uvfits_obj)
 
@@ -1475,7 +1961,7 @@ class UVData(UVBase):
                          ant_str=None, ant_pairs_nums=None, frequencies=None,
                          freq_chans=None, times=None, polarizations=None,
                          blt_inds=None, run_check=True, check_extra=True,
-                         run_check_acceptability=True):
+                         run_check_acceptability=True, data_array_dtype=None):
         """
         Read in data but not header info from a uvfits file
         (useful for an object that already has the associated header info).
@@ -1519,6 +2005,10 @@ class UVData(UVBase):
                 ones. Default is True.
             run_check_acceptability: Option to check acceptable range of the values of
                 parameters after reading in the file. Default is True.
+            data_array_dtype: Datatype for the data_array, either np.complex64
+                or np.complex128. The nsample_array gets the matching real
+                precision (np.float32 or np.float64). Default is None, which
+                keeps the precision the file reader produces.
         """
         import uvfits
         if isinstance(filename, (list, tuple)):
@@ -1531,7 +2021,8 @@ class UVData(UVBase):
                                     freq_chans=freq_chans, times=times,
                                     polarizations=polarizations, blt_inds=blt_inds,
                                     run_check=run_check, check_extra=check_extra,
-                                    run_check_acceptability=run_check_acceptability)
+                                    run_check_acceptability=run_check_acceptability,
+                                    data_array_dtype=data_array_dtype)
         self._convert_from_filetype(uvfits_obj)
         del(uvfits_obj)
 
@@ -1563,7 +2054,8 @@ class UVData(UVBase):
         del(uvfits_obj)
 
     def read_ms(self, filepath, run_check=True, check_extra=True,
-                run_check_acceptability=True, data_column='DATA', pol_order='AIPS'):
+                run_check_acceptability=True, data_column='DATA', pol_order='AIPS',
+                data_array_dtype=None):
         """
         Read in data from a measurement set
 
@@ -1579,6 +2071,10 @@ class UVData(UVBase):
                 'DATA', 'MODEL', or 'CORRECTED_DATA'
             pol_order: specify whether you want polarizations ordered by
                 'CASA' or 'AIPS' conventions.
+            data_array_dtype: Datatype for the data_array, either np.complex64
+                or np.complex128. The nsample_array gets the matching real
+                precision (np.float32 or np.float64). Default is None, which
+                keeps the precision the file reader produces.
         """
 
         # check if casacore is installed
@@ -1596,25 +2092,28 @@ class UVData(UVBase):
         if isinstance(filepath, (list, tuple)):
             self.read_ms(filepath[0], run_check=run_check, check_extra=check_extra,
                          run_check_acceptability=run_check_acceptability,
-                         data_column=data_column, pol_order=pol_order)
+                         data_column=data_column, pol_order=pol_order,
+                         data_array_dtype=data_array_dtype)
             if len(filepath) > 1:
                 for f in filepath[1:]:
                     uv2 = UVData()
                     uv2.read_ms(f, run_check=run_check, check_extra=check_extra,
                                 run_check_acceptability=run_check_acceptability,
-                                data_column=data_column, pol_order=pol_order)
+                                data_column=data_column, pol_order=pol_order,
+                                data_array_dtype=data_array_dtype)
                     self += uv2
                 del(uv2)
         else:
             ms_obj = ms.MS()
             ms_obj.read_ms(filepath, run_check=run_check, check_extra=check_extra,
                            run_check_acceptability=run_check_acceptability,
-                           data_column=data_column, pol_order=pol_order)
+                           data_column=data_column, pol_order=pol_order,
+                           data_array_dtype=data_array_dtype)
             self._convert_from_filetype(ms_obj)
             del(ms_obj)
 
     def read_fhd(self, filelist, use_model=False, run_check=True, check_extra=True,
-                 run_check_acceptability=True):
+                 run_check_acceptability=True, data_array_dtype=None):
         """
         Read in data from a list of FHD files.
 
@@ -1630,34 +2129,43 @@ class UVData(UVBase):
                 ones. Default is True.
             run_check_acceptability: Option to check acceptable range of the values of
                 parameters after reading in the file. Default is True.
+            data_array_dtype: Datatype for the data_array, either np.complex64
+                or np.complex128. The nsample_array gets the matching real
+                precision (np.float32 or np.float64). Default is None, which
+                keeps the precision the file reader produces.
         """
         import fhd
         if isinstance(filelist[0], (list, tuple)):
             self.read_fhd(filelist[0], use_model=use_model, run_check=run_check,
                           check_extra=check_extra,
-                          run_check_acceptability=run_check_acceptability)
+                          run_check_acceptability=run_check_acceptability,
+                          data_array_dtype=data_array_dtype)
             if len(filelist) > 1:
                 for f in filelist[1:]:
                     uv2 = UVData()
                     uv2.read_fhd(f, use_model=use_model, run_check=run_check,
                                  check_extra=check_extra,
-                                 run_check_acceptability=run_check_acceptability)
+                                 run_check_acceptability=run_check_acceptability,
+                                 data_array_dtype=data_array_dtype)
                     self += uv2
                 del(uv2)
         else:
             fhd_obj = fhd.FHD()
             fhd_obj.read_fhd(filelist, use_model=use_model, run_check=run_check,
                              check_extra=check_extra,
-                             run_check_acceptability=run_check_acceptability)
+                             run_check_acceptability=run_check_acceptability,
+                             data_array_dtype=data_array_dtype)
             self._convert_from_filetype(fhd_obj)
             del(fhd_obj)
 
     def read_miriad(self, filepath, correct_lat_lon=True, run_check=True,
                     check_extra=True, run_check_acceptability=True, phase_type=None,
                     antenna_nums=None, ant_str=None, ant_pairs_nums=None,
-                    polarizations=None, time_range=None):
+                    polarizations=None, time_range=None, frequencies=None,
+                    freq_chans=None, times=None, blt_inds=None, data_array_dtype=None):
         """
-        Read in data from a miriad file.
+        Read in data from a miriad file. Supports reading only selected
+        portions of the data.
 
         Args:
             filepath: The miriad file directory or list of directories to read from.
@@ -1679,6 +2187,18 @@ class UVData(UVBase):
                 Ex: ['xx', 'yy', ...]
             time_range: len-2 list containing min and max range of times (Julian Date) to read-in.
                 Ex: [2458115.20, 2458115.40]
+            frequencies: The frequencies to include when reading data into the
+                object.
+            freq_chans: The frequency channel numbers to include when reading
+                data into the object.
+            times: The times to include when reading data into the object.
+            blt_inds: The baseline-time indices to include when reading data
+                into the object. The indices refer to the baseline-time axis
+                of the data read in with the other selections applied.
+            data_array_dtype: Datatype for the data_array, either np.complex64
+                or np.complex128. The nsample_array gets the matching real
+                precision (np.float32 or np.float64). Default is None, which
+                keeps the precision the file reader produces.
         """
         import miriad
         if isinstance(filepath, (list, tuple)):
@@ -1687,7 +2207,10 @@ class UVData(UVBase):
                              run_check_acceptability=run_check_acceptability,
                              phase_type=phase_type, antenna_nums=antenna_nums,
                              ant_str=ant_str, ant_pairs_nums=ant_pairs_nums,
-                             polarizations=polarizations, time_range=time_range)
+                             polarizations=polarizations, time_range=time_range,
+                             frequencies=frequencies, freq_chans=freq_chans,
+                             times=times, blt_inds=blt_inds,
+                             data_array_dtype=data_array_dtype)
             if len(filepath) > 1:
                 for f in filepath[1:]:
                     uv2 = UVData()
@@ -1696,7 +2219,10 @@ class UVData(UVBase):
                                     run_check_acceptability=run_check_acceptability,
                                     phase_type=phase_type, antenna_nums=antenna_nums,
                                     ant_str=ant_str, ant_pairs_nums=ant_pairs_nums,
-                                    polarizations=polarizations, time_range=time_range)
+                                    polarizations=polarizations, time_range=time_range,
+                                    frequencies=frequencies, freq_chans=freq_chans,
+                                    times=times, blt_inds=blt_inds,
+                                    data_array_dtype=data_array_dtype)
                     self += uv2
                 del(uv2)
         else:
@@ -1706,7 +2232,10 @@ class UVData(UVBase):
                                    run_check_acceptability=run_check_acceptability,
                                    phase_type=phase_type, antenna_nums=antenna_nums,
                                    ant_str=ant_str, ant_pairs_nums=ant_pairs_nums,
-                                   polarizations=polarizations, time_range=time_range)
+                                   polarizations=polarizations, time_range=time_range,
+                                   frequencies=frequencies, freq_chans=freq_chans,
+                                   times=times, blt_inds=blt_inds,
+                                   data_array_dtype=data_array_dtype)
             self._convert_from_filetype(miriad_obj)
             del(miriad_obj)
 
@@ -1734,43 +2263,129 @@ class UVData(UVBase):
                                 clobber=clobber, no_antnums=no_antnums)
         del(miriad_obj)
 
-    def read_uvh5(self, filename, run_check=True, check_extra=True,
-                  run_check_acceptability=True):
+    def read_uvh5(self, filename, antenna_nums=None, antenna_names=None,
+                  ant_str=None, ant_pairs_nums=None, frequencies=None,
+                  freq_chans=None, times=None, polarizations=None, blt_inds=None,
+                  read_data=True, lazy_data=False, data_array_dtype=None,
+                  run_check=True, check_extra=True, run_check_acceptability=True,
+                  pack_flags=False):
         """
         Read a UVH5 file.
 
         Args:
-            filename: The UVH5 file to read.
+            filename: The UVH5 file or list of files to read from.
+            antenna_nums: The antennas numbers to include when reading data into
+                the object (antenna positions and names for the excluded antennas
+                will be retained). This cannot be provided if antenna_names is
+                also provided.
+            antenna_names: The antennas names to include when reading data into
+                the object (antenna positions and names for the excluded antennas
+                will be retained). This cannot be provided if antenna_nums is
+                also provided.
+            ant_pairs_nums: A list of antenna number tuples (e.g. [(0,1), (3,2)])
+                specifying baselines to include when reading data into the object.
+                Ordering of the numbers within the tuple does not matter.
+            ant_str: A string containing information about what antenna numbers
+                and polarizations to include when reading data into the object.
+                Can be 'auto', 'cross', 'all', or combinations of antenna numbers
+                and polarizations (e.g. '1', '1_2', '1x_2y').
+                See tutorial for more examples of valid strings and
+                the behavior of different forms for ant_str.
+                If '1x_2y,2y_3y' is passed, both polarizations 'xy' and 'yy' will
+                be kept for both baselines (1,2) and (2,3) to return a valid
+                pyuvdata object.
+                An ant_str cannot be passed in addition to any of the above antenna
+                args or the polarizations arg.
+            frequencies: The frequencies to include when reading data into the
+                object.
+            freq_chans: The frequency channel numbers to include when reading
+                data into the object.
+            times: The times to include when reading data into the object.
+            polarizations: The polarizations to include when reading data into
+                the object.
+            blt_inds: The baseline-time indices to include when reading data into
+                the object. This is not commonly used.
+            read_data: Read in the visibility, flag and nsample data. If set to
+                False, only the header (which contains all the metadata) is read
+                and the select arguments are ignored. Results in an incompletely
+                defined object (check will not pass). Default True.
+            lazy_data: Do not read the visibility, flag and nsample data until
+                they are accessed. The data_array, flag_array and nsample_array
+                attributes are read in (applying any selection) on first access,
+                get_data, get_flags and get_nsamples only read the requested
+                portions from disk. The file must not be modified or removed
+                until the data are read. Default False.
+            data_array_dtype: Datatype for the data_array, either np.complex64
+                or np.complex128. Visibilities stored as scaled integers are
+                converted using the scale factor recorded in the file. None
+                keeps complex visibilities as stored and converts scaled
+                integers to complex64. 'raw' keeps the visibilities as stored,
+                so scaled integers are left as the compound integer array
+                (fields 'r' and 'i', without the scale factor applied) and the
+                object will not pass check (run_check is ignored). Default None.
             run_check: Option to check for the existence and proper shapes of
                 parameters after reading in the file. Default is True.
+                Ignored if read_data is False.
             check_extra: Option to check optional parameters as well as required
-                ones. Default is True.
+                ones. Default is True. Ignored if read_data is False.
             run_check_acceptability: Option to check acceptable range of the values of
                 parameters after reading in the file. Default is True.
+                Ignored if read_data is False.
+            pack_flags: Option to store the flag_array as packed bits (see
+                pack_flags). Flags that are packed in the file are read without
+                unpacking them. Default False.
 
         Returns:
             None
         """
         import uvh5
         if isinstance(filename, (list, tuple)):
-            self.read_uvh5(filename[0], run_check=run_check, check_extra=check_extra,
-                           run_check_acceptability=run_check_acceptability)
+            if not read_data:
+                raise ValueError('read_data cannot be False for a list of uvh5 files')
+
+            self.read_uvh5(filename[0], antenna_nums=antenna_nums,
+                           antenna_names=antenna_names, ant_str=ant_str,
+                           ant_pairs_nums=ant_pairs_nums, frequencies=frequencies,
+                           freq_chans=freq_chans, times=times,
+                           polarizations=polarizations, blt_inds=blt_inds,
+                           lazy_data=lazy_data, data_array_dtype=data_array_dtype,
+                           run_check=run_check, check_extra=check_extra,
+                           run_check_acceptability=run_check_acceptability,
+                           pack_flags=pack_flags)
             if len(filename) > 1:
                 for f in filename[1:]:
                     uv2 = UVData()
-                    uv2.read_uvh5(f, run_check=run_check, check_extra=check_extra,
-                                  run_check_acceptability=run_check_acceptability)
+                    uv2.read_uvh5(f, antenna_nums=antenna_nums,
+                                  antenna_names=antenna_names, ant_str=ant_str,
+                                  ant_pairs_nums=ant_pairs_nums, frequencies=frequencies,
+                                  freq_chans=freq_chans, times=times,
+                                  polarizations=polarizations, blt_inds=blt_inds,
+                                  lazy_data=lazy_data, data_array_dtype=data_array_dtype,
+                                  run_check=run_check, check_extra=check_extra,
+                                  run_check_acceptability=run_check_acceptability,
+                                  pack_flags=pack_flags)
                     self += uv2
                 del(uv2)
         else:
             uvh5_obj = uvh5.UVH5()
-            uvh5_obj.read_uvh5(filename, run_check=run_check, check_extra=check_extra,
-                               run_check_acceptability=run_check_acceptability)
+            uvh5_obj.read_uvh5(filename, antenna_nums=antenna_nums,
+                               antenna_names=antenna_names, ant_str=ant_str,
+                               ant_pairs_nums=ant_pairs_nums, frequencies=frequencies,
+                               freq_chans=freq_chans, times=times,
+                               polarizations=polarizations, blt_inds=blt_inds,
+                               read_data=read_data, lazy_data=lazy_data,
+                               data_array_dtype=data_array_dtype,
+                               run_check=run_check, check_extra=check_extra,
+                               run_check_acceptability=run_check_acceptability,
+                               pack_flags=pack_flags)
             self._convert_from_filetype(uvh5_obj)
             del(uvh5_obj)
 
     def write_uvh5(self, filename, run_check=True, check_extra=True,
-                   run_check_acceptability=True, clobber=False):
+                   run_check_acceptability=True, clobber=False, chunks=True,
+                   data_compression=None, flags_compression=None,
+                   nsample_compression=None, data_write_dtype=None, data_scale=None,
+                   pack_flags=False):
         """
         Write a UVData object to a UVH5 file.
 
@@ -1783,6 +2398,38 @@ class UVData(UVBase):
             run_check_acceptability: Option to check acceptable range of the values of
                 parameters before writing the file. Default is True.
             clobber: Option to overwrite the file if it already exists. Default is False.
+            chunks: Chunk shape of the visdata, flags and nsample_array datasets.
+                True lets h5py pick the chunk shape, None writes contiguous
+                (unchunked) datasets, which cannot be compressed. Otherwise a
+                tuple of the chunk length along each axis (Nblts, Nspws, Nfreqs, Npols),
+                elements that are None use the full axis. For example
+                (1, 1, None, 1) makes one chunk per baseline-time and polarization
+                (fast baseline access) while (None, 1, 8, 1) makes chunks of
+                8 channels (fast frequency access). Default is True.
+            data_compression: Compression filter for the visdata dataset. Either
+                None (no compression), the name of a filter included with h5py
+                ('gzip', 'lzf', 'szip'), the integer id of a filter loaded as an
+                HDF5 plugin (e.g. 32008 for bitshuffle) or a tuple of the filter
+                and its options (e.g. ('gzip', 9)). Default is None.
+            flags_compression: Compression filter for the flags dataset, same
+                options as data_compression. Default is None.
+            nsample_compression: Compression filter for the nsample_array
+                dataset, same options as data_compression. Default is None.
+            data_write_dtype: Datatype of the visdata dataset. Either None
+                (complex64), np.complex64, np.complex128, or np.int16 or np.int32
+                to store the visibilities as a compound pair of scaled integers
+                (fields 'r' and 'i') with the scale factor recorded in the
+                'scale_factor' attribute of the dataset. Default None.
+            data_scale: Scale factor for visibilities stored as scaled integers,
+                the stored integers are the visibilities divided by data_scale,
+                rounded (and clipped to the integer range). None picks the scale
+                factor that uses the full integer range for the data.
+                Ignored for complex data_write_dtypes. Default None.
+            pack_flags: Option to store the flags as packed bits, 8 flags per
+                byte (see pack_flags). The flags dataset then has one row of
+                packed bytes per baseline-time, with the unpacked shape in its
+                'packed_shape' attribute. Files with packed flags cannot be
+                written to with write_uvh5_part. Default False.
 
         Returns:
             None
@@ -1791,7 +2438,112 @@ class UVData(UVBase):
         uvh5_obj.write_uvh5(filename, run_check=run_check,
                             check_extra=check_extra,
                             run_check_acceptability=run_check_acceptability,
-                            clobber=clobber)
+                            clobber=clobber, chunks=chunks,
+                            data_compression=data_compression,
+                            flags_compression=flags_compression,
+                            nsample_compression=nsample_compression,
+                            data_write_dtype=data_write_dtype, data_scale=data_scale,
+                            pack_flags=pack_flags)
+        del(uvh5_obj)
+
+    def initialize_uvh5_file(self, filename, clobber=False, chunks=True,
+                             data_compression=None, flags_compression=None,
+                             nsample_compression=None, data_write_dtype=None,
+                             data_scale=None):
+        """
+        Create a UVH5 file with the full header and empty visdata, flags and
+        nsample_array datasets, to be filled in later with write_uvh5_part.
+
+        Only the metadata on the object are used, the data, flag and nsample
+        arrays do not need to be set. All the datasets are initialized to zero
+        (so the flags are initialized to False).
+
+        Args:
+            filename: The UVH5 file to create.
+            clobber: Option to overwrite the file if it already exists. Default is False.
+            chunks: Chunk shape of the visdata, flags and nsample_array datasets,
+                see write_uvh5. Chunk shapes that match the blocks written with
+                write_uvh5_part make the partial writes faster. Default is True.
+            data_compression: Compression filter for the visdata dataset, see
+                write_uvh5. Default is None.
+            flags_compression: Compression filter for the flags dataset, see
+                write_uvh5. Default is None.
+            nsample_compression: Compression filter for the nsample_array
+                dataset, see write_uvh5. Default is None.
+            data_write_dtype: Datatype of the visdata dataset, see write_uvh5.
+                Default None.
+            data_scale: Scale factor for visibilities stored as scaled integers,
+                see write_uvh5. If None, the data_array on the object is used
+                to pick the scale factor if it is set, otherwise it is 1.
+                Default None.
+
+        Returns:
+            None
+        """
+        uvh5_obj = self._convert_to_filetype('uvh5')
+        uvh5_obj.initialize_uvh5_file(filename, clobber=clobber, chunks=chunks,
+                                      data_compression=data_compression,
+                                      flags_compression=flags_compression,
+                                      nsample_compression=nsample_compression,
+                                      data_write_dtype=data_write_dtype,
+                                      data_scale=data_scale)
+        del(uvh5_obj)
+
+    def write_uvh5_part(self, filename, data_array, flag_array, nsample_array,
+                        check_header=True, antenna_nums=None, antenna_names=None,
+                        ant_str=None, ant_pairs_nums=None, frequencies=None,
+                        freq_chans=None, times=None, polarizations=None,
+                        blt_inds=None):
+        """
+        Write a block of data, flags and nsamples into a UVH5 file created with
+        initialize_uvh5_file. The object must have the metadata for the full
+        file. The part of the file to write to is specified with the same
+        arguments as select, the data, flag and nsample arrays must have the
+        shape of the selected part of the file, with the axes ordered as in
+        the file.
+
+        The visibilities are converted to the datatype of the visdata dataset
+        in the file (using the scale factor recorded in the file for scaled integers).
+
+        Writing different parts of one file from independent processes is
+        possible, but the writes must not happen at the same time because
+        HDF5 does not support concurrent writers.
+
+        Args:
+            filename: The UVH5 file to write to.
+            data_array: The visibility data to write, shape
+                (Nblts_part, Nspws, Nfreqs_part, Npols_part).
+            flag_array: The flags to write, same shape as data_array.
+            nsample_array: The nsamples to write, same shape as data_array.
+            check_header: Option to check that the metadata on the object match
+                the metadata in the file. Default is True.
+            antenna_nums: The antennas numbers to write data for. This cannot
+                be provided if antenna_names is also provided.
+            antenna_names: The antennas names to write data for. This cannot
+                be provided if antenna_nums is also provided.
+            ant_pairs_nums: A list of antenna number tuples (e.g. [(0,1), (3,2)])
+                specifying baselines to write data for. Ordering of the numbers
+                within the tuple does not matter.
+            ant_str: A string containing information about what antenna numbers
+                and polarizations to write data for. See select for details.
+                An ant_str cannot be passed in addition to any of the above antenna
+                args or the polarizations arg.
+            frequencies: The frequencies to write data for.
+            freq_chans: The frequency channel numbers to write data for.
+            times: The times to write data for.
+            polarizations: The polarizations to write data for.
+            blt_inds: The baseline-time indices to write data for.
+
+        Returns:
+            None
+        """
+        uvh5_obj = self._convert_to_filetype('uvh5')
+        uvh5_obj.write_uvh5_part(filename, data_array, flag_array, nsample_array,
+                                 check_header=check_header, antenna_nums=antenna_nums,
+                                 antenna_names=antenna_names, ant_str=ant_str,
+                                 ant_pairs_nums=ant_pairs_nums, frequencies=frequencies,
+                                 freq_chans=freq_chans, times=times,
+                                 polarizations=polarizations, blt_inds=blt_inds)
         del(uvh5_obj)
 
     def reorder_pols(self, order=None, run_check=True, check_extra=True,
@@ -1814,7 +2566,7 @@ class UVData(UVBase):
         self.polarization_array = self.polarization_array[order]
         self.data_array = self.data_array[:, :, :, order]
         self.nsample_array = self.nsample_array[:, :, :, order]
-        self.flag_array = self.flag_array[:, :, :, order]
+        self.flag_array = np.take(self.flag_array, order, axis=3)
 
         # check if object is self-consistent
         if run_check:
@@ -1893,11 +2645,119 @@ class UVData(UVBase):
         else:
             return list(set(''.join(self.get_pols())))
 
+    def _key_cache_is_current(self, cache, params):
+        """
+        Find out if a key cache was built from the current values of the given
+        UVParameters, i.e. none of them have been set since it was built.
+        """
+        return (cache is not None and all(p1 is p2 for p1, p2 in zip(cache[0], params))
+                and cache[1] == [p._version for p in params])
+
+    def _clear_key_caches(self):
+        """
+        Clear the cached antenna pair and polarization indices used to look up
+        keys (e.g. by antpair2ind, get_data and get_flags).
+
+        The indices are rebuilt automatically when ant_1_array, ant_2_array or
+        polarization_array are set, but changes made in place to the contents
+        of these arrays are not seen. Call this method after making such changes.
+        """
+        self._antpair_index_cache = None
+        self._pol_index_cache = None
+
+    def _copy_sharing_arrays(self):
+        """
+        Copy the object, sharing the array values of the UVParameters with this
+        object (see UVBase._copy_sharing_arrays). The key caches are not copied.
+        """
+        caches = (getattr(self, '_antpair_index_cache', None),
+                  getattr(self, '_pol_index_cache', None))
+        self._clear_key_caches()
+        try:
+            return super(UVData, self)._copy_sharing_arrays()
+        finally:
+            self._antpair_index_cache, self._pol_index_cache = caches
+
+    def _get_antpair_index(self):
+        """
+        Get a dict mapping (ant1, ant2) tuples to arrays of blt indices.
+
+        The index is built on first use and rebuilt after ant_1_array or
+        ant_2_array have been set. Changes made in place to the contents of
+        these arrays are not seen, call _clear_key_caches after making them.
+        """
+        params = [self._ant_1_array, self._ant_2_array]
+        cache = getattr(self, '_antpair_index_cache', None)
+        if not self._key_cache_is_current(cache, params):
+            ant_1_array = self._ant_1_array.value
+            ant_2_array = self._ant_2_array.value
+            # group the blts by antenna pair using integer pair keys
+            ant_min = min(np.min(ant_1_array), np.min(ant_2_array))
+            n_ant_keys = max(np.max(ant_1_array), np.max(ant_2_array)) - ant_min + 1
+            pair_keys = ((ant_1_array - ant_min).astype(np.int64) * n_ant_keys
+                         + (ant_2_array - ant_min))
+            blt_order = np.argsort(pair_keys, kind='mergesort')
+            _, pair_starts = np.unique(pair_keys[blt_order], return_index=True)
+            antpairs = zip(ant_1_array[blt_order[pair_starts]].tolist(),
+                           ant_2_array[blt_order[pair_starts]].tolist())
+            index = dict(zip(antpairs, np.split(blt_order, pair_starts[1:])))
+            self._antpair_index_cache = (params, [p._version for p in params], index)
+        return self._antpair_index_cache[2]
+
+    def _get_pol_index(self):
+        """
+        Get a dict mapping polarization numbers to arrays of polarization indices.
+
+        The index is built on first use and rebuilt after polarization_array
+        has been set. Changes made in place to its contents are not seen, call
+        _clear_key_caches after making them.
+        """
+        params = [self._polarization_array]
+        cache = getattr(self, '_pol_index_cache', None)
+        if not self._key_cache_is_current(cache, params):
+            pol_array = self._polarization_array.value
+            index = dict((pol, np.nonzero(pol_array == pol)[0])
+                         for pol in np.unique(pol_array).tolist())
+            self._pol_index_cache = (params, [p._version for p in params], index)
+        return self._pol_index_cache[2]
+
     def antpair2ind(self, ant1, ant2):
         """
         Get blt indices for given (ordered) antenna pair.
+
+        Uses an index of the blt indices for each antenna pair, which is built
+        on first use and rebuilt after ant_1_array or ant_2_array have been set.
+        Call _clear_key_caches after changing the contents of these arrays in place.
+        """
+        inds = self._get_antpair_index().get((ant1, ant2))
+        if inds is None:
+            return np.array([], dtype=np.int64)
+        return inds.copy()
+
+    def _antpair2inds_both(self, ant1, ant2, antpair_index=None):
         """
-        return np.where((self.ant_1_array == ant1) & (self.ant_2_array == ant2))[0]
+        Get blt indices for an antenna pair and for its conjugate pair.
+
+        Args:
+            ant1, ant2: antenna numbers of the pair.
+            antpair_index: Antenna pair index from _get_antpair_index to use.
+                Default is to get the index.
+        """
+        if antpair_index is None:
+            antpair_index = self._get_antpair_index()
+        empty = np.array([], dtype=np.int64)
+        blt_ind1 = antpair_index.get((ant1, ant2), empty).copy()
+        blt_ind2 = antpair_index.get((ant2, ant1), empty).copy()
+        return blt_ind1, blt_ind2
+
+    def _pol2ind(self, pol):
+        """
+        Get polarization indices for a polarization number.
+        """
+        inds = self._get_pol_index().get(pol)
+        if inds is None:
+            return np.array([], dtype=np.int64)
+        return inds.copy()
 
     def _key2inds(self, key):
         """
@@ -1923,7 +2783,7 @@ class UVData(UVBase):
         key = uvutils.get_iterable(key)
         if type(key) is str:
             # Single string given, assume it is polarization
-            pol_ind = np.where(self.polarization_array == uvutils.polstr2num(key))[0]
+            pol_ind = self._pol2ind(uvutils.polstr2num(key))
             if len(pol_ind) == 0:
                 raise KeyError('Polarization {pol} not found in data.'.format(pol=key))
             blt_ind1 = np.arange(self.Nblts)
@@ -1935,45 +2795,41 @@ class UVData(UVBase):
                 blt_ind1, blt_ind2, pol_ind = self._key2inds(key)
             elif key < 5:
                 # Small number, assume it is a polarization number a la AIPS memo
-                pol_ind = np.where(self.polarization_array == key)[0]
+                pol_ind = self._pol2ind(key)
                 if len(pol_ind) == 0:
                     raise KeyError('Polarization {pol} not found in data.'.format(pol=key))
                 blt_ind1 = np.arange(self.Nblts)
                 blt_ind2 = np.array([], dtype=np.int64)
             else:
                 # Larger number, assume it is a baseline number
-                inv_bl = self.antnums_to_baseline(self.baseline_to_antnums(key)[1],
-                                                  self.baseline_to_antnums(key)[0])
-                blt_ind1 = np.where(self.baseline_array == key)[0]
-                blt_ind2 = np.where(self.baseline_array == inv_bl)[0]
+                ant1, ant2 = self.baseline_to_antnums(key)
+                blt_ind1, blt_ind2 = self._antpair2inds_both(ant1, ant2)
                 if len(blt_ind1) + len(blt_ind2) == 0:
                     raise KeyError('Baseline {bl} not found in data.'.format(bl=key))
                 pol_ind = np.arange(self.Npols)
         elif len(key) == 2:
             # Key is an antenna pair
-            blt_ind1 = self.antpair2ind(key[0], key[1])
-            blt_ind2 = self.antpair2ind(key[1], key[0])
+            blt_ind1, blt_ind2 = self._antpair2inds_both(key[0], key[1])
             if len(blt_ind1) + len(blt_ind2) == 0:
                 raise KeyError('Antenna pair {pair} not found in data'.format(pair=key))
             pol_ind = np.arange(self.Npols)
         elif len(key) == 3:
             # Key is an antenna pair + pol
-            blt_ind1 = self.antpair2ind(key[0], key[1])
-            blt_ind2 = self.antpair2ind(key[1], key[0])
+            blt_ind1, blt_ind2 = self._antpair2inds_both(key[0], key[1])
             if len(blt_ind1) + len(blt_ind2) == 0:
                 raise KeyError('Antenna pair {pair} not found in '
                                'data'.format(pair=(key[0], key[1])))
             if type(key[2]) is str:
                 # pol is str
-                pol_ind = np.where(self.polarization_array == uvutils.polstr2num(key[2]))[0]
+                pol_ind = self._pol2ind(uvutils.polstr2num(key[2]))
             else:
                 # polarization number a la AIPS memo
-                pol_ind = np.where(self.polarization_array == key[2])[0]
+                pol_ind = self._pol2ind(key[2])
             if len(pol_ind) == 0:
                 raise KeyError('Polarization {pol} not found in data.'.format(pol=key[2]))
         # Catch autos
         if np.array_equal(blt_ind1, blt_ind2):
-            blt_ind2 = np.array([])
+            blt_ind2 = np.array([], dtype=np.int64)
         return (blt_ind1, blt_ind2, pol_ind)
 
     def _smart_slicing(self, data, ind1, ind2, indp, **kwargs):
@@ -1997,7 +2853,11 @@ class UVData(UVBase):
         force_copy = kwargs.pop('force_copy', False)
         squeeze = kwargs.pop('squeeze', 'default')
 
-        if len(set(np.ediff1d(indp))) <= 1:
+        def regularly_spaced(inds):
+            # regularly spaced indices can be replaced by a slice to get a view
+            return len(inds) <= 2 or np.all(np.diff(inds) == inds[1] - inds[0])
+
+        if regularly_spaced(indp):
             p_reg_spaced = True
             p_start = indp[0]
             p_stop = indp[-1] + 1
@@ -2010,7 +2870,7 @@ class UVData(UVBase):
 
         if len(ind2) == 0:
             # only unconjugated baselines
-            if len(set(np.ediff1d(ind1))) <= 1:
+            if regularly_spaced(ind1):
                 blt_start = ind1[0]
                 blt_stop = ind1[-1] + 1
                 if len(ind1) == 1:
@@ -2029,7 +2889,7 @@ class UVData(UVBase):
                     out = out[:, :, :, indp]
         elif len(ind1) == 0:
             # only conjugated baselines
-            if len(set(np.ediff1d(ind2))) <= 1:
+            if regularly_spaced(ind2):
                 blt_start = ind2[0]
                 blt_stop = ind2[-1] + 1
                 if len(ind2) == 1:
@@ -2079,6 +2939,8 @@ class UVData(UVBase):
         """
         Function for quick access to numpy array with data corresponding to
         a baseline and/or polarization. Returns a read-only view if possible, otherwise a copy.
+        If the data are ordered by baseline (see reorder_blts), the data for an
+        antenna pair are always a contiguous view (unless they need to be conjugated).
 
         Args:
             *args: parameters or tuple of parameters defining the key to identify
@@ -2096,7 +2958,9 @@ class UVData(UVBase):
             before returning.
         """
         ind1, ind2, indp = self._key2inds(args)
-        out = self._smart_slicing(self.data_array, ind1, ind2, indp, **kwargs)
+        # use the parameter value rather than the property so that lazily
+        # loaded data are only read for the requested slice
+        out = self._smart_slicing(self._data_array.value, ind1, ind2, indp, **kwargs)
         return out
 
     def get_flags(self, *args, **kwargs):
@@ -2118,7 +2982,7 @@ class UVData(UVBase):
             Numpy array of flags corresponding to key.
         """
         ind1, ind2, indp = self._key2inds(args)
-        out = self._smart_slicing(self.flag_array, ind1, ind2, indp, **kwargs)
+        out = self._smart_slicing(self._flag_array.value, ind1, ind2, indp, **kwargs)
         return out
 
     def get_nsamples(self, *args, **kwargs):
@@ -2140,7 +3004,7 @@ class UVData(UVBase):
             Numpy array of nsamples corresponding to key.
         """
         ind1, ind2, indp = self._key2inds(args)
-        out = self._smart_slicing(self.nsample_array, ind1, ind2, indp, **kwargs)
+        out = self._smart_slicing(self._nsample_array.value, ind1, ind2, indp, **kwargs)
         return out
 
     def get_times(self, *args):
@@ -2172,8 +3036,16 @@ class UVData(UVBase):
             data: Numpy array with data which is the result of self[key]
         """
         antpairpols = self.get_antpairpols()
+        # get the antenna pair index once rather than for every key
+        antpair_index = self._get_antpair_index()
         for key in antpairpols:
-            yield (key, self.get_data(key, squeeze=squeeze))
+            ind1, ind2 = self._antpair2inds_both(key[0], key[1],
+                                                 antpair_index=antpair_index)
+            if key[0] == key[1]:
+                ind2 = np.array([], dtype=np.int64)
+            indp = self._pol2ind(uvutils.polstr2num(key[2]))
+            yield (key, self._smart_slicing(self._data_array.value, ind1, ind2, indp,
+                                            squeeze=squeeze))
 
     def parse_ants(self, ant_str, print_toggle=False):
         """
@@ -2386,3 +3258,133 @@ class UVData(UVBase):
                           .format(p=(',').join(warned_pols).upper()))
 
         return ant_pairs_nums, polarizations
+
+
+def _get_file_type(filename):
+    """Determine the file type (for UVData.read) from the file name."""
+    if os.path.isdir(filename):
+        return 'miriad'
+    if filename.endswith('.uvfits'):
+        return 'uvfits'
+    if filename.endswith('.uvh5'):
+        return 'uvh5'
+    raise ValueError('File type could not be determined for ' + filename
+                     + ', use the file_type keyword to specify the type.')
+
+
+def _combine_along_axis(uv_objs, **kwargs):
+    """
+    Combine UVData objects that only differ along one axis for UVData.read.
+
+    Finds an axis (baseline-time, frequency or polarization) along which the
+    objects differ while the other two axes match, concatenates the objects
+    along it with fast_concat and sorts that axis and builds the history as
+    adding the objects one at a time would.
+
+    Args:
+        uv_objs: List of UVData objects.
+        kwargs: Check keywords passed to fast_concat.
+
+    Returns:
+        The combined UVData object, or None if there is no such axis or the
+        objects cannot be concatenated along it (e.g. they overlap).
+    """
+    first = uv_objs[0]
+
+    def all_match(*param_names):
+        return all(getattr(first, p) == getattr(uv, p)
+                   for uv in uv_objs[1:] for p in param_names)
+
+    if all_match('_freq_array', '_polarization_array'):
+        axis = 'blt'
+    elif all_match('_time_array', '_baseline_array', '_polarization_array'):
+        axis = 'freq'
+    elif all_match('_time_array', '_baseline_array', '_freq_array'):
+        axis = 'polarization'
+    else:
+        return None
+
+    # order the objects along the axis first, so the concatenated axis usually
+    # does not need to be sorted afterwards
+    if axis == 'blt':
+        sort_keys = [np.min(uv.time_array) for uv in uv_objs]
+    elif axis == 'freq':
+        sort_keys = [np.min(uv.freq_array) for uv in uv_objs]
+    else:
+        sort_keys = [np.min(np.abs(uv.polarization_array)) for uv in uv_objs]
+    uv_objs_in_order = uv_objs
+    uv_objs = [uv_objs[i] for i in np.argsort(sort_keys, kind='mergesort')]
+    try:
+        uv = uv_objs[0].fast_concat(uv_objs[1:], axis, **kwargs)
+    except ValueError:
+        return None
+
+    # sort the axis as __add__ does
+    if axis == 'blt':
+        order = np.argsort(uv._get_blt_keys(uv.time_array, uv.baseline_array))
+        axis_dim = 'Nblts'
+        blt_order = ['time', 'baseline'] if first.blt_order is not None else None
+    elif axis == 'freq':
+        order = np.argsort(uv.freq_array[0, :])
+        axis_dim = 'Nfreqs'
+    else:
+        order = np.argsort(np.abs(uv.polarization_array))
+        axis_dim = 'Npols'
+    if np.any(order != np.arange(len(order))):
+        for p in uv:
+            param = getattr(uv, p)
+            if (isinstance(param.form, tuple) and axis_dim in param.form
+                    and param.value is not None):
+                setattr(uv, param.name,
+                        np.take(param.value, order, axis=param.form.index(axis_dim)))
+    if axis == 'blt':
+        uv.blt_order = blt_order
+
+    # the history of adding the objects (in the order given) one at a time
+    axis_names = {'blt': 'baseline-time', 'freq': 'frequency',
+                  'polarization': 'polarization'}
+    history = first.history
+    for obj in uv_objs_in_order[1:]:
+        history += ' Combined data along ' + axis_names[axis] + ' axis using pyuvdata.'
+        history = uvutils.combine_histories(history, obj.history)
+    uv.history = history
+    return uv
+
+
+def _read_file_to_shared_memory(args):
+    """
+    Read a file into a UVData object in a worker process for UVData.read.
+
+    The data, flag and nsample arrays are written to memory mapped files
+    (which are then removed from the object) so only the metadata are pickled
+    and sent back to the calling process.
+
+    Args:
+        args: Tuple of the file name, file type, keywords for the
+            read_<file_type> method and the prefix for the memory mapped files.
+
+    Returns:
+        The UVData object, a dict of the memory mapped file for each data-like
+        parameter, and a list of (message, category) for any warnings raised.
+    """
+    filename, file_type, kwargs, shared_prefix = args
+    uv = UVData()
+    with warnings.catch_warnings(record=True) as warning_list:
+        warnings.simplefilter('always')
+        getattr(uv, 'read_' + file_type)(filename, **kwargs)
+    file_warnings = [(str(w.message), w.category) for w in warning_list]
+
+    shared_files = {}
+    for p in ['data_array', 'flag_array', 'nsample_array']:
+        value = getattr(uv, p)
+        if not isinstance(value, np.ndarray):
+            continue
+        shared_file = shared_prefix + '_' + p + '.npy'
+        shared_array = np.lib.format.open_memmap(shared_file, mode='w+',
+                                                 dtype=value.dtype, shape=value.shape)
+        shared_array[...] = value
+        shared_array.flush()
+        del(shared_array)
+        shared_files[p] = shared_file
+        setattr(uv, p, None)
+    return uv, shared_files, file_warnings
@@ -1,6 +1,5 @@
 """Class for reading and writing uvfits files."""
 from astropy import constants as const
-import astropy
 from astropy.time import Time
 from astropy.io import fits
 import numpy as np
@@ -24,18 +23,73 @@ class UVFITS(UVData):
     uvfits_required_extra = ['antenna_positions', 'gst0', 'rdate',
                              'earth_omega', 'dut1', 'timesys']
 
+    def _get_group_parameters(self, vis_hdu):
+        """
+        Internal function to read the random group parameters of a uvfits file.
+
+        The parameters are read directly from a memory map of the groups in the
+        file (one strided column per parameter), scaled according to the PSCAL
+        and PZERO header cards, rather than through astropy's GroupsHDU data.
+        Parameters with the same name (e.g. DATE) are summed. The values match
+        those of astropy's GroupData.par, except that they are in native byte order.
+
+        Args:
+            vis_hdu: The random groups HDU of the uvfits file.
+
+        Returns:
+            dict of parameter arrays, shape (Nblts), keyed on the upper case
+                parameter names.
+        """
+        header = vis_hdu.header
+        fileinfo = vis_hdu.fileinfo()
+        if fileinfo is None or fileinfo['file'].compression is not None:
+            # the HDU is not backed by an uncompressed file, use astropy
+            return dict((name.upper(), vis_hdu.data.par(name))
+                        for name in vis_hdu.data.parnames)
+
+        bitpix_dtypes = {8: 'u1', 16: '>i2', 32: '>i4', 64: '>i8',
+                         -32: '>f4', -64: '>f8'}
+        pcount = header['PCOUNT']
+        group_size = pcount + int(np.prod([header['NAXIS' + str(axis)]
+                                           for axis in range(2, header['NAXIS'] + 1)]))
+        groups = np.memmap(fileinfo['file'].name, dtype=bitpix_dtypes[header['BITPIX']],
+                           mode='r', offset=fileinfo['datLoc'],
+                           shape=(header['GCOUNT'], group_size))
+
+        parameters = {}
+        for ind in range(pcount):
+            name = header['PTYPE' + str(ind + 1)].upper()
+            scale = header.get('PSCAL' + str(ind + 1), 1)
+            zero = header.get('PZERO' + str(ind + 1), 0)
+            if scale != 1 or zero != 0:
+                value = np.array(groups[:, ind], dtype=np.float64)
+                if scale != 1:
+                    value *= scale
+                if zero != 0:
+                    value += zero
+            else:
+                value = np.array(groups[:, ind], dtype=groups.dtype.newbyteorder('='))
+            if name in parameters:
+                parameters[name] = parameters[name].astype(np.float64) + value
+            else:
+                parameters[name] = value
+        del(groups)
+        return parameters
+
     def _get_parameter_data(self, vis_hdu):
         """
         Internal function to read just the random parameters portion of the
         uvfits file (referred to as metadata).
         Separated from full read so that header, metadata and data can be read independently.
+        The LSTs are calculated when the lst_array is first accessed.
         """
-        # astropy.io fits reader scales date according to relevant PZER0 (?)
+        group_parameters = self._get_group_parameters(vis_hdu)
+
         # uvfits standard is to have 2 DATE parameters, both floats:
         # DATE (full day) and _DATE (fractional day)
         # cotter uvfits files have one DATE that is a double
-        # using data.par('date') is general -- it will add them together if there are 2
-        self.time_array = vis_hdu.data.par('date')
+        # _get_group_parameters adds them together if there are 2
+        self.time_array = group_parameters['DATE']
         if np.finfo(self.time_array[0]).precision < 5:
             raise ValueError('JDs in this file are not precise to '
                              'better than a second.')
@@ -47,33 +101,34 @@ class UVFITS(UVData):
 
         self.Ntimes = len(np.unique(self.time_array))
 
-        self.set_lsts_from_time_array()
+        latitude, longitude, altitude = self.telescope_location_lat_lon_alt_degrees
+        self.lst_array = uvutils._LazyLSTs(self.time_array, latitude, longitude, altitude)
 
         # if antenna arrays are present, use them. otherwise use baseline array
-        if 'ANTENNA1' in vis_hdu.data.parnames and 'ANTENNA2' in vis_hdu.data.parnames:
+        if 'ANTENNA1' in group_parameters and 'ANTENNA2' in group_parameters:
             # Note: uvfits antennas are 1 indexed,
             # need to subtract one to get to 0-indexed
-            self.ant_1_array = np.int32(vis_hdu.data.par('ANTENNA1')) - 1
-            self.ant_2_array = np.int32(vis_hdu.data.par('ANTENNA2')) - 1
-            subarray = np.int32(vis_hdu.data.par('SUBARRAY')) - 1
+            self.ant_1_array = np.int32(group_parameters['ANTENNA1']) - 1
+            self.ant_2_array = np.int32(group_parameters['ANTENNA2']) - 1
+            subarray = np.int32(group_parameters['SUBARRAY']) - 1
             # error on files with multiple subarrays
-            if len(set(subarray)) > 1:
+            if np.any(subarray != subarray[0]):
                 raise ValueError('This file appears to have multiple subarray '
                                  'values; only files with one subarray are '
                                  'supported.')
         else:
             # cannot set this to be the baseline array because it uses the
             # 256 convention, not our 2048 convention
-            bl_input_array = np.int64(vis_hdu.data.par('BASELINE'))
+            bl_input_array = np.int64(group_parameters['BASELINE'])
 
             # get antenna arrays based on uvfits baseline array
             self.ant_1_array, self.ant_2_array = \
                 self.baseline_to_antnums(bl_input_array)
 
         # check for multi source files
-        if 'SOURCE' in vis_hdu.data.parnames:
-            source = vis_hdu.data.par('SOURCE')
-            if len(set(source)) > 1:
+        if 'SOURCE' in group_parameters:
+            source = group_parameters['SOURCE']
+            if np.any(source != source[0]):
                 raise ValueError('This file has multiple sources. Only single '
                                  'source observations are supported.')
 
@@ -84,19 +139,18 @@ class UVFITS(UVData):
         self.Nbls = len(np.unique(self.baseline_array))
 
         # initialize internal variables based on the antenna lists
-        self.Nants_data = int(
-            len(np.unique(self.ant_1_array.tolist() + self.ant_2_array.tolist())))
+        self.Nants_data = len(np.union1d(self.ant_1_array, self.ant_2_array))
 
         # read baseline vectors in units of seconds, return in meters
         # FITS uvw direction convention is opposite ours and Miriad's.
         # So conjugate the visibilities and flip the uvws:
-        self.uvw_array = (-1) * (np.array(np.stack((vis_hdu.data.par('UU'),
-                                                    vis_hdu.data.par('VV'),
-                                                    vis_hdu.data.par('WW'))))
+        self.uvw_array = (-1) * (np.array(np.stack((group_parameters['UU'],
+                                                    group_parameters['VV'],
+                                                    group_parameters['WW'])))
                                  * const.c.to('m/s').value).T
 
-        if 'INTTIM' in vis_hdu.data.parnames:
-            self.integration_time = float(vis_hdu.data.par('INTTIM')[0])
+        if 'INTTIM' in group_parameters:
+            self.integration_time = float(group_parameters['INTTIM'][0])
         else:
             if self.Ntimes > 1:
                 self.integration_time = \
@@ -106,10 +160,75 @@ class UVFITS(UVData):
                 raise ValueError('integration time not specified and only '
                                  'one time present')
 
+    def _decode_raw_data(self, raw_data_array, blt_inds, freq_inds, pol_inds,
+                         blt_chunk_size=None, data_array_dtype=None):
+        """
+        Internal function to build the data, flag and nsample arrays from the raw uvfits data.
+
+        The raw data are decoded in chunks of baseline-times, applying the
+        selection to each chunk and writing directly into the output arrays, so
+        that only the selected parts of a memory-mapped file are read and no
+        full size temporary arrays are made.
+
+        Args:
+            raw_data_array: The raw data, shape (Nblts, Nspws, Nfreqs, Npols, 3)
+                in the file. Usually a memory-mapped array.
+            blt_inds: The baseline-time indices to read, None to read all of them.
+            freq_inds: The frequency indices to read, None to read all of them.
+            pol_inds: The polarization indices to read, None to read all of them.
+            blt_chunk_size: Number of baseline-times to decode at a time. Default
+                is to use chunks of about 32 MB of raw data.
+            data_array_dtype: Datatype for the data_array, either np.complex64
+                or np.complex128 (the nsample_array gets the matching real
+                precision). Default is None, which keeps the precision of the
+                raw data.
+        """
+        assert(len(raw_data_array.shape) == 5)
+        if blt_inds is None:
+            Nblts = raw_data_array.shape[0]
+        else:
+            Nblts = len(blt_inds)
+        shape = (Nblts, raw_data_array.shape[1],
+                 raw_data_array.shape[2] if freq_inds is None else len(freq_inds),
+                 raw_data_array.shape[3] if pol_inds is None else len(pol_inds))
+        if blt_chunk_size is None:
+            blt_chunk_size = max(1, 2**25 // max(1, raw_data_array[:1].nbytes))
+
+        data_dtype, nsample_dtype = uvutils.get_data_precision_dtypes(data_array_dtype)
+        if data_dtype is None:
+            data_dtype = np.result_type(raw_data_array.dtype, np.complex64)
+            # FITS data are big-endian, use the native byte order
+            nsample_dtype = raw_data_array.dtype.newbyteorder('=')
+        data_array = np.empty(shape, dtype=data_dtype)
+        flag_array = np.empty(shape, dtype=np.bool)
+        nsample_array = np.empty(shape, dtype=nsample_dtype)
+        for start in range(0, Nblts, blt_chunk_size):
+            chunk = slice(start, start + blt_chunk_size)
+            if blt_inds is None:
+                raw_chunk = raw_data_array[chunk]
+            else:
+                raw_chunk = raw_data_array[blt_inds[chunk]]
+            if freq_inds is not None:
+                raw_chunk = raw_chunk[:, :, freq_inds]
+            if pol_inds is not None:
+                raw_chunk = raw_chunk[:, :, :, pol_inds]
+
+            # FITS uvw direction convention is opposite ours and Miriad's.
+            # So conjugate the visibilities and flip the uvws:
+            data_chunk = data_array[chunk]
+            data_chunk.real = raw_chunk[:, :, :, :, 0]
+            np.negative(raw_chunk[:, :, :, :, 1], out=data_chunk.imag)
+            np.less_equal(raw_chunk[:, :, :, :, 2], 0, out=flag_array[chunk])
+            np.abs(raw_chunk[:, :, :, :, 2], out=nsample_array[chunk])
+
+        self.data_array = data_array
+        self.flag_array = flag_array
+        self.nsample_array = nsample_array
+
     def _get_data(self, vis_hdu, antenna_nums, antenna_names, ant_str,
                   ant_pairs_nums, frequencies, freq_chans, times, polarizations,
                   blt_inds, read_metadata, run_check, check_extra,
-                  run_check_acceptability):
+                  run_check_acceptability, data_array_dtype=None):
         """
         Internal function to read just the visibility and flag data of the uvfits file.
         Separated from full read so that header, metadata and data can be read independently.
@@ -139,89 +258,42 @@ class UVFITS(UVData):
         else:
             pol_frac = 1
 
-        min_frac = np.min([blt_frac, freq_frac, pol_frac])
-
-        if min_frac == 1:
+        if np.min([blt_frac, freq_frac, pol_frac]) == 1:
             # no select, read in all the data
-            if vis_hdu.header['NAXIS'] == 7:
-                raw_data_array = vis_hdu.data.data[:, 0, 0, :, :, :, :]
-                assert(self.Nspws == raw_data_array.shape[1])
-
-            else:
-                # in many uvfits files the spw axis is left out,
-                # here we put it back in so the dimensionality stays the same
-                raw_data_array = vis_hdu.data.data[:, 0, 0, :, :, :]
-                raw_data_array = raw_data_array[:, np.newaxis, :, :]
+            blt_inds, freq_inds, pol_inds = None, None, None
         else:
             # do select operations on everything except data_array, flag_array and nsample_array
             self._select_metadata(blt_inds, freq_inds, pol_inds, history_update_string)
+            if blt_frac == 1:
+                blt_inds = None
+            if freq_frac == 1:
+                freq_inds = None
+            if pol_frac == 1:
+                pol_inds = None
+
+        if vis_hdu.header['NAXIS'] == 7:
+            raw_data_array = vis_hdu.data.data[:, 0, 0, :, :, :, :]
+            assert(self.Nspws == raw_data_array.shape[1])
+        else:
+            # in many uvfits files the spw axis is left out,
+            # here we put it back in so the dimensionality stays the same
+            raw_data_array = vis_hdu.data.data[:, 0, 0, np.newaxis, :, :, :]
 
-            # just read in the right portions of the data and flag arrays
-            if blt_frac == min_frac:
-                if vis_hdu.header['NAXIS'] == 7:
-                    raw_data_array = vis_hdu.data.data[blt_inds, :, :, :, :, :, :]
-                    raw_data_array = raw_data_array[:, 0, 0, :, :, :, :]
-                    assert(self.Nspws == raw_data_array.shape[1])
-                else:
-                    # in many uvfits files the spw axis is left out,
-                    # here we put it back in so the dimensionality stays the same
-                    raw_data_array = vis_hdu.data.data[blt_inds, :, :, :, :, :]
-                    raw_data_array = raw_data_array[:, 0, 0, :, :, :]
-                    raw_data_array = raw_data_array[:, np.newaxis, :, :, :]
-                if freq_frac < 1:
-                    raw_data_array = raw_data_array[:, :, freq_inds, :, :]
-                if pol_frac < 1:
-                    raw_data_array = raw_data_array[:, :, :, pol_inds, :]
-            elif freq_frac == min_frac:
-                if vis_hdu.header['NAXIS'] == 7:
-                    raw_data_array = vis_hdu.data.data[:, :, :, :, freq_inds, :, :]
-                    raw_data_array = raw_data_array[:, 0, 0, :, :, :, :]
-                    assert(self.Nspws == raw_data_array.shape[1])
-                else:
-                    # in many uvfits files the spw axis is left out,
-                    # here we put it back in so the dimensionality stays the same
-                    raw_data_array = vis_hdu.data.data[:, :, :, freq_inds, :, :]
-                    raw_data_array = raw_data_array[:, 0, 0, :, :, :]
-                    raw_data_array = raw_data_array[:, np.newaxis, :, :, :]
-
-                if blt_frac < 1:
-                    raw_data_array = raw_data_array[blt_inds, :, :, :, :]
-                if pol_frac < 1:
-                    raw_data_array = raw_data_array[:, :, :, pol_inds, :]
-            else:
-                if vis_hdu.header['NAXIS'] == 7:
-                    raw_data_array = vis_hdu.data.data[:, :, :, :, :, pol_inds, :]
-                    raw_data_array = raw_data_array[:, 0, 0, :, :, :, :]
-                    assert(self.Nspws == raw_data_array.shape[1])
-                else:
-                    # in many uvfits files the spw axis is left out,
-                    # here we put it back in so the dimensionality stays the same
-                    raw_data_array = vis_hdu.data.data[:, :, :, :, pol_inds, :]
-                    raw_data_array = raw_data_array[:, 0, 0, :, :, :]
-                    raw_data_array = raw_data_array[:, np.newaxis, :, :, :]
-
-                if blt_frac < 1:
-                    raw_data_array = raw_data_array[blt_inds, :, :, :, :]
-                if freq_frac < 1:
-                    raw_data_array = raw_data_array[:, :, freq_inds, :, :]
-
-        assert(len(raw_data_array.shape) == 5)
-        # FITS uvw direction convention is opposite ours and Miriad's.
-        # So conjugate the visibilities and flip the uvws:
-        self.data_array = (raw_data_array[:, :, :, :, 0] - 1j * raw_data_array[:, :, :, :, 1])
-        self.flag_array = (raw_data_array[:, :, :, :, 2] <= 0)
-        self.nsample_array = np.abs(raw_data_array[:, :, :, :, 2])
+        self._decode_raw_data(raw_data_array, blt_inds, freq_inds, pol_inds,
+                              data_array_dtype=data_array_dtype)
 
         # check if object has all required UVParameters set
         if run_check:
             self.check(check_extra=check_extra,
-                       run_check_acceptability=run_check_acceptability)
+                       run_check_acceptability=run_check_acceptability,
+                       only_modified=True)
 
     def read_uvfits(self, filename, antenna_nums=None, antenna_names=None,
                     ant_str=None, ant_pairs_nums=None, frequencies=None,
                     freq_chans=None, times=None, polarizations=None, blt_inds=None,
                     read_data=True, read_metadata=True,
-                    run_check=True, check_extra=True, run_check_acceptability=True):
+                    run_check=True, check_extra=True, run_check_acceptability=True,
+                    data_array_dtype=None):
         """
         Read in header, metadata and data from a uvfits file. Supports reading
         only selected portions of the data.
@@ -278,6 +350,11 @@ class UVFITS(UVData):
             run_check_acceptability: Option to check acceptable range of the values of
                 parameters after reading in the file. Default is True.
                 Ignored if read_data is False.
+            data_array_dtype: Datatype for the data_array, either np.complex64
+                or np.complex128. The nsample_array gets the matching real
+                precision (np.float32 or np.float64). Default is None, which
+                keeps the precision of the file (usually single precision).
+                Ignored if read_data is False.
         """
         if not read_data:
             run_check = False
@@ -450,7 +527,8 @@ class UVFITS(UVData):
         # Now read in the data
         self._get_data(vis_hdu, antenna_nums, antenna_names, ant_str,
                        ant_pairs_nums, frequencies, freq_chans, times, polarizations,
-                       blt_inds, False, run_check, check_extra, run_check_acceptability)
+                       blt_inds, False, run_check, check_extra, run_check_acceptability,
+                       data_array_dtype=data_array_dtype)
 
     def read_uvfits_metadata(self, filename):
         """
@@ -476,7 +554,8 @@ class UVFITS(UVData):
                          ant_str=None, ant_pairs_nums=None, frequencies=None,
                          freq_chans=None, times=None, polarizations=None,
                          blt_inds=None, read_metadata=True, run_check=True,
-                         check_extra=True, run_check_acceptability=True):
+                         check_extra=True, run_check_acceptability=True,
+                         data_array_dtype=None):
         """
         Read in data but not header info from a uvfits file
         (useful for an object that already has the associated header info).
@@ -522,6 +601,10 @@ class UVFITS(UVData):
                 ones. Default is True.
             run_check_acceptability: Option to check acceptable range of the values of
                 parameters after reading in the file. Default is True.
+            data_array_dtype: Datatype for the data_array, either np.complex64
+                or np.complex128. The nsample_array gets the matching real
+                precision (np.float32 or np.float64). Default is None, which
+                keeps the precision of the file (usually single precision).
         """
 
         hdu_list = fits.open(filename, memmap=True)
@@ -530,10 +613,60 @@ class UVFITS(UVData):
         self._get_data(vis_hdu, antenna_nums, antenna_names, ant_str,
                        ant_pairs_nums, frequencies, freq_chans, times, polarizations,
                        blt_inds, read_metadata, run_check, check_extra,
-                       run_check_acceptability)
+                       run_check_acceptability, data_array_dtype=data_array_dtype)
 
         del(vis_hdu)
 
+    def _get_group_chunk_size(self):
+        """
+        Internal function to get the number of baseline-times to write at a time.
+
+        Returns:
+            Number of baseline-times in about 32 MB of uvfits groups.
+        """
+        # there are at most 9 group parameters
+        group_nbytes = 4 * (9 + self.Nspws * self.Nfreqs * self.Npols * 3)
+        return max(1, 2**25 // group_nbytes)
+
+    def _write_groups(self, fileobj, group_parameter_list, blt_chunk_size=None):
+        """
+        Internal function to write the random groups (parameters and data) to a uvfits file.
+
+        The groups are built and written in chunks of baseline-times, so no full
+        size copies of the data are made. The data are padded to a whole number
+        of FITS blocks.
+
+        Args:
+            fileobj: File object to write to, positioned after the primary header.
+            group_parameter_list: List of the group parameter arrays, each shape (Nblts).
+            blt_chunk_size: Number of baseline-times to write at a time. Default
+                is to use chunks of about 32 MB.
+        """
+        if blt_chunk_size is None:
+            blt_chunk_size = self._get_group_chunk_size()
+        pcount = len(group_parameter_list)
+        data_shape = (self.Nspws, self.Nfreqs, self.Npols, 3)
+        group_size = pcount + int(np.prod(data_shape))
+        for start in range(0, self.Nblts, blt_chunk_size):
+            chunk = slice(start, start + blt_chunk_size)
+            n_chunk = min(blt_chunk_size, self.Nblts - start)
+            groups = np.empty((n_chunk, group_size), dtype='>f4')
+            for ind, param in enumerate(group_parameter_list):
+                groups[:, ind] = param[chunk]
+            group_data = groups[:, pcount:].reshape((n_chunk,) + data_shape)
+
+            # FITS uvw direction convention is opposite ours and Miriad's.
+            # So conjugate the visibilities and flip the uvws:
+            data_chunk = self.data_array[chunk]
+            group_data[:, :, :, :, 0] = data_chunk.real
+            group_data[:, :, :, :, 1] = np.negative(data_chunk.imag)
+            group_data[:, :, :, :, 2] = (self.nsample_array[chunk]
+                                         * np.where(self.flag_array[chunk], -1, 1))
+            fileobj.write(groups.tobytes())
+
+        # pad to a whole number of 2880 byte FITS blocks
+        fileobj.write(b'\0' * (-self.Nblts * group_size * 4 % 2880))
+
     def write_uvfits(self, filename, spoof_nonessential=False,
                      force_phase=False, run_check=True, check_extra=True,
                      run_check_acceptability=True):
@@ -622,24 +755,14 @@ class UVFITS(UVData):
                                          .format(attribute=p))
 
         # check for unflagged data with nsample = 0. Warn if any found
-        wh_nsample0 = np.where(self.nsample_array == 0)
-        if np.any(~self.flag_array[wh_nsample0]):
-            warnings.warn('Some unflagged data has nsample = 0. Flags and '
-                          'nsamples are combined in uvfits files such that '
-                          'these data will appear to be flagged.')
-
-        weights_array = self.nsample_array * \
-            np.where(self.flag_array, -1, 1)
-        # FITS uvw direction convention is opposite ours and Miriad's.
-        # So conjugate the visibilities and flip the uvws:
-        data_array = np.conj(self.data_array[:, np.newaxis,
-                                             np.newaxis, :, :, :, np.newaxis])
-        weights_array = weights_array[:, np.newaxis, np.newaxis, :, :, :,
-                                      np.newaxis]
-        # uvfits_array_data shape will be  (Nblts,1,1,[Nspws],Nfreqs,Npols,3)
-        uvfits_array_data = np.concatenate([data_array.real,
-                                            data_array.imag,
-                                            weights_array], axis=6)
+        blt_chunk_size = self._get_group_chunk_size()
+        for start in range(0, self.Nblts, blt_chunk_size):
+            chunk = slice(start, start + blt_chunk_size)
+            if np.any((self.nsample_array[chunk] == 0) & ~self.flag_array[chunk]):
+                warnings.warn('Some unflagged data has nsample = 0. Flags and '
+                              'nsamples are combined in uvfits files such that '
+                              'these data will appear to be flagged.')
+                break
 
         # FITS uvw direction convention is opposite ours and Miriad's.
         # So conjugate the visibilities and flip the uvws:
@@ -692,9 +815,16 @@ class UVFITS(UVData):
 
         group_parameter_list = [group_parameter_dict[parname] for
                                 parname in parnames_use]
-        hdu = fits.GroupData(uvfits_array_data, parnames=parnames_use,
-                             pardata=group_parameter_list, bitpix=-32)
+        # set up the header with a single group, the groups are written to
+        # the file in chunks below.
+        # uvfits data shape will be  (Nblts,1,1,[Nspws],Nfreqs,Npols,3)
+        hdu = fits.GroupData(np.zeros((1, 1, 1, self.Nspws, self.Nfreqs, self.Npols, 3),
+                                      dtype=np.float32),
+                             parnames=parnames_use,
+                             pardata=[param[:1] for param in group_parameter_list],
+                             bitpix=-32)
         hdu = fits.GroupsHDU(hdu)
+        hdu.header['GCOUNT'] = self.Nblts
 
         for i, key in enumerate(parnames_use):
             hdu.header['PSCAL' + str(i + 1) + '  '] = pscal_dict[key]
@@ -861,9 +991,10 @@ class UVFITS(UVData):
         # ADD the FQ table
         # skipping for now and limiting to a single spw
 
-        # write the file
-        hdulist = fits.HDUList(hdus=[hdu, ant_hdu])
-        if float(astropy.__version__[0:3]) < 1.3:
-            hdulist.writeto(filename, clobber=True)
-        else:
-            hdulist.writeto(filename, overwrite=True)
+        # write the file: the primary header, then the groups, then the antenna table
+        with open(filename, 'wb') as fileobj:
+            fileobj.write(hdu.header.tostring())
+            self._write_groups(fileobj, group_parameter_list,
+                               blt_chunk_size=blt_chunk_size)
+        with fits.open(filename, mode='append') as hdulist:
+            hdulist.append(ant_hdu)
@@ -5,10 +5,439 @@
 """Class for reading and writing HDF5 files."""
 import numpy as np
 import os
+import itertools
 from uvdata import UVData
 import utils as uvutils
 
 
+def _convert_to_slice(indices):
+    """
+    Convert a list of indices into a slice if they are regularly spaced.
+
+    Args:
+        indices: sorted list or array of unique indices.
+
+    Returns:
+        slice object if the indices are regularly spaced, otherwise None.
+    """
+    indices = np.asarray(indices)
+    if len(indices) == 1:
+        return slice(indices[0], indices[0] + 1)
+    steps = np.diff(indices)
+    if np.all(steps == steps[0]):
+        return slice(indices[0], indices[-1] + 1, steps[0])
+    else:
+        return None
+
+
+def _read_dataset_selection(dset, inds):
+    """
+    Read a selected portion of an HDF5 dataset.
+
+    Regularly spaced indices are converted to slices so they become hyperslab
+    reads. h5py only supports a list of indices on one axis per read, so if
+    more than one axis has irregularly spaced indices, the most selective one
+    is read with a list of indices and the others are read as the bounding
+    slice and downselected in memory.
+
+    Args:
+        dset: h5py dataset to read from.
+        inds: list with one entry per axis of the dataset. Each entry is either
+            None (read the full axis) or a sorted list of unique indices.
+
+    Returns:
+        numpy array with the selected portion of the dataset.
+    """
+    dset_inds = []
+    irregular_axes = []
+    for axis, ind in enumerate(inds):
+        if ind is None:
+            dset_inds.append(slice(None))
+            continue
+        ind_slice = _convert_to_slice(ind)
+        if ind_slice is not None:
+            dset_inds.append(ind_slice)
+        else:
+            irregular_axes.append(axis)
+            dset_inds.append(slice(np.min(ind), np.max(ind) + 1))
+
+    memory_axes = []
+    if len(irregular_axes) > 0:
+        fracs = [len(inds[axis]) / float(dset.shape[axis]) for axis in irregular_axes]
+        disk_axis = irregular_axes[np.argmin(fracs)]
+        dset_inds[disk_axis] = list(inds[disk_axis])
+        memory_axes = [axis for axis in irregular_axes if axis != disk_axis]
+
+    data = dset[tuple(dset_inds)]
+    for axis in memory_axes:
+        data = np.take(data, np.asarray(inds[axis]) - dset_inds[axis].start, axis=axis)
+
+    return data
+
+
+def _write_dataset_selection(dset, inds, data):
+    """
+    Write data into a selected portion of an HDF5 dataset.
+
+    Regularly spaced indices are converted to slices so they become hyperslab
+    writes. h5py only supports a list of indices on one axis per write, so if
+    more than one axis has irregularly spaced indices, the axis with the most
+    indices is written with a list of indices and the others are looped over.
+
+    Args:
+        dset: h5py dataset to write to.
+        inds: list with one entry per axis of the dataset. Each entry is either
+            None (write the full axis) or a sorted list of unique indices.
+        data: numpy array to write, its shape must match the selection.
+
+    Returns:
+        None
+    """
+    dset_inds = []
+    irregular_axes = []
+    for axis, ind in enumerate(inds):
+        if ind is None:
+            dset_inds.append(slice(None))
+            continue
+        ind_slice = _convert_to_slice(ind)
+        if ind_slice is not None:
+            dset_inds.append(ind_slice)
+        else:
+            irregular_axes.append(axis)
+            dset_inds.append(list(ind))
+
+    if len(irregular_axes) <= 1:
+        dset[tuple(dset_inds)] = data
+        return
+
+    list_axis = irregular_axes[np.argmax([len(inds[axis]) for axis in irregular_axes])]
+    loop_axes = [axis for axis in irregular_axes if axis != list_axis]
+    for loop_inds in itertools.product(*[range(len(inds[axis])) for axis in loop_axes]):
+        this_dset_inds = list(dset_inds)
+        data_inds = [slice(None)] * data.ndim
+        for axis, ind in zip(loop_axes, loop_inds):
+            this_dset_inds[axis] = slice(inds[axis][ind], inds[axis][ind] + 1)
+            data_inds[axis] = slice(ind, ind + 1)
+        dset[tuple(this_dset_inds)] = data[tuple(data_inds)]
+
+
+# compound dtypes for visibilities stored as pairs of scaled integers
+_int16_vis_dtype = np.dtype([('r', '<i2'), ('i', '<i2')])
+_int32_vis_dtype = np.dtype([('r', '<i4'), ('i', '<i4')])
+
+
+def _get_vis_write_dtype(data_write_dtype):
+    """
+    Get the on-disk dtype of the visdata dataset for a data_write_dtype option.
+
+    Args:
+        data_write_dtype: None (complex64), np.complex64, np.complex128,
+            np.int16 or np.int32 (or the equivalent compound dtypes with 'r'
+            and 'i' fields) to store the visibilities as pairs of scaled integers.
+
+    Returns:
+        numpy dtype for the visdata dataset.
+    """
+    if data_write_dtype is None:
+        return np.dtype(np.complex64)
+    dtype = np.dtype(data_write_dtype)
+    if dtype in [np.dtype(np.complex64), np.dtype(np.complex128)]:
+        return dtype
+    elif dtype in [np.dtype(np.int16), _int16_vis_dtype]:
+        return _int16_vis_dtype
+    elif dtype in [np.dtype(np.int32), _int32_vis_dtype]:
+        return _int32_vis_dtype
+    else:
+        raise ValueError('data_write_dtype must be None, np.complex64, np.complex128, '
+                         'np.int16 or np.int32')
+
+
+def _get_vis_scale(data, disk_dtype, data_scale):
+    """
+    Get the scale factor for visibilities stored as scaled integers.
+
+    Args:
+        data: visibility data to store (or None if not known yet).
+        disk_dtype: on-disk dtype of the visdata dataset.
+        data_scale: user specified scale factor or None to pick one that uses
+            the full integer range for the data (1 if data is None).
+
+    Returns:
+        The scale factor (float) or None for complex on-disk dtypes.
+    """
+    if disk_dtype.names is None:
+        return None
+    if data_scale is not None:
+        if data_scale <= 0:
+            raise ValueError('data_scale must be positive')
+        return float(data_scale)
+    max_abs = 0.
+    if data is not None and data.size > 0:
+        max_abs = max(np.max(np.abs(data.real)), np.max(np.abs(data.imag)))
+    if max_abs == 0:
+        return 1.
+    return float(max_abs) / np.iinfo(disk_dtype['r']).max
+
+
+def _vis_to_disk(data, disk_dtype, scale):
+    """
+    Convert visibilities to the on-disk dtype of the visdata dataset.
+
+    Args:
+        data: complex visibility data.
+        disk_dtype: on-disk dtype of the visdata dataset.
+        scale: scale factor for scaled integer dtypes (ignored otherwise), the
+            stored integers are the data divided by the scale, rounded.
+
+    Returns:
+        numpy array with the on-disk dtype.
+    """
+    if disk_dtype.names is None:
+        return data.astype(disk_dtype)
+    # scale in double precision, single precision cannot represent the int32 range
+    int_info = np.iinfo(disk_dtype['r'])
+    out = np.empty(data.shape, dtype=disk_dtype)
+    for field, part in [('r', data.real), ('i', data.imag)]:
+        scaled = np.divide(part, scale, dtype=np.float64)
+        out[field] = np.clip(np.rint(scaled, out=scaled), int_info.min, int_info.max,
+                             out=scaled)
+    return out
+
+
+def _vis_from_disk(data, scale, data_array_dtype):
+    """
+    Convert visibilities read from the visdata dataset to the in-memory dtype.
+
+    Args:
+        data: visibility data as stored on disk.
+        scale: scale factor for scaled integer dtypes (ignored otherwise).
+        data_array_dtype: None (complex data are returned as stored, scaled
+            integers are promoted to complex64), np.complex64, np.complex128
+            or 'raw' (return the data as stored on disk).
+
+    Returns:
+        numpy array of visibilities.
+    """
+    if isinstance(data_array_dtype, str) and data_array_dtype == 'raw':
+        return data
+    if data.dtype.names is None:
+        if data_array_dtype is None or data.dtype == data_array_dtype:
+            return data
+        return data.astype(data_array_dtype)
+    if data_array_dtype is None:
+        data_array_dtype = np.complex64
+    out = np.empty(data.shape, dtype=data_array_dtype)
+    out.real = data['r']
+    out.imag = data['i']
+    out *= scale
+    return out
+
+
+def _get_compression(compression):
+    """
+    Get the h5py compression arguments for a compression option.
+
+    Args:
+        compression: None (no compression), the name of a filter included with
+            h5py ('gzip', 'lzf', 'szip'), the integer id of a filter loaded as an
+            HDF5 plugin (e.g. 32008 for bitshuffle) or a tuple of the filter and
+            its options (e.g. ('gzip', 9) or (32008, (0, 2))).
+
+    Returns:
+        Tuple of the compression and compression_opts arguments for
+        h5py.Group.create_dataset.
+    """
+    if isinstance(compression, tuple):
+        if len(compression) != 2:
+            raise ValueError('compression tuples must have two elements: '
+                             'the filter and its options')
+        return compression
+    elif compression is None or isinstance(compression, (str, int, np.integer)):
+        return compression, None
+    else:
+        raise ValueError('compression must be None, a filter name, a filter '
+                         'id or a tuple of the filter and its options')
+
+
+def _get_chunks(chunks, data_shape):
+    """
+    Get the h5py chunk shape for a chunking option.
+
+    Args:
+        chunks: True (let h5py pick the chunk shape), None (no chunking,
+            only allowed without compression) or a tuple giving the chunk shape
+            along each axis of the data arrays (Nblts, Nspws, Nfreqs, Npols).
+            Elements of the tuple that are None or larger than the data shape
+            are set to the length of that axis.
+        data_shape: shape of the data arrays.
+
+    Returns:
+        chunks argument for h5py.Group.create_dataset.
+    """
+    if chunks is True or chunks is None:
+        return chunks
+    if len(chunks) != len(data_shape):
+        raise ValueError('chunks must have one element per axis of the data '
+                         'array (Nblts, Nspws, Nfreqs, Npols)')
+    return tuple([n if c is None else int(min(c, n))
+                  for c, n in zip(chunks, data_shape)])
+
+
+def _read_flags(dset, inds, pack_flags):
+    """
+    Read a selected portion of the flags dataset, which may hold packed flags.
+
+    Flags written with pack_flags=True are stored as the packed bytes for each
+    baseline-time (see utils._PackedFlags), with the unpacked shape in the
+    'packed_shape' attribute of the dataset.
+
+    Args:
+        dset: h5py flags dataset.
+        inds: list with one entry per axis of the (unpacked) flag array. Each
+            entry is either None (read the full axis) or a sorted list of
+            unique indices.
+        pack_flags: Option to return the flags as a utils._PackedFlags object
+            rather than a boolean array.
+
+    Returns:
+        boolean array or utils._PackedFlags object of the selected flags.
+    """
+    if 'packed_shape' not in dset.attrs:
+        if all(ind is None for ind in inds):
+            flags = dset.value
+        else:
+            flags = _read_dataset_selection(dset, inds)
+        if pack_flags:
+            flags = uvutils._PackedFlags(flags)
+        return flags
+
+    if inds[0] is None:
+        packed = dset.value
+    else:
+        packed = _read_dataset_selection(dset, [inds[0], None])
+    flags = uvutils._PackedFlags._from_packed(
+        packed, (packed.shape[0],) + tuple(dset.attrs['packed_shape'][1:]))
+    for axis, ind in enumerate(inds[1:], 1):
+        if ind is not None:
+            flags = flags.take(ind, axis=axis)
+    if not pack_flags:
+        flags = flags.unpack()
+    return flags
+
+
+class _LazyDataset(object):
+    """
+    Stand-in for a data-like array that lives in a uvh5 file on disk.
+
+    Only the shape and dtype are read when the object is created. Indexing
+    reads just the requested portion from disk, and the full (selected) array
+    is read by the load method, which is called on first access of the
+    associated UVData attribute. Indexing is orthogonal (as in h5py): index
+    lists on different axes select along each axis independently. The file is
+    reopened on each read, so it should not be modified while this object is in use.
+
+    Args:
+        filename: The uvh5 file containing the dataset.
+        dset_name: The name of the dataset in the file (e.g. '/Data/visdata').
+        inds: list with one entry per axis of the dataset. Each entry is either
+            None (use the full axis) or a sorted list of unique indices to use
+            along that axis.
+        convert: Optional function applied to the data after they are read
+            (e.g. to convert from the on-disk dtype).
+    """
+
+    is_lazy = True
+
+    def __init__(self, filename, dset_name, inds, convert=None):
+        import h5py
+        self.filename = filename
+        self.dset_name = dset_name
+        self.convert = convert
+        with h5py.File(filename, 'r') as f:
+            dset = f[dset_name]
+            self.dtype = dset.dtype
+            disk_shape = dset.shape
+        if convert is not None:
+            self.dtype = convert(np.zeros(0, dtype=self.dtype)).dtype
+        self.inds = [None if ind is None else np.asarray(ind) for ind in inds]
+        self.shape = tuple([n if ind is None else len(ind)
+                            for n, ind in zip(disk_shape, self.inds)])
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, key):
+        import h5py
+        if not isinstance(key, tuple):
+            key = (key,)
+        if len(key) > self.ndim:
+            raise IndexError('too many indices for array')
+        key = key + (slice(None),) * (self.ndim - len(key))
+
+        disk_inds = []
+        reorder = []
+        squeeze_axes = []
+        for axis, k in enumerate(key):
+            axis_inds = np.arange(self.shape[axis])
+            if isinstance(k, slice):
+                sel = axis_inds[k]
+            elif np.ndim(k) == 0:
+                sel = axis_inds[[k]]
+                squeeze_axes.append(axis)
+            else:
+                sel = axis_inds[np.asarray(k)]
+            if self.inds[axis] is not None:
+                sel = self.inds[axis][sel]
+            unique_sel, inverse = np.unique(sel, return_inverse=True)
+            disk_inds.append(unique_sel)
+            if len(unique_sel) != len(sel) or np.any(unique_sel != sel):
+                reorder.append((axis, inverse))
+
+        if np.any([len(ind) == 0 for ind in disk_inds]):
+            shape = [len(ind) for ind in disk_inds]
+            data = np.zeros(shape, dtype=self.dtype)
+        else:
+            with h5py.File(self.filename, 'r') as f:
+                data = _read_dataset_selection(f[self.dset_name], disk_inds)
+            for axis, inverse in reorder:
+                data = np.take(data, inverse, axis=axis)
+            if self.convert is not None:
+                data = self.convert(data)
+
+        if len(squeeze_axes) > 0:
+            data = np.squeeze(data, axis=tuple(squeeze_axes))
+        return data
+
+    def __array__(self, dtype=None):
+        data = self.load()
+        if dtype is not None:
+            data = data.astype(dtype)
+        return data
+
+    def item(self, index):
+        """Read a single element, indexed as in the flattened array."""
+        return self[np.unravel_index(index, self.shape)].item()
+
+    def load(self):
+        """Read in the full (selected) array from disk."""
+        if np.all([ind is None for ind in self.inds]):
+            import h5py
+            with h5py.File(self.filename, 'r') as f:
+                data = f[self.dset_name].value
+            if self.convert is not None:
+                data = self.convert(data)
+            return data
+        return self[(slice(None),) * self.ndim]
+
+
 class UVH5(UVData):
     """
     Defines an HDF5-specific subclass of UVData for reading and writing uvh5 files.
@@ -16,33 +445,16 @@ class UVH5(UVData):
     and write_uvh5 methods on the UVData class.
     """
 
-    def read_uvh5(self, filename, run_check=True,
-                  check_extra=True, run_check_acceptability=True):
+    def _read_header(self, header):
         """
-        Read in data from a UVH5 file.
+        Internal function to read header information from a UVH5 file.
 
         Args:
-            filename: The file name to read.
-            run_check: Option to check for the existence and proper shapes of
-                parameters after reading in the file. Default is True.
-            check_extra: Option to check optional parameters as well as required
-                ones. Default is True.
-            run_check_acceptability: Option to check acceptable range of the values of
-                parameters after reading in the file. Default is True.
+            header: reference to an h5py data group that contains the header information.
 
         Returns:
             None
         """
-        import h5py
-        if not os.path.exists(filename):
-            raise(IOError, filename + ' not found')
-
-        # open hdf5 file for reading
-        f = h5py.File(filename, 'r')
-
-        # extract header information
-        header = f['/Header']
-
         # get telescope information
         latitude = header['latitude'].value
         longitude = header['longitude'].value
@@ -78,6 +490,8 @@ class UVH5(UVData):
             self.timesys = header['timesys'].value
         if 'x_orientation' in header:
             self.x_orientation = header['x_orientation'].value
+        if 'blt_order' in header:
+            self.blt_order = list(header['blt_order'].value)
         if 'telescope_name' in header:
             self.telescope_name = header['telescope_name'].value
         if 'antenna_positions' in header:
@@ -144,55 +558,194 @@ class UVH5(UVData):
             for key in header["extra_keywords"].keys():
                 self.extra_keywords[key] = header["extra_keywords"][key].value
 
-        # read data array
-        dgrp = f['/Data']
-        self.data_array = dgrp['visdata'].value
+    def _get_data(self, dgrp, antenna_nums, antenna_names, ant_str,
+                  ant_pairs_nums, frequencies, freq_chans, times, polarizations,
+                  blt_inds, lazy_data, data_array_dtype, pack_flags, run_check,
+                  check_extra, run_check_acceptability):
+        """
+        Internal function to read just the visibility, flag, and nsample data
+        of the uvh5 file. Separated from full read so that header and data can
+        be read independently.
+
+        The selection is resolved against the header metadata first, so that
+        only the selected portions of the datasets are read from disk. If
+        lazy_data is True, the data arrays are not read but are set to objects
+        that read them from disk when they are accessed (except for packed
+        flags, which are small enough to read right away).
+        """
+        # visibilities stored as scaled integers are converted after reading
+        scale = dgrp['visdata'].attrs.get('scale_factor', 1.)
+
+        def convert_vis(data):
+            return _vis_from_disk(data, scale, data_array_dtype)
+
+        # figure out what data to read in
+        blt_inds, freq_inds, pol_inds, history_update_string = \
+            self._select_preprocess(antenna_nums, antenna_names, ant_str, ant_pairs_nums,
+                                    frequencies, freq_chans, times, polarizations, blt_inds)
 
-        # read the flag array
-        self.flag_array = dgrp['flags'].value
+        if lazy_data:
+            if not (blt_inds is None and freq_inds is None and pol_inds is None):
+                self._select_metadata(blt_inds, freq_inds, pol_inds, history_update_string)
 
-        # get sample information
-        self.nsample_array = dgrp['nsample_array'].value
+            # just record where the data are, they are read in when accessed
+            inds = [blt_inds, None, freq_inds, pol_inds]
+            filename = dgrp.file.filename
+            self.data_array = _LazyDataset(filename, dgrp['visdata'].name, inds,
+                                           convert=convert_vis)
+            if pack_flags or 'packed_shape' in dgrp['flags'].attrs:
+                self.flag_array = _read_flags(dgrp['flags'], inds, pack_flags)
+            else:
+                self.flag_array = _LazyDataset(filename, dgrp['flags'].name, inds)
+            self.nsample_array = _LazyDataset(filename, dgrp['nsample_array'].name, inds)
+        elif blt_inds is None and freq_inds is None and pol_inds is None:
+            # no select, read in all the data
+            self.data_array = convert_vis(dgrp['visdata'].value)
+            self.flag_array = _read_flags(dgrp['flags'], [None] * 4, pack_flags)
+            self.nsample_array = dgrp['nsample_array'].value
+        else:
+            # do select operations on everything except data_array, flag_array and nsample_array
+            self._select_metadata(blt_inds, freq_inds, pol_inds, history_update_string)
+
+            # just read in the right portions of the data, flag and nsample arrays
+            inds = [blt_inds, None, freq_inds, pol_inds]
+            self.data_array = convert_vis(_read_dataset_selection(dgrp['visdata'], inds))
+            self.flag_array = _read_flags(dgrp['flags'], inds, pack_flags)
+            self.nsample_array = _read_dataset_selection(dgrp['nsample_array'], inds)
+
+        if not lazy_data and not (data_array_dtype is None or isinstance(data_array_dtype, str)):
+            # give the nsample_array the same precision as the data_array
+            nsample_dtype = uvutils.get_data_precision_dtypes(data_array_dtype)[1]
+            self.nsample_array = self.nsample_array.astype(nsample_dtype, copy=False)
 
         # check if the object has all required UVParameters
-        if run_check:
+        # (raw integer visibilities are not a valid data_array type)
+        if run_check and self._data_array.value.dtype.names is None:
             self.check(check_extra=check_extra,
-                       run_check_acceptability=run_check_acceptability)
+                       run_check_acceptability=run_check_acceptability,
+                       only_modified=True)
 
-        return
-
-    def write_uvh5(self, filename, run_check=True, check_extra=True,
-                   run_check_acceptability=True, clobber=False):
+    def read_uvh5(self, filename, antenna_nums=None, antenna_names=None,
+                  ant_str=None, ant_pairs_nums=None, frequencies=None,
+                  freq_chans=None, times=None, polarizations=None, blt_inds=None,
+                  read_data=True, lazy_data=False, data_array_dtype=None,
+                  run_check=True, check_extra=True, run_check_acceptability=True,
+                  pack_flags=False):
         """
-        Write a UVData object to a UVH5 file.
+        Read in data from a UVH5 file. Supports reading only selected portions
+        of the data, reading only the header (metadata) and deferring the data
+        read until the data are accessed.
 
         Args:
-            filename: The UVH5 file to write to.
+            filename: The file name to read.
+            antenna_nums: The antennas numbers to include when reading data into
+                the object (antenna positions and names for the excluded antennas
+                will be retained). This cannot be provided if antenna_names is
+                also provided.
+            antenna_names: The antennas names to include when reading data into
+                the object (antenna positions and names for the excluded antennas
+                will be retained). This cannot be provided if antenna_nums is
+                also provided.
+            ant_pairs_nums: A list of antenna number tuples (e.g. [(0,1), (3,2)])
+                specifying baselines to include when reading data into the object.
+                Ordering of the numbers within the tuple does not matter.
+            ant_str: A string containing information about what antenna numbers
+                and polarizations to include when reading data into the object.
+                Can be 'auto', 'cross', 'all', or combinations of antenna numbers
+                and polarizations (e.g. '1', '1_2', '1x_2y').
+                See tutorial for more examples of valid strings and
+                the behavior of different forms for ant_str.
+                If '1x_2y,2y_3y' is passed, both polarizations 'xy' and 'yy' will
+                be kept for both baselines (1,2) and (2,3) to return a valid
+                pyuvdata object.
+                An ant_str cannot be passed in addition to any of the above antenna
+                args or the polarizations arg.
+            frequencies: The frequencies to include when reading data into the
+                object.
+            freq_chans: The frequency channel numbers to include when reading
+                data into the object.
+            times: The times to include when reading data into the object.
+            polarizations: The polarizations to include when reading data into
+                the object.
+            blt_inds: The baseline-time indices to include when reading data into
+                the object. This is not commonly used.
+            read_data: Read in the visibility, flag and nsample data. If set to
+                False, only the header (which contains all the metadata) is read
+                and the select arguments are ignored. Results in an incompletely
+                defined object (check will not pass). Default True.
+            lazy_data: Do not read the visibility, flag and nsample data until
+                they are accessed. The data_array, flag_array and nsample_array
+                attributes are read in (applying any selection) on first access,
+                get_data, get_flags and get_nsamples only read the requested
+                portions from disk. The file must not be modified or removed
+                until the data are read. Default False.
+            data_array_dtype: Datatype for the data_array, either np.complex64
+                or np.complex128. Visibilities stored as scaled integers are
+                converted using the scale factor recorded in the file. None
+                keeps complex visibilities as stored and converts scaled
+                integers to complex64. 'raw' keeps the visibilities as stored,
+                so scaled integers are left as the compound integer array
+                (fields 'r' and 'i', without the scale factor applied) and the
+                object will not pass check (run_check is ignored). If
+                np.complex64 or np.complex128 is given (and lazy_data is
+                False), the nsample_array gets the matching real precision.
+                Default None.
             run_check: Option to check for the existence and proper shapes of
-                parameters before writing the file. Default is True.
+                parameters after reading in the file. Default is True.
+                Ignored if read_data is False.
             check_extra: Option to check optional parameters as well as required
-                ones. Default is True.
+                ones. Default is True. Ignored if read_data is False.
             run_check_acceptability: Option to check acceptable range of the values of
-                parameters before writing the file. Default is True.
-            clobber: Option to overwrite the file if it already exists. Default is False.
+                parameters after reading in the file. Default is True.
+                Ignored if read_data is False.
+            pack_flags: Option to store the flag_array as packed bits (see
+                UVData.pack_flags). Flags that are packed in the file are
+                read without unpacking them. Default False.
 
         Returns:
             None
         """
         import h5py
-        if run_check:
-            self.check(check_extra=check_extra,
-                       run_check_acceptability=run_check_acceptability)
+        if not os.path.exists(filename):
+            raise(IOError, filename + ' not found')
 
-        if os.path.exists(filename):
-            if clobber:
-                print "File exists; clobbering"
-            else:
-                raise ValueError("File exists; skipping")
+        if not (data_array_dtype is None
+                or (isinstance(data_array_dtype, str) and data_array_dtype == 'raw')
+                or np.dtype(data_array_dtype) in [np.dtype(np.complex64),
+                                                  np.dtype(np.complex128)]):
+            raise ValueError('data_array_dtype must be None, np.complex64, '
+                             'np.complex128 or "raw"')
 
-        f = h5py.File(filename, 'w')
-        header = f.create_group("Header")
+        # open hdf5 file for reading
+        with h5py.File(filename, 'r') as f:
+            # extract header information
+            header = f['/Header']
+            self._read_header(header)
+
+            if not read_data:
+                # don't read in the data. This means the object is incomplete,
+                # but that may not matter for many purposes.
+                return
+
+            # read data, flags and nsamples
+            dgrp = f['/Data']
+            self._get_data(dgrp, antenna_nums, antenna_names, ant_str,
+                           ant_pairs_nums, frequencies, freq_chans, times,
+                           polarizations, blt_inds, lazy_data, data_array_dtype,
+                           pack_flags, run_check, check_extra, run_check_acceptability)
 
+        return
+
+    def _write_header(self, header):
+        """
+        Internal function to write header information to a UVH5 file.
+
+        Args:
+            header: reference to an h5py data group to write the header information to.
+
+        Returns:
+            None
+        """
         # write out telescope and source information
         header['latitude'] = self.telescope_location_lat_lon_alt[0]
         header['longitude'] = self.telescope_location_lat_lon_alt[1]
@@ -252,6 +805,8 @@ class UVH5(UVData):
             header['timesys'] = self.timesys
         if self.x_orientation is not None:
             header['x_orientation'] = self.x_orientation
+        if self.blt_order is not None:
+            header['blt_order'] = self.blt_order
         if self.antenna_diameters is not None:
             header['antenna_diameters'] = self.antenna_diameters
         if self.uvplane_reference_time is not None:
@@ -266,15 +821,307 @@ class UVH5(UVData):
         # write out history
         header['history'] = self.history
 
-        # write out data and flags
-        # TODO: add filter options for visdata (bitshuffle), flags, and
-        #     nsample_array (lzf compression)
+    def _get_dataset_kwargs(self, chunks, data_compression, flags_compression,
+                            nsample_compression):
+        """
+        Internal function to get the h5py create_dataset arguments for the
+        visdata, flags and nsample_array datasets.
+
+        Args:
+            chunks: Chunk shape option, see write_uvh5.
+            data_compression: Compression option for visdata, see write_uvh5.
+            flags_compression: Compression option for flags, see write_uvh5.
+            nsample_compression: Compression option for nsample_array, see write_uvh5.
+
+        Returns:
+            dict keyed on dataset name of dicts of create_dataset arguments.
+        """
+        data_shape = (self.Nblts, self.Nspws, self.Nfreqs, self.Npols)
+        chunks = _get_chunks(chunks, data_shape)
+        dset_kwargs = {}
+        for dset_name, compression in [('visdata', data_compression),
+                                       ('flags', flags_compression),
+                                       ('nsample_array', nsample_compression)]:
+            compression, compression_opts = _get_compression(compression)
+            if chunks is None and compression is not None:
+                raise ValueError('chunks cannot be None if any compression is used')
+            dset_kwargs[dset_name] = {'chunks': chunks, 'compression': compression,
+                                      'compression_opts': compression_opts}
+        return dset_kwargs
+
+    def write_uvh5(self, filename, run_check=True, check_extra=True,
+                   run_check_acceptability=True, clobber=False, chunks=True,
+                   data_compression=None, flags_compression=None,
+                   nsample_compression=None, data_write_dtype=None, data_scale=None,
+                   pack_flags=False):
+        """
+        Write a UVData object to a UVH5 file.
+
+        Args:
+            filename: The UVH5 file to write to.
+            run_check: Option to check for the existence and proper shapes of
+                parameters before writing the file. Default is True.
+            check_extra: Option to check optional parameters as well as required
+                ones. Default is True.
+            run_check_acceptability: Option to check acceptable range of the values of
+                parameters before writing the file. Default is True.
+            clobber: Option to overwrite the file if it already exists. Default is False.
+            chunks: Chunk shape of the visdata, flags and nsample_array datasets.
+                True lets h5py pick the chunk shape, None writes contiguous
+                (unchunked) datasets, which cannot be compressed. Otherwise a
+                tuple of the chunk length along each axis (Nblts, Nspws, Nfreqs, Npols),
+                elements that are None use the full axis. For example
+                (1, 1, None, 1) makes one chunk per baseline-time and polarization
+                (fast baseline access) while (None, 1, 8, 1) makes chunks of
+                8 channels (fast frequency access). Default is True.
+            data_compression: Compression filter for the visdata dataset. Either
+                None (no compression), the name of a filter included with h5py
+                ('gzip', 'lzf', 'szip'), the integer id of a filter loaded as an
+                HDF5 plugin (e.g. 32008 for bitshuffle) or a tuple of the filter
+                and its options (e.g. ('gzip', 9)). Default is None.
+            flags_compression: Compression filter for the flags dataset, same
+                options as data_compression. Default is None.
+            nsample_compression: Compression filter for the nsample_array
+                dataset, same options as data_compression. Default is None.
+            data_write_dtype: Datatype of the visdata dataset. Either None
+                (complex64), np.complex64, np.complex128, or np.int16 or np.int32
+                to store the visibilities as a compound pair of scaled integers
+                (fields 'r' and 'i') with the scale factor recorded in the
+                'scale_factor' attribute of the dataset. Default None.
+            data_scale: Scale factor for visibilities stored as scaled integers,
+                the stored integers are the visibilities divided by data_scale,
+                rounded (and clipped to the integer range). None picks the scale
+                factor that uses the full integer range for the data.
+                Ignored for complex data_write_dtypes. Default None.
+            pack_flags: Option to store the flags as packed bits, 8 flags per
+                byte (see UVData.pack_flags). The flags dataset then has one row
+                of packed bytes per baseline-time, with the unpacked shape in
+                its 'packed_shape' attribute. Files with packed flags cannot be
+                written to with write_uvh5_part. Default False.
+
+        Returns:
+            None
+        """
+        import h5py
+        if run_check:
+            self.check(check_extra=check_extra,
+                       run_check_acceptability=run_check_acceptability)
+
+        if os.path.exists(filename):
+            if clobber:
+                print "File exists; clobbering"
+            else:
+                raise ValueError("File exists; skipping")
+
+        # validate the dataset options before creating the file
+        dset_kwargs = self._get_dataset_kwargs(chunks, data_compression,
+                                               flags_compression, nsample_compression)
+        vis_dtype = _get_vis_write_dtype(data_write_dtype)
+        scale = _get_vis_scale(self.data_array, vis_dtype, data_scale)
+
+        f = h5py.File(filename, 'w')
+        header = f.create_group("Header")
+        self._write_header(header)
+
+        # write out data, flags and nsamples
         dgrp = f.create_group("Data")
-        visdata = dgrp.create_dataset("visdata", chunks=True,
-                                      data=self.data_array.astype(np.complex64))
-        flags = dgrp.create_dataset("flags", chunks=True,
-                                    data=self.flag_array)
-        nsample_array = dgrp.create_dataset("nsample_array", chunks=True,
-                                            data=self.nsample_array.astype(np.float32))
+        visdata = dgrp.create_dataset("visdata",
+                                      data=_vis_to_disk(self.data_array, vis_dtype, scale),
+                                      **dset_kwargs['visdata'])
+        if scale is not None:
+            visdata.attrs['scale_factor'] = scale
+        if pack_flags:
+            if isinstance(self.flag_array, uvutils._PackedFlags):
+                packed = self.flag_array.packed
+            else:
+                packed = uvutils._PackedFlags(self.flag_array).packed
+            flags_kwargs = dict(dset_kwargs['flags'])
+            if isinstance(flags_kwargs['chunks'], tuple):
+                flags_kwargs['chunks'] = (flags_kwargs['chunks'][0], packed.shape[1])
+            flags = dgrp.create_dataset("flags", data=packed, **flags_kwargs)
+            flags.attrs['packed_shape'] = self.flag_array.shape
+        else:
+            flags = dgrp.create_dataset("flags", data=self.flag_array,
+                                        **dset_kwargs['flags'])
+        nsample_array = dgrp.create_dataset("nsample_array",
+                                            data=self.nsample_array.astype(np.float32),
+                                            **dset_kwargs['nsample_array'])
+        f.close()
+
+        return
+
+    def _check_header(self, filename):
+        """
+        Internal function to check that the metadata in a UVH5 file matches
+        the metadata on the object.
+
+        Args:
+            filename: The UVH5 file to check.
+
+        Returns:
+            None
+        """
+        uvh5_file = UVH5()
+        uvh5_file.read_uvh5(filename, read_data=False)
+        for p in self:
+            if p in ['_data_array', '_flag_array', '_nsample_array', '_history']:
+                continue
+            if getattr(self, p) != getattr(uvh5_file, p):
+                raise ValueError('The metadata on the object does not match the '
+                                 'metadata in the file ({param} is different).'
+                                 .format(param=p[1:]))
+
+    def initialize_uvh5_file(self, filename, clobber=False, chunks=True,
+                             data_compression=None, flags_compression=None,
+                             nsample_compression=None, data_write_dtype=None,
+                             data_scale=None):
+        """
+        Create a UVH5 file with the full header and empty visdata, flags and
+        nsample_array datasets, to be filled in later with write_uvh5_part.
+
+        Only the metadata on the object are used, the data, flag and nsample
+        arrays do not need to be set. All the datasets are initialized to zero
+        (so the flags are initialized to False).
+
+        Args:
+            filename: The UVH5 file to create.
+            clobber: Option to overwrite the file if it already exists. Default is False.
+            chunks: Chunk shape of the visdata, flags and nsample_array datasets,
+                see write_uvh5. Chunk shapes that match the blocks written with
+                write_uvh5_part make the partial writes faster. Default is True.
+            data_compression: Compression filter for the visdata dataset, see
+                write_uvh5. Default is None.
+            flags_compression: Compression filter for the flags dataset, see
+                write_uvh5. Default is None.
+            nsample_compression: Compression filter for the nsample_array
+                dataset, see write_uvh5. Default is None.
+            data_write_dtype: Datatype of the visdata dataset, see write_uvh5.
+                Default None.
+            data_scale: Scale factor for visibilities stored as scaled integers,
+                see write_uvh5. If None, the data_array on the object is used
+                to pick the scale factor if it is set, otherwise it is 1.
+                Default None.
+
+        Returns:
+            None
+        """
+        import h5py
+
+        if os.path.exists(filename):
+            if clobber:
+                print "File exists; clobbering"
+            else:
+                raise ValueError("File exists; skipping")
+
+        # validate the dataset options before creating the file
+        dset_kwargs = self._get_dataset_kwargs(chunks, data_compression,
+                                               flags_compression, nsample_compression)
+
+        vis_dtype = _get_vis_write_dtype(data_write_dtype)
+        scale = _get_vis_scale(self.data_array, vis_dtype, data_scale)
+
+        with h5py.File(filename, 'w') as f:
+            header = f.create_group("Header")
+            self._write_header(header)
+
+            # create empty data, flags and nsamples datasets
+            data_shape = (self.Nblts, self.Nspws, self.Nfreqs, self.Npols)
+            dgrp = f.create_group("Data")
+            visdata = dgrp.create_dataset("visdata", data_shape, dtype=vis_dtype,
+                                          **dset_kwargs['visdata'])
+            if scale is not None:
+                visdata.attrs['scale_factor'] = scale
+            dgrp.create_dataset("flags", data_shape, dtype=np.bool_,
+                                **dset_kwargs['flags'])
+            dgrp.create_dataset("nsample_array", data_shape, dtype=np.float32,
+                                **dset_kwargs['nsample_array'])
+
+        return
+
+    def write_uvh5_part(self, filename, data_array, flag_array, nsample_array,
+                        check_header=True, antenna_nums=None, antenna_names=None,
+                        ant_str=None, ant_pairs_nums=None, frequencies=None,
+                        freq_chans=None, times=None, polarizations=None,
+                        blt_inds=None):
+        """
+        Write a block of data, flags and nsamples into a UVH5 file created with
+        initialize_uvh5_file. The object must have the metadata for the full
+        file. The part of the file to write to is specified with the same
+        arguments as select, the data, flag and nsample arrays must have the
+        shape of the selected part of the file, with the axes ordered as in
+        the file.
+
+        The visibilities are converted to the datatype of the visdata dataset
+        in the file (using the scale factor recorded in the file for scaled integers).
+
+        Writing different parts of one file from independent processes is
+        possible, but the writes must not happen at the same time because
+        HDF5 does not support concurrent writers.
+
+        Args:
+            filename: The UVH5 file to write to.
+            data_array: The visibility data to write, shape
+                (Nblts_part, Nspws, Nfreqs_part, Npols_part).
+            flag_array: The flags to write, same shape as data_array.
+            nsample_array: The nsamples to write, same shape as data_array.
+            check_header: Option to check that the metadata on the object match
+                the metadata in the file. Default is True.
+            antenna_nums: The antennas numbers to write data for. This cannot
+                be provided if antenna_names is also provided.
+            antenna_names: The antennas names to write data for. This cannot
+                be provided if antenna_nums is also provided.
+            ant_pairs_nums: A list of antenna number tuples (e.g. [(0,1), (3,2)])
+                specifying baselines to write data for. Ordering of the numbers
+                within the tuple does not matter.
+            ant_str: A string containing information about what antenna numbers
+                and polarizations to write data for. See select for details.
+                An ant_str cannot be passed in addition to any of the above antenna
+                args or the polarizations arg.
+            frequencies: The frequencies to write data for.
+            freq_chans: The frequency channel numbers to write data for.
+            times: The times to write data for.
+            polarizations: The polarizations to write data for.
+            blt_inds: The baseline-time indices to write data for.
+
+        Returns:
+            None
+        """
+        import h5py
+
+        if not os.path.exists(filename):
+            raise IOError(filename + ' not found, create it with initialize_uvh5_file')
+
+        if check_header:
+            self._check_header(filename)
+
+        # figure out which part of the file to write to
+        blt_inds, freq_inds, pol_inds, history_update_string = \
+            self._select_preprocess(antenna_nums, antenna_names, ant_str, ant_pairs_nums,
+                                    frequencies, freq_chans, times, polarizations, blt_inds)
+
+        part_shape = (self.Nblts if blt_inds is None else len(blt_inds), self.Nspws,
+                      self.Nfreqs if freq_inds is None else len(freq_inds),
+                      self.Npols if pol_inds is None else len(pol_inds))
+        for name, array in [('data_array', data_array), ('flag_array', flag_array),
+                            ('nsample_array', nsample_array)]:
+            if np.shape(array) != part_shape:
+                raise ValueError('{name} has shape {shape}, the selected part of the '
+                                 'file has shape {part_shape}.'
+                                 .format(name=name, shape=np.shape(array),
+                                         part_shape=part_shape))
+
+        inds = [blt_inds, None, freq_inds, pol_inds]
+        with h5py.File(filename, 'r+') as f:
+            dgrp = f['/Data']
+            if 'packed_shape' in dgrp['flags'].attrs:
+                raise ValueError('write_uvh5_part cannot write to files with packed flags.')
+            visdata = dgrp['visdata']
+            scale = visdata.attrs.get('scale_factor', 1.)
+            _write_dataset_selection(visdata, inds,
+                                     _vis_to_disk(np.asarray(data_array), visdata.dtype, scale))
+            _write_dataset_selection(dgrp['flags'], inds,
+                                     np.asarray(flag_array).astype(np.bool_))
+            _write_dataset_selection(dgrp['nsample_array'], inds,
+                                     np.asarray(nsample_array).astype(np.float32))
 
         return
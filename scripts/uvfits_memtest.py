@@ -3,6 +3,7 @@
 
 from __future__ import print_function, division, absolute_import
 
+import os
 from memory_profiler import profile
 import numpy as np
 from astropy import constants as const
@@ -80,5 +81,26 @@ def read_uvfits():
     return
 
 
+@profile
+def write_uvfits():
+    filename = '/Volumes/Data1/mwa_uvfits/1066571272.uvfits'
+    write_file = '/Volumes/Data1/mwa_uvfits/1066571272_memtest.uvfits'
+
+    uv_obj = UVData()
+    uv_obj.read_uvfits(filename)
+
+    # the groups are written in chunks, so writing should not need much
+    # more memory than the object uses
+    uv_obj.write_uvfits(write_file)
+    del(uv_obj)
+
+    os.remove(write_file)
+    del(filename)
+    del(write_file)
+
+    return
+
+
 if __name__ == '__main__':
     read_uvfits()
+    write_uvfits()